@@ -41,7 +41,7 @@ def fundamentals_command(
     f = asyncio.run(asyncio.to_thread(svc.get_fundamentals, symbol))
 
     if json_output:
-        print_json(f.model_dump())
+        print_json(f)
         return
 
     table = Table(show_header=False, box=None, padding=(0, 2))
@@ -36,7 +36,7 @@ def price_command(
     quotes = svc.get_current_price(symbols)
 
     if json_output:
-        print_json([q.model_dump() for q in quotes])
+        print_json(quotes)
         return
 
     table = Table(show_header=True, header_style="bold")
@@ -57,7 +57,7 @@ def quote_command(
     quotes = svc.get_current_price(symbols)
 
     if json_output:
-        print_json([q.model_dump() for q in quotes])
+        print_json(quotes)
         return
 
     table = Table(show_header=True, header_style="bold")
@@ -88,7 +88,7 @@ def history_command(
     candles = svc.get_price_history(symbol, interval, span, bounds)
 
     if json_output:
-        print_json([c.model_dump() for c in candles])
+        print_json(candles)
         return
 
     table = Table(show_header=True, header_style="bold", title=f"{symbol} Price History")
@@ -19,7 +19,7 @@ def news_command(
     news = asyncio.run(asyncio.to_thread(svc.get_news, symbol))
 
     if json_output:
-        print_json([n.model_dump() for n in news])
+        print_json(news)
         return
 
     if not news:
@@ -26,15 +26,18 @@ def options_chain_command(
     expiry: Annotated[Optional[str], typer.Option("--expiry", help="Expiration date YYYY-MM-DD")] = None,
     option_type: Annotated[Optional[str], typer.Option("--type", help="call or put")] = None,
     strike: Annotated[Optional[str], typer.Option("--strike", help="Strike price for full Greeks lookup")] = None,
+    all_strikes: Annotated[bool, typer.Option("--all-strikes", help="List every strike, not just those near the money")] = False,
     json_output: Annotated[bool, typer.Option("--json", help="Output raw JSON")] = False,
 ) -> None:
     """Options chain (add --strike for full Greeks and bid/ask)."""
     client = get_client()
     svc = OptionsService(client)
-    contracts = svc.get_options_chain(symbol, expiry, option_type, strike)
+    contracts = svc.get_options_chain(
+        symbol, expiry, option_type, strike, near_the_money=not all_strikes
+    )
 
     if json_output:
-        print_json([c.model_dump() for c in contracts])
+        print_json(contracts)
         return
 
     if not contracts:
@@ -75,7 +78,7 @@ def options_positions_command(
     positions = svc.get_option_positions()
 
     if json_output:
-        print_json([p.model_dump() for p in positions])
+        print_json(positions)
         return
 
     if not positions:
@@ -21,7 +21,7 @@ def orders_command(
     history = asyncio.run(asyncio.to_thread(svc.get_order_history, order_type, symbol, since))
 
     if json_output:
-        print_json(history.model_dump())
+        print_json(history)
         return
 
     if history.stock_orders:
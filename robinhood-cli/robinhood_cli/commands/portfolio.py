@@ -37,7 +37,7 @@ def portfolio_command(
     summary = svc.get_portfolio_summary()
 
     if json_output:
-        print_json(summary.model_dump())
+        print_json(summary)
         return
 
     day_change_str = format_change(summary.day_change)
@@ -62,7 +62,7 @@ def positions_command(
     positions = svc.get_positions(symbols)
 
     if json_output:
-        print_json([p.model_dump() for p in positions])
+        print_json(positions)
         return
 
     if not positions:
@@ -21,7 +21,7 @@ def watchlists_command(
     watchlists = svc.get_watchlists()
 
     if json_output:
-        print_json([w.model_dump() for w in watchlists])
+        print_json(watchlists)
         return
 
     if not watchlists:
@@ -1,6 +1,6 @@
-import json
 from typing import Any, Optional
 
+from pydantic_core import to_json
 from rich.console import Console
 from rich.style import Style
 from rich.text import Text
@@ -48,8 +48,12 @@ def styled_change(value: Optional[float], formatted: str) -> Text:
 
 
 def print_json(data: Any) -> None:
-    """Print data as pretty JSON."""
-    console.print_json(json.dumps(data))
+    """Print data as pretty JSON.
+
+    Accepts plain data as well as pydantic models (or lists of them), which
+    are encoded directly by pydantic-core without a ``model_dump()`` pass.
+    """
+    console.print_json(to_json(data).decode())
 
 
 def error(message: str) -> None:
@@ -32,3 +32,16 @@ def test_format_percent_positive():
 def test_format_percent_negative():
     result = format_percent(-1.27)
     assert "-1.27%" in result
+
+
+def test_print_json_accepts_models(capsys):
+    from robinhood_core.models import Quote
+    from robinhood_cli.output import print_json
+
+    print_json(
+        [Quote(symbol="AAPL", last_price="150.5", timestamp="2026-02-11T10:00:00Z")]
+    )
+
+    data = json.loads(capsys.readouterr().out)
+    assert data[0]["symbol"] == "AAPL"
+    assert data[0]["last_price"] == 150.5
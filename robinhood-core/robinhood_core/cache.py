@@ -0,0 +1,176 @@
+# robinhood_core/cache.py
+"""Small in-process TTL cache for read-only service calls."""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Every cache created by ttl_cache(), so invalidate() can reach them all.
+_CACHES: List["_TTLCache"] = []
+
+
+def _freeze(value: Any) -> Any:
+    """Make list arguments (e.g. symbol lists) usable in a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _make_key(args: tuple, kwargs: dict) -> Tuple:
+    return _freeze(args), _freeze(sorted(kwargs.items()))
+
+
+def _mentions(value: Any, symbol: str) -> bool:
+    if isinstance(value, tuple):
+        return any(_mentions(v, symbol) for v in value)
+    return isinstance(value, str) and value.upper() == symbol
+
+
+class _TTLCache:
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+
+    def _lookup(self, key: Tuple) -> Tuple[bool, Any]:
+        # Caller holds self._lock.
+        entry = self._data.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return False, None
+        self._data.move_to_end(key)
+        return True, entry[1]
+
+    def get(self, key: Tuple) -> Tuple[bool, Any]:
+        with self._lock:
+            return self._lookup(key)
+
+    def load(self, key: Tuple, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``fetch`` on a miss.
+
+        Concurrent misses on the same key share one ``fetch`` call: the
+        first caller runs it and the rest wait for its result (or error).
+        """
+        with self._lock:
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            value = fetch()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def set(self, key: Tuple, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, symbol: Optional[str]) -> None:
+        with self._lock:
+            if symbol is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if _mentions(k, symbol)]:
+                del self._data[key]
+
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 4096) -> Callable:
+    """Cache a function's return value for ``ttl_seconds``.
+
+    The key is the call's arguments (including ``self`` for methods, so
+    each service instance has its own entries); least recently used entries
+    are evicted beyond ``maxsize``. Concurrent calls with the same arguments
+    share one underlying call. Exceptions are not cached. List results are
+    returned as fresh lists, but the items are shared between hits.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = _TTLCache(ttl_seconds, maxsize)
+        _CACHES.append(cache)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            value = cache.load(
+                _make_key(args, kwargs), functools.partial(func, *args, **kwargs)
+            )
+            return list(value) if isinstance(value, list) else value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def _cache_for(method: Callable, args: tuple) -> Tuple[Optional[_TTLCache], tuple]:
+    """The ``ttl_cache`` behind ``method``, and ``args`` as it keys them."""
+    cache = getattr(getattr(method, "__func__", method), "cache", None)
+    if not isinstance(cache, _TTLCache):
+        return None, args
+    owner = getattr(method, "__self__", None)
+    if owner is not None:
+        args = (owner,) + args
+    return cache, args
+
+
+def peek(method: Callable, *args, **kwargs) -> Tuple[bool, Any]:
+    """Look up a ``ttl_cache``'d call without making it.
+
+    ``method`` may be a decorated function or a bound method of one. Returns
+    ``(hit, value)``; anything that is not cached reports a miss.
+    """
+    cache, args = _cache_for(method, args)
+    if cache is None:
+        return False, None
+    hit, value = cache.get(_make_key(args, kwargs))
+    if hit and isinstance(value, list):
+        value = list(value)
+    return hit, value
+
+
+def prime(
+    method: Callable, value: Any, *args, ttl: Optional[float] = None, **kwargs
+) -> bool:
+    """Store ``value`` as the result of ``method(*args, **kwargs)``.
+
+    The counterpart of ``peek``, for seeding entries from data fetched some
+    other way. The entry lives for ``ttl`` seconds, defaulting to the
+    cache's own TTL. Returns False when ``method`` is not cached.
+    """
+    cache, args = _cache_for(method, args)
+    if cache is None:
+        return False
+    cache.set(_make_key(args, kwargs), value, ttl)
+    return True
+
+
+def invalidate(symbol: Optional[str] = None) -> None:
+    """Drop cached entries for ``symbol``, or every entry when omitted."""
+    normalized = symbol.strip().upper() if symbol else None
+    for cache in _CACHES:
+        cache.invalidate(normalized)
@@ -1,9 +1,17 @@
 # robin_stocks_mcp/robinhood/client.py
+import functools
+import hashlib
 import logging
 import os
+import re
+import threading
+import time
 from typing import Optional
 from pathlib import Path
 import robin_stocks.robinhood as rh
+from requests.adapters import HTTPAdapter
+from robin_stocks.robinhood.globals import SESSION as _RH_SESSION
+from urllib3.util.retry import Retry
 from robinhood_core.errors import AuthRequiredError, NetworkError
 
 logger = logging.getLogger(__name__)
@@ -13,6 +21,58 @@ logger = logging.getLogger(__name__)
 # With pickle_path: {pickle_path}/robinhood.pickle
 # With pickle_name: {pickle_path}/robinhood{pickle_name}.pickle
 _PICKLE_FILENAME = "robinhood.pickle"
+_DEFAULT_PICKLE_DIR = Path.home() / ".tokens"
+
+# How long a pickle that this process already validated via ``rh.login()`` is
+# trusted without another round trip. robin_stocks keeps the logged-in state
+# in module globals, so any client in the process can reuse it.
+_SESSION_REUSE_TTL = 300
+
+# robin_stocks has no dedicated exception for verification challenges; it
+# raises a plain Exception whose message mentions the challenge.
+_CHALLENGE_RE = re.compile(r"challenge", re.IGNORECASE)
+
+# robin_stocks sends every request through one module-level requests.Session.
+# Its default adapter keeps at most 10 idle connections per host, fewer than
+# the threads that can call it at once, so extra connections were closed after
+# each burst and re-handshaken on the next.
+_HTTP_POOL_CONNECTIONS = 8
+
+# Threads in robinhood_core's own executors that can each hold a connection:
+# instrument and option lookups (8 each), quotes, watchlists and news (4 each),
+# profile and order history (2 each).
+_LIBRARY_HTTP_THREADS = 32
+
+
+def _http_pool_maxsize() -> int:
+    """One keep-alive connection per thread that can be calling robin_stocks.
+
+    That is the MCP server's ``RH_MAX_WORKERS`` I/O pool (default 16) plus
+    the library's own executors.
+    """
+    return int(os.getenv("RH_MAX_WORKERS", "16")) + _LIBRARY_HTTP_THREADS
+
+
+@functools.lru_cache(maxsize=None)
+def _configure_http_session() -> None:
+    """Mount a larger keep-alive pool on robin_stocks' session, once.
+
+    Idempotent requests are retried twice on transient gateway errors; the
+    final response is still handed back to robin_stocks for its own handling.
+    """
+    retry = Retry(
+        total=2,
+        backoff_factor=0.1,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=_http_pool_maxsize(),
+        max_retries=retry,
+    )
+    _RH_SESSION.mount("https://", adapter)
+    _RH_SESSION.headers["Connection"] = "keep-alive"
 
 
 class RobinhoodClient:
@@ -26,6 +86,21 @@ class RobinhoodClient:
     Args take priority over environment variables.
     """
 
+    __slots__ = (
+        "_authenticated",
+        "_username",
+        "_password",
+        "_session_path",
+        "_allow_mfa",
+        "_pickle_file",
+    )
+
+    # (pickle path, username, password digest) -> time.time() of the last
+    # successful ``rh.login()`` in this process with those credentials.
+    # Shared across instances; see ``_SESSION_REUSE_TTL``.
+    _last_validated_at: dict = {}
+    _login_lock = threading.Lock()
+
     def __init__(
         self,
         username: Optional[str] = None,
@@ -42,6 +117,10 @@ class RobinhoodClient:
             if allow_mfa is not None
             else os.getenv("RH_ALLOW_MFA", "0") == "1"
         )
+        self._pickle_file = (
+            Path(self._session_path or _DEFAULT_PICKLE_DIR) / _PICKLE_FILENAME
+        )
+        _configure_http_session()
 
     def ensure_session(self, mfa_code: Optional[str] = None) -> "RobinhoodClient":
         """Ensure we have a valid session, authenticating if needed.
@@ -58,6 +137,23 @@ class RobinhoodClient:
             logger.debug("Session already active, skipping login")
             return self
 
+        # robin_stocks keeps its session in module globals and rh.login() is
+        # not reentrant, so only one thread logs in at a time. The check above
+        # stays lock-free; re-check once the lock is held in case another
+        # thread finished logging in while we waited.
+        with RobinhoodClient._login_lock:
+            if self._authenticated:
+                return self
+            return self._login(mfa_code)
+
+    def _login(self, mfa_code: Optional[str]) -> "RobinhoodClient":
+        if self._recently_validated():
+            logger.debug(
+                "Reusing session validated within the last %ss", _SESSION_REUSE_TTL
+            )
+            self._authenticated = True
+            return self
+
         if not self._username or not self._password:
             # When no credentials are provided, try to restore from a saved pickle.
             # robin_stocks will use the stored token if still valid.
@@ -70,7 +166,7 @@ class RobinhoodClient:
                         store_session=True,
                     )
                     if login_result:
-                        self._authenticated = True
+                        self._mark_validated()
                         logger.info("Restored session from saved pickle")
                         return self
                 except Exception as e:
@@ -104,7 +200,7 @@ class RobinhoodClient:
             login_result = rh.login(**login_kwargs)
 
             if login_result:
-                self._authenticated = True
+                self._mark_validated()
                 logger.info("Authentication successful for user %s", self._username)
                 return self
             else:
@@ -116,7 +212,8 @@ class RobinhoodClient:
         except AuthRequiredError:
             raise
         except Exception as e:
-            if "challenge" in str(e).lower():
+            message = e.args[0] if e.args and isinstance(e.args[0], str) else str(e)
+            if _CHALLENGE_RE.search(message):
                 logger.warning("Authentication challenge required for user %s", self._username)
                 raise AuthRequiredError(
                     "Authentication challenge required. Please refresh your "
@@ -126,6 +223,35 @@ class RobinhoodClient:
             logger.warning("Authentication error: %s", e)
             raise NetworkError(f"Failed to authenticate: {e}")
 
+    def _validation_key(self) -> tuple:
+        # Only a client with the same credentials may reuse a login, so a
+        # client with wrong credentials on a shared pickle still hits rh.login.
+        digest = (
+            hashlib.sha256(self._password.encode()).hexdigest()
+            if self._password
+            else None
+        )
+        return self._pickle_file, self._username, digest
+
+    def _mark_validated(self) -> None:
+        self._authenticated = True
+        RobinhoodClient._last_validated_at[self._validation_key()] = time.time()
+
+    def _recently_validated(self) -> bool:
+        """True if these credentials logged in on this pickle moments ago."""
+        pickle_file = self._pickle_file
+        validated_at = RobinhoodClient._last_validated_at.get(self._validation_key())
+        if validated_at is None:
+            return False
+        if time.time() - validated_at >= _SESSION_REUSE_TTL:
+            return False
+        # The pickle must still be there and must not have been rewritten
+        # (e.g. by another process logging in) since we validated it.
+        try:
+            return pickle_file.stat().st_mtime <= validated_at
+        except OSError:
+            return False
+
     def logout(self):
         """Clear session and remove cached pickle file."""
         logger.debug("Logging out and clearing session")
@@ -134,11 +260,38 @@ class RobinhoodClient:
         except Exception:
             pass
         self._authenticated = False
+        # rh.logout() ends the session for every login on this pickle.
+        for key in [
+            k for k in RobinhoodClient._last_validated_at if k[0] == self._pickle_file
+        ]:
+            del RobinhoodClient._last_validated_at[key]
         # robin_stocks.logout() only clears in-memory state.
         # Also remove the persisted pickle file so next start is clean.
         if self._session_path:
             try:
-                pickle_file = Path(self._session_path) / _PICKLE_FILENAME
-                pickle_file.unlink(missing_ok=True)
+                self._pickle_file.unlink(missing_ok=True)
             except Exception:
                 pass
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_client(
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    session_path: Optional[str] = None,
+    allow_mfa: Optional[bool] = None,
+) -> RobinhoodClient:
+    """Return a process-wide ``RobinhoodClient`` for the given arguments.
+
+    Repeated calls with the same arguments reuse one instance, so callers that
+    would otherwise build a client per request keep its authenticated state and
+    skip straight through ``ensure_session``. Environment variables are still
+    resolved when the instance is first created.
+    """
+    return RobinhoodClient(
+        username=username,
+        password=password,
+        session_path=session_path,
+        allow_mfa=allow_mfa,
+    )
+
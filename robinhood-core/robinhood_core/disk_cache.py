@@ -0,0 +1,137 @@
+# robinhood_core/disk_cache.py
+"""SQLite-backed cache for slow-changing public data, kept across restarts."""
+
+import functools
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, get_type_hints
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+logger = logging.getLogger(__name__)
+
+# Override with RH_CACHE_DIR; set RH_DISK_CACHE=0 to turn the cache off.
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "robinhood-core"
+_CACHE_FILENAME = "cache.db"
+
+
+class FileCache:
+    """Key/value store in a single SQLite file with per-entry expiry.
+
+    One connection is shared by all threads (guarded by a lock) so callers
+    don't pay to open the database per lookup. Errors are logged and treated
+    as misses; the cache must never break the call it wraps.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, expiry REAL, blob BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT expiry, blob FROM cache WHERE key = ?", (key,))
+                    .fetchone()
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Disk cache read failed: %s", e)
+            return None
+        if row is None or row[0] <= time.time():
+            return None
+        return row[1]
+
+    def set(self, key: str, blob: bytes, ttl_seconds: float) -> None:
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, expiry, blob) VALUES (?, ?, ?)",
+                    (key, time.time() + ttl_seconds, blob),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Disk cache write failed: %s", e)
+
+
+_caches: Dict[Path, FileCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _get_cache() -> Optional[FileCache]:
+    if os.getenv("RH_DISK_CACHE", "1") == "0":
+        return None
+    directory = os.getenv("RH_CACHE_DIR")
+    path = Path(directory) if directory else _DEFAULT_CACHE_DIR
+    path = path / _CACHE_FILENAME
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = FileCache(path)
+        return cache
+
+
+def disk_cached(ttl_seconds: float) -> Callable:
+    """Persist a function's or service method's result on disk for ``ttl_seconds``.
+
+    Only for public market data: the key is the function name and its
+    arguments, *not* a method's ``self``, so entries are shared across
+    accounts and processes. The return annotation is used to decode cached
+    values. Exceptions are not cached.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        adapter: Optional[TypeAdapter] = None
+        skip = 1 if next(iter(inspect.signature(func).parameters), "") == "self" else 0
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal adapter
+            cache = _get_cache()
+            if cache is None:
+                return func(*args, **kwargs)
+
+            if adapter is None:
+                adapter = TypeAdapter(get_type_hints(func)["return"])
+            key = func.__qualname__ + to_json([args[skip:], kwargs]).decode()
+            try:
+                blob = cache.get(key)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug("Disk cache read failed: %s", e)
+                blob = None
+            if blob is not None:
+                try:
+                    return adapter.validate_json(blob)
+                except ValueError:
+                    logger.debug("Discarding undecodable disk cache entry %s", key)
+
+            value = func(*args, **kwargs)
+            try:
+                cache.set(key, adapter.dump_json(value), ttl_seconds)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug("Disk cache write failed: %s", e)
+            return value
+
+        return wrapper
+
+    return decorator
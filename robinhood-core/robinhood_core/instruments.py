@@ -0,0 +1,54 @@
+# robinhood_core/instruments.py
+"""Shared, cached resolution of stock instrument URLs to ticker symbols."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+
+import robin_stocks.robinhood as rh
+
+from robinhood_core.cache import ttl_cache
+from robinhood_core.disk_cache import disk_cached
+from robinhood_core.errors import RobinhoodAPIError
+
+logger = logging.getLogger(__name__)
+
+# Distinct URLs are resolved with up to this many lookups in flight (well
+# under the HTTP session's connection pool size).
+_LOOKUP_WORKERS = 8
+_lookup_pool = ThreadPoolExecutor(
+    max_workers=_LOOKUP_WORKERS, thread_name_prefix="rh-instrument"
+)
+
+
+@ttl_cache(24 * 3600, maxsize=8192)
+@disk_cached(7 * 24 * 3600)
+def instrument_symbol(instrument_url: str) -> str:
+    """Ticker for a stock instrument URL.
+
+    The mapping is effectively permanent, so it is shared by every service,
+    held in memory for a day and on disk for a week (bounded only so a
+    ticker change is eventually picked up). An unresolvable instrument
+    raises, so it is never cached.
+    """
+    instrument = rh.get_instrument_by_url(instrument_url)
+    if not isinstance(instrument, dict) or not instrument.get("symbol"):
+        raise RobinhoodAPIError(f"No symbol for instrument {instrument_url}")
+    return instrument["symbol"]
+
+
+def resolve_symbol(instrument_url: str) -> Optional[str]:
+    """Like :func:`instrument_symbol`, but None when the lookup fails."""
+    try:
+        return instrument_symbol(instrument_url)
+    except Exception:
+        logger.debug("Failed to resolve instrument: %s", instrument_url)
+        return None
+
+
+def resolve_symbols(urls: Iterable[Optional[str]]) -> Dict[str, Optional[str]]:
+    """Map each distinct instrument URL to its symbol (None if unresolved)."""
+    unique = list(dict.fromkeys(url for url in urls if url))
+    if len(unique) <= 1:
+        return {url: resolve_symbol(url) for url in unique}
+    return dict(zip(unique, _lookup_pool.map(resolve_symbol, unique)))
@@ -1,15 +1,31 @@
-from .market import Quote, Candle
-from .options import OptionContract, OptionPosition
+from .market import Quote, Candle, parse_candle_rows
+from .options import (
+    OptionContract,
+    OptionContractTD,
+    OptionPosition,
+    parse_option_contract_rows,
+    parse_option_contracts,
+)
 from .portfolio import PortfolioSummary, Position
 from .watchlists import Watchlist
 from .news import NewsItem
 from .fundamentals import Fundamentals
-from .orders import CryptoOrder, OptionOrder, OrderExecution, OrderHistory, StockOrder
+from .orders import (
+    CryptoOrder,
+    OptionLeg,
+    OptionOrder,
+    Order,
+    OrderExecution,
+    OrderHistory,
+    StockOrder,
+    parse_order_history,
+)
 
 __all__ = [
     "Quote",
     "Candle",
     "OptionContract",
+    "OptionContractTD",
     "OptionPosition",
     "PortfolioSummary",
     "Position",
@@ -17,8 +33,14 @@ __all__ = [
     "NewsItem",
     "Fundamentals",
     "OrderHistory",
+    "Order",
     "StockOrder",
     "OptionOrder",
+    "OptionLeg",
     "CryptoOrder",
     "OrderExecution",
+    "parse_order_history",
+    "parse_candle_rows",
+    "parse_option_contract_rows",
+    "parse_option_contracts",
 ]
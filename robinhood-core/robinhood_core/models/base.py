@@ -1,9 +1,22 @@
-from typing import Optional
+import sys
+from typing import Annotated, Optional
 from datetime import datetime
 
+from pydantic import AfterValidator, BaseModel, BeforeValidator
+
 
 def coerce_timestamp(ts: Optional[str]) -> Optional[str]:
     """Ensure timestamp is ISO 8601 format."""
+    # Fast path: already canonical "YYYY-MM-DDTHH:MM:SSZ".
+    if (
+        type(ts) is str
+        and len(ts) == 20
+        and ts[19] == "Z"
+        and ts[10] == "T"
+        and ts[4] == ts[7] == "-"
+        and ts[13] == ts[16] == ":"
+    ):
+        return ts
     if not ts:
         return None
     # Parse and re-format to ensure consistency
@@ -16,8 +29,8 @@ def coerce_timestamp(ts: Optional[str]) -> Optional[str]:
 
 def coerce_numeric(value) -> Optional[float]:
     """Coerce string/number to float."""
-    if value is None:
-        return None
+    if value is None or type(value) is float:
+        return value
     try:
         return float(value)
     except (ValueError, TypeError):
@@ -26,9 +39,43 @@ def coerce_numeric(value) -> Optional[float]:
 
 def coerce_int(value) -> Optional[int]:
     """Coerce string/number to int."""
-    if value is None:
-        return None
+    if value is None or type(value) is int:
+        return value
     try:
         return int(float(value))
     except (ValueError, TypeError):
         return None
+
+
+def coerce_dict_list(value) -> list:
+    """Keep the dict (or model) entries of a list; None or a non-list is []."""
+    if not isinstance(value, list):
+        return []
+    return [
+        item
+        for item in value
+        if isinstance(item, BaseModel) or (item and isinstance(item, dict))
+    ]
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Intern a short enum-like string so repeated values share one object."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+# Reusable field types. Robinhood returns most numbers as strings, so these
+# run the coercers above as pydantic before-validators attached to the type
+# itself rather than as per-model ``field_validator`` classmethods.
+CoercedFloat = Annotated[Optional[float], BeforeValidator(coerce_numeric)]
+CoercedInt = Annotated[Optional[int], BeforeValidator(coerce_int)]
+CoercedTimestamp = Annotated[Optional[str], BeforeValidator(coerce_timestamp)]
+
+# Same coercion for fields that must end up with a value.
+RequiredFloat = Annotated[float, BeforeValidator(coerce_numeric)]
+RequiredInt = Annotated[int, BeforeValidator(coerce_int)]
+RequiredTimestamp = Annotated[str, BeforeValidator(coerce_timestamp)]
+# Low-cardinality enum strings ("buy", "filled", "gtc", ...). Interning them
+# means a page of thousands of orders holds one copy of each value.
+InternedStr = Annotated[Optional[str], AfterValidator(intern_str)]
@@ -1,16 +1,14 @@
-from pydantic import BaseModel, field_validator
-from typing import Optional
-from .base import coerce_numeric
+from pydantic import BaseModel, ConfigDict
+
+from .base import CoercedFloat
 
 
 class Fundamentals(BaseModel):
-    market_cap: Optional[float] = None
-    pe_ratio: Optional[float] = None
-    dividend_yield: Optional[float] = None
-    week_52_high: Optional[float] = None
-    week_52_low: Optional[float] = None
+    # Frozen so one instance (e.g. the empty result) can be shared safely.
+    model_config = ConfigDict(frozen=True)
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
+    market_cap: CoercedFloat = None
+    pe_ratio: CoercedFloat = None
+    dividend_yield: CoercedFloat = None
+    week_52_high: CoercedFloat = None
+    week_52_low: CoercedFloat = None
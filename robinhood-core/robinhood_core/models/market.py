@@ -1,51 +1,37 @@
-from pydantic import BaseModel, field_validator
-from typing import Optional
-from .base import coerce_numeric, coerce_timestamp
+from typing import Iterable, List
+
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter
+
+from .base import CoercedFloat, RequiredFloat, RequiredInt, RequiredTimestamp
 
 
 class Quote(BaseModel):
     symbol: str
-    last_price: float
-    bid: Optional[float] = None
-    ask: Optional[float] = None
-    timestamp: str
-    previous_close: Optional[float] = None
-    change_percent: Optional[float] = None
-
-    @field_validator(
-        "last_price", "bid", "ask", "previous_close", "change_percent", mode="before"
-    )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
-
-    @field_validator("timestamp", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    last_price: RequiredFloat
+    bid: CoercedFloat = None
+    ask: CoercedFloat = None
+    timestamp: RequiredTimestamp
+    previous_close: CoercedFloat = None
+    change_percent: CoercedFloat = None
+
+
+def _alias(name: str, robinhood_name: str):
+    """Accept a field by its own name or by Robinhood's key for it."""
+    return Field(validation_alias=AliasChoices(name, robinhood_name))
 
 
 class Candle(BaseModel):
-    timestamp: str
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: int
-
-    @field_validator("open", "high", "low", "close", mode="before")
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
-
-    @field_validator("volume", mode="before")
-    @classmethod
-    def validate_int(cls, v):
-        from .base import coerce_int
-
-        return coerce_int(v)
-
-    @field_validator("timestamp", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    timestamp: RequiredTimestamp = _alias("timestamp", "begins_at")
+    open: RequiredFloat = _alias("open", "open_price")
+    high: RequiredFloat = _alias("high", "high_price")
+    low: RequiredFloat = _alias("low", "low_price")
+    close: RequiredFloat = _alias("close", "close_price")
+    volume: RequiredInt
+
+
+_CANDLES_ADAPTER = TypeAdapter(List[Candle])
+
+
+def parse_candle_rows(rows: Iterable[dict]) -> List[Candle]:
+    """Validate raw Robinhood historicals rows into candles in one pass."""
+    return _CANDLES_ADAPTER.validate_python(list(rows))
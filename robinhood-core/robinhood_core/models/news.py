@@ -1,6 +1,8 @@
-from pydantic import BaseModel, field_validator
 from typing import Optional
-from .base import coerce_timestamp
+
+from pydantic import BaseModel
+
+from .base import RequiredTimestamp
 
 
 class NewsItem(BaseModel):
@@ -9,9 +11,4 @@ class NewsItem(BaseModel):
     summary: Optional[str] = None
     source: Optional[str] = None
     url: Optional[str] = None
-    published_at: str
-
-    @field_validator("published_at", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    published_at: RequiredTimestamp
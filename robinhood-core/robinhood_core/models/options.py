@@ -1,77 +1,96 @@
-from typing import Literal, Optional
+from typing import Iterable, List, Literal, Optional
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import TypedDict
 
-from .base import coerce_int, coerce_numeric
+from .base import CoercedFloat, CoercedInt, InternedStr, RequiredFloat
 
 
 class OptionPosition(BaseModel):
     """A user's held option position."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+    )
+
     symbol: Optional[str] = None
     expiration_date: Optional[str] = None
-    strike_price: Optional[float] = None
-    option_type: Optional[str] = None
-    direction: Optional[str] = None  # "long" or "short" (debit or credit)
-    quantity: Optional[float] = None
-    average_price: Optional[float] = None
+    strike_price: CoercedFloat = None
+    option_type: InternedStr = None
+    direction: InternedStr = None  # "long" or "short" (debit or credit)
+    quantity: CoercedFloat = None
+    average_price: CoercedFloat = None
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
 
-    @field_validator(
-        "strike_price",
-        "quantity",
-        "average_price",
-        mode="before",
-    )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
-
 
 class OptionContract(BaseModel):
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+    )
+
     symbol: str
     expiration: str
-    strike: float
+    strike: RequiredFloat
     type: Literal["call", "put"]
-    bid: Optional[float] = None
-    ask: Optional[float] = None
-    mark_price: Optional[float] = None
-    last_trade_price: Optional[float] = None
-    open_interest: Optional[int] = None
-    volume: Optional[int] = None
+    bid: CoercedFloat = None
+    ask: CoercedFloat = None
+    mark_price: CoercedFloat = None
+    last_trade_price: CoercedFloat = None
+    open_interest: CoercedInt = None
+    volume: CoercedInt = None
     # Greeks (populated when market data is available)
-    implied_volatility: Optional[float] = None
-    delta: Optional[float] = None
-    gamma: Optional[float] = None
-    theta: Optional[float] = None
-    vega: Optional[float] = None
-    rho: Optional[float] = None
+    implied_volatility: CoercedFloat = None
+    delta: CoercedFloat = None
+    gamma: CoercedFloat = None
+    theta: CoercedFloat = None
+    vega: CoercedFloat = None
+    rho: CoercedFloat = None
     # Profitability
-    chance_of_profit_short: Optional[float] = None
-    chance_of_profit_long: Optional[float] = None
-
-    @field_validator(
-        "strike",
-        "bid",
-        "ask",
-        "mark_price",
-        "last_trade_price",
-        "implied_volatility",
-        "delta",
-        "gamma",
-        "theta",
-        "vega",
-        "rho",
-        "chance_of_profit_short",
-        "chance_of_profit_long",
-        mode="before",
-    )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
-
-    @field_validator("open_interest", "volume", mode="before")
-    @classmethod
-    def validate_int(cls, v):
-        return coerce_int(v)
+    chance_of_profit_short: CoercedFloat = None
+    chance_of_profit_long: CoercedFloat = None
+
+
+class OptionContractTD(TypedDict, total=False):
+    """Plain-dict mirror of ``OptionContract`` for JSON pass-through paths.
+
+    Keep the fields in step with the model; a unit test checks that they
+    match.
+    """
+
+    symbol: str
+    expiration: str
+    strike: RequiredFloat
+    type: Literal["call", "put"]
+    bid: CoercedFloat
+    ask: CoercedFloat
+    mark_price: CoercedFloat
+    last_trade_price: CoercedFloat
+    open_interest: CoercedInt
+    volume: CoercedInt
+    implied_volatility: CoercedFloat
+    delta: CoercedFloat
+    gamma: CoercedFloat
+    theta: CoercedFloat
+    vega: CoercedFloat
+    rho: CoercedFloat
+    chance_of_profit_short: CoercedFloat
+    chance_of_profit_long: CoercedFloat
+
+
+_OPTION_CONTRACTS_ADAPTER = TypeAdapter(List[OptionContract])
+_OPTION_CONTRACT_TD_ADAPTER = TypeAdapter(List[OptionContractTD])
+
+
+def parse_option_contracts(rows: Iterable[dict]) -> List[OptionContract]:
+    """Validate raw contract rows into ``OptionContract`` models in one pass."""
+    return _OPTION_CONTRACTS_ADAPTER.validate_python(list(rows))
+
+
+def parse_option_contract_rows(rows: Iterable[dict]) -> List[OptionContractTD]:
+    """Coerce raw contract rows to plain dicts without building models."""
+    return _OPTION_CONTRACT_TD_ADAPTER.validate_python(list(rows))
@@ -1,147 +1,243 @@
-from typing import List, Literal, Optional
-
-from pydantic import BaseModel, field_validator
-
-from .base import coerce_numeric, coerce_timestamp
+from typing import Annotated, Any, Iterable, List, Literal, Optional, Union
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    computed_field,
+    model_validator,
+)
+
+from .base import (
+    CoercedFloat,
+    CoercedInt,
+    CoercedTimestamp,
+    InternedStr,
+    coerce_dict_list,
+)
 
 
 class OrderExecution(BaseModel):
     """A single execution (fill) within an order."""
 
-    price: Optional[float] = None
-    quantity: Optional[float] = None
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+    )
+
+    price: CoercedFloat = None
+    quantity: CoercedFloat = None
     settlement_date: Optional[str] = None
-    timestamp: Optional[str] = None
+    timestamp: CoercedTimestamp = None
     id: Optional[str] = None
 
-    @field_validator("price", "quantity", mode="before")
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
 
-    @field_validator("timestamp", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+# Robinhood sends ``null`` for empty nested lists and occasionally null rows
+# inside them; both are dropped rather than failing the whole order.
+Executions = Annotated[List[OrderExecution], BeforeValidator(coerce_dict_list)]
 
 
 class StockOrder(BaseModel):
     """A historical stock order."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
+    )
+
+    asset_class: Literal["stock"] = Field("stock", exclude=True)
     id: Optional[str] = None
     symbol: Optional[str] = None
-    side: Optional[str] = None  # "buy" or "sell"
-    type: Optional[str] = None  # "market", "limit", etc.
-    state: Optional[str] = (
+    side: InternedStr = None  # "buy" or "sell"
+    type: InternedStr = None  # "market", "limit", etc.
+    state: InternedStr = (
         None  # "filled", "cancelled", "confirmed", "queued", "failed"
     )
-    quantity: Optional[float] = None
-    cumulative_quantity: Optional[float] = None
-    price: Optional[float] = None
-    average_price: Optional[float] = None
-    stop_price: Optional[float] = None
-    executions: List[OrderExecution] = []
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    last_transaction_at: Optional[str] = None
-    time_in_force: Optional[str] = None  # "gtc", "gfd"
+    quantity: CoercedFloat = None
+    cumulative_quantity: CoercedFloat = None
+    price: CoercedFloat = None
+    average_price: CoercedFloat = None
+    stop_price: CoercedFloat = None
+    executions: Executions = Field(default_factory=list)
+    created_at: CoercedTimestamp = None
+    updated_at: CoercedTimestamp = None
+    last_transaction_at: CoercedTimestamp = None
+    time_in_force: InternedStr = None  # "gtc", "gfd"
     extended_hours: Optional[bool] = None
 
-    @field_validator(
-        "quantity",
-        "cumulative_quantity",
-        "price",
-        "average_price",
-        "stop_price",
-        mode="before",
+
+class OptionLeg(BaseModel):
+    """A single leg of a (possibly multi-leg) option order."""
+
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
     )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
 
-    @field_validator("created_at", "updated_at", "last_transaction_at", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    id: Optional[str] = None
+    side: InternedStr = None  # "buy" or "sell"
+    position_effect: InternedStr = None  # "open" or "close"
+    ratio_quantity: CoercedInt = None
+    option: Optional[str] = None  # option instrument URL
+    expiration_date: Optional[str] = None
+    strike_price: CoercedFloat = None
+    option_type: InternedStr = None
+    executions: Executions = Field(default_factory=list)
 
 
 class OptionOrder(BaseModel):
     """A historical option order."""
 
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
+    )
+
+    asset_class: Literal["option"] = Field("option", exclude=True)
     id: Optional[str] = None
     chain_symbol: Optional[str] = None
-    direction: Optional[str] = None  # "credit" or "debit"
-    type: Optional[str] = None  # "market", "limit"
-    state: Optional[str] = None
-    quantity: Optional[float] = None
-    pending_quantity: Optional[float] = None
-    processed_quantity: Optional[float] = None
-    price: Optional[float] = None
-    premium: Optional[float] = None
-    processed_premium: Optional[float] = None
-    opening_strategy: Optional[str] = None
-    closing_strategy: Optional[str] = None
-    legs: Optional[list] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    time_in_force: Optional[str] = None
-
-    @field_validator(
-        "quantity",
-        "pending_quantity",
-        "processed_quantity",
-        "price",
-        "premium",
-        "processed_premium",
-        mode="before",
+    direction: InternedStr = None  # "credit" or "debit"
+    type: InternedStr = None  # "market", "limit"
+    state: InternedStr = None
+    quantity: CoercedFloat = None
+    pending_quantity: CoercedFloat = None
+    processed_quantity: CoercedFloat = None
+    price: CoercedFloat = None
+    premium: CoercedFloat = None
+    processed_premium: CoercedFloat = None
+    opening_strategy: InternedStr = None
+    closing_strategy: InternedStr = None
+    legs: Annotated[List[OptionLeg], BeforeValidator(coerce_dict_list)] = Field(
+        default_factory=list
     )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
-
-    @field_validator("created_at", "updated_at", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    created_at: CoercedTimestamp = None
+    updated_at: CoercedTimestamp = None
+    time_in_force: InternedStr = None
 
 
 class CryptoOrder(BaseModel):
     """A historical crypto order."""
 
-    id: Optional[str] = None
-    currency_pair_id: Optional[str] = None
-    side: Optional[str] = None  # "buy" or "sell"
-    type: Optional[str] = None
-    state: Optional[str] = None
-    quantity: Optional[float] = None
-    cumulative_quantity: Optional[float] = None
-    price: Optional[float] = None
-    average_price: Optional[float] = None
-    executions: Optional[list] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
-    time_in_force: Optional[str] = None
-
-    @field_validator(
-        "quantity",
-        "cumulative_quantity",
-        "price",
-        "average_price",
-        mode="before",
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
     )
-    @classmethod
-    def validate_numeric(cls, v):
-        return coerce_numeric(v)
 
-    @field_validator("created_at", "updated_at", mode="before")
-    @classmethod
-    def validate_timestamp(cls, v):
-        return coerce_timestamp(v)
+    asset_class: Literal["crypto"] = Field("crypto", exclude=True)
+    id: Optional[str] = None
+    currency_pair_id: Optional[str] = None
+    side: InternedStr = None  # "buy" or "sell"
+    type: InternedStr = None
+    state: InternedStr = None
+    quantity: CoercedFloat = None
+    cumulative_quantity: CoercedFloat = None
+    price: CoercedFloat = None
+    average_price: CoercedFloat = None
+    executions: Executions = Field(default_factory=list)
+    created_at: CoercedTimestamp = None
+    updated_at: CoercedTimestamp = None
+    time_in_force: InternedStr = None
+
+
+# Tagged union over the three order kinds; pydantic dispatches each element
+# on ``asset_class`` instead of trying every member in turn. The tag is input
+# only and never serialized.
+Order = Annotated[
+    Union[StockOrder, OptionOrder, CryptoOrder],
+    Field(discriminator="asset_class"),
+]
+
+_LEGACY_ORDER_KEYS = {
+    "stock_orders": "stock",
+    "option_orders": "option",
+    "crypto_orders": "crypto",
+}
 
 
 class OrderHistory(BaseModel):
-    """Unified order history response."""
+    """Unified order history response.
+
+    Orders are stored in a single ``orders`` list. The per-asset
+    ``stock_orders`` / ``option_orders`` / ``crypto_orders`` views are
+    computed from it and are what gets serialized, and each order's
+    ``asset_class`` tag is excluded from dumps, so the dumped shape is
+    unchanged. Those three keys are also still accepted on input.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_assignment=False,
+        frozen=True,
+        revalidate_instances="never",
+    )
 
-    stock_orders: List[StockOrder] = []
-    option_orders: List[OptionOrder] = []
-    crypto_orders: List[CryptoOrder] = []
+    orders: List[Order] = Field(default_factory=list, exclude=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fold_legacy_lists(cls, data: Any) -> Any:
+        if not isinstance(data, dict) or not any(
+            key in data for key in _LEGACY_ORDER_KEYS
+        ):
+            return data
+        data = dict(data)
+        orders = list(data.get("orders") or [])
+        for key, asset_class in _LEGACY_ORDER_KEYS.items():
+            for item in data.pop(key, None) or []:
+                if isinstance(item, dict):
+                    item = {**item, "asset_class": asset_class}
+                orders.append(item)
+        data["orders"] = orders
+        return data
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def stock_orders(self) -> List[StockOrder]:
+        return [o for o in self.orders if o.asset_class == "stock"]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def option_orders(self) -> List[OptionOrder]:
+        return [o for o in self.orders if o.asset_class == "option"]
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def crypto_orders(self) -> List[CryptoOrder]:
+        return [o for o in self.orders if o.asset_class == "crypto"]
+
+
+# Bulk validators for order-history pages. Built once at import and reused so
+# a whole page of raw rows is validated in a single pydantic-core call.
+_STOCK_ORDERS_ADAPTER = TypeAdapter(List[StockOrder])
+_OPTION_ORDERS_ADAPTER = TypeAdapter(List[OptionOrder])
+_CRYPTO_ORDERS_ADAPTER = TypeAdapter(List[CryptoOrder])
+
+
+def parse_order_history(
+    stock: Iterable[dict] = (),
+    option: Iterable[dict] = (),
+    crypto: Iterable[dict] = (),
+) -> OrderHistory:
+    """Validate raw order rows into an ``OrderHistory``.
+
+    Each argument is a sequence of Robinhood order dicts; unknown keys are
+    ignored by the models.
+    """
+    return OrderHistory(
+        orders=[
+            *_STOCK_ORDERS_ADAPTER.validate_python(list(stock)),
+            *_OPTION_ORDERS_ADAPTER.validate_python(list(option)),
+            *_CRYPTO_ORDERS_ADAPTER.validate_python(list(crypto)),
+        ]
+    )
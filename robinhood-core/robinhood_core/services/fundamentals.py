@@ -1,7 +1,11 @@
 # robin_stocks_mcp/services/fundamentals.py
+from typing import Final
+
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import Fundamentals
+from robinhood_core.cache import ttl_cache
+from robinhood_core.disk_cache import disk_cached
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -9,6 +13,10 @@ from robinhood_core.errors import (
     RobinhoodAPIError,
 )
 
+# Returned for symbols Robinhood has no fundamentals for (typically unknown
+# tickers); the model is frozen, so every caller can share this instance.
+_EMPTY_FUNDAMENTALS: Final[Fundamentals] = Fundamentals()
+
 
 class FundamentalsService:
     """Service for fundamentals operations."""
@@ -16,6 +24,8 @@ class FundamentalsService:
     def __init__(self, client: RobinhoodClient):
         self.client = client
 
+    @ttl_cache(3600)
+    @disk_cached(24 * 3600)
     def get_fundamentals(self, symbol: str) -> Fundamentals:
         """Get fundamentals for a symbol."""
         if not symbol:
@@ -29,7 +39,7 @@ class FundamentalsService:
             if isinstance(data, list):
                 if len(data) == 0:
                     # Return empty fundamentals for invalid symbols
-                    return Fundamentals()
+                    return _EMPTY_FUNDAMENTALS
                 data = data[0]
 
             return Fundamentals(
@@ -1,7 +1,10 @@
-from typing import List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Set, Tuple
 import requests
 import robin_stocks.robinhood as rh
-from robinhood_core.models import Quote, Candle
+from robinhood_core.models import Quote, Candle, parse_candle_rows
+from robinhood_core.cache import peek, prime, ttl_cache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -9,13 +12,137 @@ from robinhood_core.errors import (
     RobinhoodAPIError,
 )
 
+# Accepted get_price_history arguments, in the order shown in error messages.
+_INTERVALS = ("5minute", "10minute", "hour", "day", "week")
+_SPANS = ("day", "week", "month", "3month", "year", "5year")
+_BOUNDS = ("extended", "trading", "regular")
+_VALID_INTERVALS = frozenset(_INTERVALS)
+_VALID_SPANS = frozenset(_SPANS)
+_VALID_BOUNDS = frozenset(_BOUNDS)
+_INVALID_INTERVAL = f"Invalid interval. Must be one of: {list(_INTERVALS)}"
+_INVALID_SPAN = f"Invalid span. Must be one of: {list(_SPANS)}"
+_INVALID_BOUNDS = f"Invalid bounds. Must be one of: {list(_BOUNDS)}"
+
+
+# Quotes are requested as one comma-joined ?symbols= query; longer symbol
+# lists (large portfolios or watchlists) are split into batches of this size
+# (keeping the URL short) and fetched concurrently.
+_QUOTE_BATCH_SIZE = 75
+_quote_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rh-quotes")
+
+
+def fetch_quotes(symbols: List[str]) -> List[dict]:
+    """Fetch quotes for ``symbols`` in URL-sized batches, dropping empty rows."""
+    batches = [
+        symbols[i : i + _QUOTE_BATCH_SIZE]
+        for i in range(0, len(symbols), _QUOTE_BATCH_SIZE)
+    ]
+    if len(batches) <= 1:
+        results = map(rh.get_quotes, batches)
+    else:
+        results = _quote_pool.map(rh.get_quotes, batches)
+    rows = []
+    for quotes in results:
+        if isinstance(quotes, dict):
+            quotes = [quotes]
+        rows.extend(q for q in quotes or () if q)
+    return rows
+
+
+def _build_quote(item: dict) -> Quote:
+    """Build a Quote from a robin_stocks quote dict."""
+    # Compute change_percent from last_trade_price and previous_close
+    # since robin_stocks API does not return change_percent directly.
+    last_trade_price = item.get("last_trade_price")
+    previous_close = item.get("previous_close")
+    change_percent = None
+    if last_trade_price is not None and previous_close is not None:
+        try:
+            ltp = float(last_trade_price)
+            pc = float(previous_close)
+            if pc != 0:
+                change_percent = ((ltp - pc) / pc) * 100
+        except (ValueError, TypeError):
+            change_percent = None
+
+    return Quote(
+        symbol=item.get("symbol", ""),
+        last_price=last_trade_price,
+        bid=item.get("bid_price"),
+        ask=item.get("ask_price"),
+        timestamp=item.get("updated_at"),
+        previous_close=previous_close,
+        change_percent=change_percent,
+    )
+
+
+def _normalize_symbol(symbol: str) -> str:
+    return symbol.strip().upper()
+
+
+class _QuoteBatcher:
+    """Coalesces concurrent quote requests into one upstream call.
+
+    Requests arriving within ``window`` seconds of the first one are merged:
+    the union of their symbols is fetched once with ``fetch`` on the loop's
+    default executor, and each caller gets the quotes for its own symbols.
+    A failed fetch fails every caller in the batch.
+    """
+
+    def __init__(
+        self, fetch: Callable[[List[str]], List[Quote]], window: float = 0.02
+    ):
+        self._fetch = fetch
+        self._window = window
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks; hold each batch's
+        # task until it finishes so it cannot be collected mid-flight.
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def get(self, symbols: List[str]) -> List[Quote]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(
+            (list(dict.fromkeys(_normalize_symbol(s) for s in symbols)), future)
+        )
+        if self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        self._timer = None
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: List[Tuple[List[str], asyncio.Future]]) -> None:
+        symbols = list(dict.fromkeys(s for wanted, _ in batch for s in wanted))
+        try:
+            quotes = await asyncio.get_running_loop().run_in_executor(
+                None, self._fetch, symbols
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_symbol = {q.symbol: q for q in quotes}
+        for wanted, future in batch:
+            if not future.done():
+                future.set_result([by_symbol[s] for s in wanted if s in by_symbol])
+
 
 class MarketDataService:
     """Service for market data operations."""
 
     def __init__(self, client: RobinhoodClient):
         self.client = client
+        self._quote_batcher = _QuoteBatcher(self.get_current_price)
 
+    @ttl_cache(2)
     def get_current_price(self, symbols: List[str]) -> List[Quote]:
         """Get current price quotes for symbols."""
         if not symbols:
@@ -24,47 +151,9 @@ class MarketDataService:
         self.client.ensure_session()
 
         try:
-            # Handle single symbol vs list
-            if len(symbols) == 1:
-                data = rh.get_quotes(symbols[0])
-            else:
-                data = rh.get_quotes(symbols)
-
-            if not data:
-                return []
-
-            # Ensure list format
-            if not isinstance(data, list):
-                data = [data]
-
-            quotes = []
-            for item in data:
-                # Compute change_percent from last_trade_price and previous_close
-                # since robin_stocks API does not return change_percent directly.
-                last_trade_price = item.get("last_trade_price")
-                previous_close = item.get("previous_close")
-                change_percent = None
-                if last_trade_price is not None and previous_close is not None:
-                    try:
-                        ltp = float(last_trade_price)
-                        pc = float(previous_close)
-                        if pc != 0:
-                            change_percent = ((ltp - pc) / pc) * 100
-                    except (ValueError, TypeError):
-                        change_percent = None
-
-                quote = Quote(
-                    symbol=item.get("symbol", ""),
-                    last_price=last_trade_price,
-                    bid=item.get("bid_price"),
-                    ask=item.get("ask_price"),
-                    timestamp=item.get("updated_at"),
-                    previous_close=previous_close,
-                    change_percent=change_percent,
-                )
-                quotes.append(quote)
-
-            return quotes
+            # Never split per symbol: each batch goes out as one
+            # /quotes/?symbols=A,B,C request.
+            return list(map(_build_quote, fetch_quotes(symbols)))
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
@@ -72,6 +161,34 @@ class MarketDataService:
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch quotes: {e}") from e
 
+    async def get_current_price_async(self, symbols: List[str]) -> List[Quote]:
+        """Get quotes, sharing one upstream request with concurrent callers.
+
+        Calls made within a short window of each other are merged into a
+        single ``rh.get_quotes`` request for the union of their symbols.
+        """
+        if not symbols:
+            raise InvalidArgumentError("At least one symbol is required")
+        hit, quotes = peek(
+            self.get_current_price,
+            list(dict.fromkeys(_normalize_symbol(s) for s in symbols)),
+        )
+        if hit:
+            return quotes
+        return await self._quote_batcher.get(symbols)
+
+    def prime_quotes(self, quotes: List[Quote], ttl: Optional[float] = None) -> None:
+        """Seed the quote cache with each quote as its own single-symbol hit.
+
+        Lets quotes fetched in one batch (e.g. a whole watchlist) answer later
+        per-symbol lookups without another request. ``ttl`` overrides the
+        usual 2-second quote lifetime, so a caller that refreshes on a
+        longer period can keep its entries warm until the next refresh.
+        """
+        for quote in quotes:
+            prime(self.get_current_price, [quote], [quote.symbol], ttl=ttl)
+
+    @ttl_cache(60)
     def get_price_history(
         self,
         symbol: str,
@@ -84,20 +201,12 @@ class MarketDataService:
             raise InvalidArgumentError("Symbol is required")
 
         # Validate inputs
-        valid_intervals = ["5minute", "10minute", "hour", "day", "week"]
-        valid_spans = ["day", "week", "month", "3month", "year", "5year"]
-        valid_bounds = ["extended", "trading", "regular"]
-
-        if interval not in valid_intervals:
-            raise InvalidArgumentError(
-                f"Invalid interval. Must be one of: {valid_intervals}"
-            )
-        if span not in valid_spans:
-            raise InvalidArgumentError(f"Invalid span. Must be one of: {valid_spans}")
-        if bounds not in valid_bounds:
-            raise InvalidArgumentError(
-                f"Invalid bounds. Must be one of: {valid_bounds}"
-            )
+        if interval not in _VALID_INTERVALS:
+            raise InvalidArgumentError(_INVALID_INTERVAL)
+        if span not in _VALID_SPANS:
+            raise InvalidArgumentError(_INVALID_SPAN)
+        if bounds not in _VALID_BOUNDS:
+            raise InvalidArgumentError(_INVALID_BOUNDS)
 
         self.client.ensure_session()
 
@@ -109,19 +218,7 @@ class MarketDataService:
             if not data:
                 return []
 
-            candles = []
-            for item in data:
-                candle = Candle(
-                    timestamp=item.get("begins_at"),
-                    open=item.get("open_price"),
-                    high=item.get("high_price"),
-                    low=item.get("low_price"),
-                    close=item.get("close_price"),
-                    volume=item.get("volume"),
-                )
-                candles.append(candle)
-
-            return candles
+            return parse_candle_rows(data)
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
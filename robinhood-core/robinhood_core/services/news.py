@@ -1,8 +1,10 @@
 # robin_stocks_mcp/services/news.py
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import NewsItem
+from robinhood_core.cache import ttl_cache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -10,6 +12,13 @@ from robinhood_core.errors import (
     RobinhoodAPIError,
 )
 
+# Per-symbol news requests for get_news_many overlap up to this many at once,
+# leaving room in the rate-limit budget for other calls.
+_NEWS_WORKERS = 4
+_news_pool = ThreadPoolExecutor(
+    max_workers=_NEWS_WORKERS, thread_name_prefix="rh-news"
+)
+
 
 class NewsService:
     """Service for news operations."""
@@ -17,6 +26,7 @@ class NewsService:
     def __init__(self, client: RobinhoodClient):
         self.client = client
 
+    @ttl_cache(300)
     def get_news(self, symbol: str) -> List[NewsItem]:
         """Get news for a symbol.
 
@@ -36,11 +46,8 @@ class NewsService:
             if not news_data:
                 return []
 
-            items = []
-            for item in news_data:
-                if not isinstance(item, dict):
-                    continue
-                news_item = NewsItem(
+            return [
+                NewsItem(
                     id=item.get("uuid", ""),
                     headline=item.get("title", ""),
                     summary=item.get("summary", ""),
@@ -48,12 +55,31 @@ class NewsService:
                     url=item.get("url", ""),
                     published_at=item.get("published_at"),
                 )
-                items.append(news_item)
-
-            return items
+                for item in news_data
+                if isinstance(item, dict)
+            ]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
             raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch news: {e}") from e
+
+    def get_news_many(self, symbols: List[str]) -> Dict[str, List[NewsItem]]:
+        """Get news for several symbols, fetching them concurrently.
+
+        Each symbol goes through ``get_news``, so cached symbols cost nothing.
+        Results are keyed by symbol in first-seen order; duplicates are
+        fetched once. The first failure is raised.
+
+        :raises InvalidArgumentError: If no symbols are provided.
+        """
+        if not symbols:
+            raise InvalidArgumentError(
+                "At least one stock symbol is required to fetch news."
+            )
+
+        unique = list(dict.fromkeys(symbols))
+        if len(unique) == 1:
+            return {unique[0]: self.get_news(unique[0])}
+        return dict(zip(unique, _news_pool.map(self.get_news, unique)))
@@ -1,11 +1,19 @@
 # robin_stocks_mcp/services/options.py
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
 
 import requests
 import robin_stocks.robinhood as rh
 
-from robinhood_core.models import OptionContract, OptionPosition
+from robinhood_core.models import (
+    OptionContract,
+    OptionContractTD,
+    OptionPosition,
+    parse_option_contract_rows,
+    parse_option_contracts,
+)
+from robinhood_core.cache import ttl_cache
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -15,6 +23,134 @@ from robinhood_core.errors import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Independent per-item requests (instrument lookups for positions, call and
+# put market data for a strike) overlap on this pool. Kept small so bursts
+# stay clear of Robinhood's rate limiting.
+_LOOKUP_WORKERS = 8
+_lookup_pool = ThreadPoolExecutor(
+    max_workers=_LOOKUP_WORKERS,
+    thread_name_prefix="rh-option-lookup",
+)
+
+
+@ttl_cache(24 * 3600)
+def _option_instrument_by_id(option_id: str) -> dict:
+    """Instrument data for an option ID.
+
+    Strike, expiration and type never change for a given option, so results
+    are cached for a day. Missing data raises, so it is never cached.
+    """
+    instrument = rh.get_option_instrument_data_by_id(option_id)
+    if not isinstance(instrument, dict):
+        raise RobinhoodAPIError(f"No instrument data for option {option_id}")
+    return instrument
+
+
+def _get_option_instrument(option_url: Optional[str]) -> Optional[dict]:
+    """Fetch the instrument behind an option URL; None if it can't be had."""
+    if not option_url:
+        return None
+    try:
+        # Extract the option ID from the URL and fetch instrument data
+        return _option_instrument_by_id(option_url.rstrip("/").split("/")[-1])
+    except Exception:
+        logger.debug("Failed to resolve option instrument: %s", option_url)
+        return None
+
+
+@ttl_cache(45)
+def _latest_price(symbol: str) -> float:
+    """Latest trade price for a symbol.
+
+    Only used to pick near-the-money strikes, which tolerates a slightly
+    stale price, so it is cached for 45 seconds. Missing prices raise and
+    are not cached.
+    """
+    prices = rh.get_latest_price(symbol)
+    return float(prices[0])
+
+
+@ttl_cache(300)
+def _expiration_dates(symbol: str) -> List[str]:
+    """Listed option expirations for a symbol, nearest first.
+
+    The list only changes when an expiration is added or passes, so it is
+    cached for five minutes. A missing chain raises and is not cached.
+    """
+    chains = rh.get_chains(symbol)
+    if not chains or not isinstance(chains, dict):
+        raise RobinhoodAPIError(f"No option chain for {symbol}")
+    return [str(date) for date in chains.get("expiration_dates") or []]
+
+
+def _nearest_expiration(symbol: str) -> Optional[str]:
+    try:
+        expirations = _expiration_dates(symbol)
+    except RobinhoodAPIError:
+        return None
+    return expirations[0] if expirations else None
+
+
+# ``OptionContract`` field -> robin_stocks key it is read from, in field order.
+_CONTRACT_KEYS = {
+    "symbol": "chain_symbol",
+    "expiration": "expiration_date",
+    "strike": "strike_price",
+    "type": "type",
+    "bid": "bid_price",
+    "ask": "ask_price",
+    "mark_price": "adjusted_mark_price",
+    "last_trade_price": "last_trade_price",
+    "open_interest": "open_interest",
+    "volume": "volume",
+    "implied_volatility": "implied_volatility",
+    "delta": "delta",
+    "gamma": "gamma",
+    "theta": "theta",
+    "vega": "vega",
+    "rho": "rho",
+    "chance_of_profit_short": "chance_of_profit_short",
+    "chance_of_profit_long": "chance_of_profit_long",
+}
+_ROW_FIELDS = tuple(_CONTRACT_KEYS)
+_ITEM_KEYS = tuple(_CONTRACT_KEYS.values())
+
+
+@ttl_cache(15)
+def _tradable_options(
+    symbol: str, expiration: str, option_type: Optional[str]
+) -> List[dict]:
+    """Tradable options for an expiration, briefly cached.
+
+    Agents exploring a chain tend to repeat the same listing within
+    seconds, and the set of strikes rarely changes intraday, while the
+    paginated request behind it is slow.
+    """
+    return rh.find_tradable_options(
+        symbol, expirationDate=expiration, optionType=option_type
+    )
+
+
+def _strike_in_band(item: dict, lower: float, upper: float) -> bool:
+    """Whether an option's strike lies in [lower, upper].
+
+    Options whose strike can't be parsed are kept rather than dropped.
+    """
+    try:
+        strike = float(item.get("strike_price", 0))
+    except (ValueError, TypeError):
+        return True
+    return lower <= strike <= upper
+
+
+def _get_option_instruments(urls: List[Optional[str]]) -> List[Optional[dict]]:
+    """Fetch instruments for ``urls`` concurrently, preserving order."""
+    if len(urls) <= 1:
+        return [_get_option_instrument(url) for url in urls]
+    return list(_lookup_pool.map(_get_option_instrument, urls))
+
 
 class OptionsService:
     """Service for options operations.
@@ -41,41 +177,29 @@ class OptionsService:
     def _get_current_price(self, symbol: str) -> Optional[float]:
         """Get current stock price for near-the-money filtering."""
         try:
-            prices = rh.get_latest_price(symbol)
-            if prices and prices[0]:
-                return float(prices[0])
+            return _latest_price(symbol)
         except Exception:
-            pass
-        return None
+            return None
 
     @staticmethod
-    def _build_contract(item: dict, symbol: str, expiration: str) -> OptionContract:
-        """Build an OptionContract from a robin_stocks dict.
+    def _contract_row(item: dict, symbol: str, expiration: str) -> dict:
+        """Map a robin_stocks dict onto ``OptionContract`` field names.
 
         Works with both instrument data (from ``find_tradable_options``)
         and market data (from ``get_option_market_data``).  Missing keys
         simply resolve to ``None`` thanks to ``.get()``.
         """
-        return OptionContract(
-            symbol=item.get("chain_symbol", symbol),
-            expiration=item.get("expiration_date", expiration),
-            strike=item.get("strike_price"),
-            type="call" if item.get("type") == "call" else "put",
-            bid=item.get("bid_price"),
-            ask=item.get("ask_price"),
-            mark_price=(item.get("adjusted_mark_price") or item.get("mark_price")),
-            last_trade_price=item.get("last_trade_price"),
-            open_interest=item.get("open_interest"),
-            volume=item.get("volume"),
-            implied_volatility=item.get("implied_volatility"),
-            delta=item.get("delta"),
-            gamma=item.get("gamma"),
-            theta=item.get("theta"),
-            vega=item.get("vega"),
-            rho=item.get("rho"),
-            chance_of_profit_short=item.get("chance_of_profit_short"),
-            chance_of_profit_long=item.get("chance_of_profit_long"),
-        )
+        # One C-level pass over the keys; then patch the few fields that
+        # need a default or a fallback.
+        row = dict(zip(_ROW_FIELDS, map(item.get, _ITEM_KEYS)))
+        if "chain_symbol" not in item:
+            row["symbol"] = symbol
+        if "expiration_date" not in item:
+            row["expiration"] = expiration
+        row["type"] = "call" if row["type"] == "call" else "put"
+        if not row["mark_price"]:
+            row["mark_price"] = item.get("mark_price")
+        return row
 
     def get_options_chain(
         self,
@@ -83,6 +207,7 @@ class OptionsService:
         expiration_date: Optional[str] = None,
         option_type: Optional[str] = None,
         strike_price: Optional[str] = None,
+        near_the_money: bool = True,
     ) -> List[OptionContract]:
         """Get options chain for a symbol.
 
@@ -93,7 +218,50 @@ class OptionsService:
             strike_price: Specific strike price. When provided,
                 returns 1-2 contracts with full greeks via
                 ``get_option_market_data``.
+            near_the_money: Limit a chain listing to strikes within 20% of
+                the current price. Pass False to list every strike and skip
+                the price lookup.
         """
+        return self._options_chain(
+            symbol,
+            expiration_date,
+            option_type,
+            strike_price,
+            near_the_money,
+            parse_option_contracts,
+        )
+
+    def get_options_chain_raw(
+        self,
+        symbol: str,
+        expiration_date: Optional[str] = None,
+        option_type: Optional[str] = None,
+        strike_price: Optional[str] = None,
+        near_the_money: bool = True,
+    ) -> List[OptionContractTD]:
+        """Like ``get_options_chain`` but returns coerced plain dicts.
+
+        Skips ``OptionContract`` construction for callers that only
+        serialize the result, such as the MCP server.
+        """
+        return self._options_chain(
+            symbol,
+            expiration_date,
+            option_type,
+            strike_price,
+            near_the_money,
+            parse_option_contract_rows,
+        )
+
+    def _options_chain(
+        self,
+        symbol: str,
+        expiration_date: Optional[str],
+        option_type: Optional[str],
+        strike_price: Optional[str],
+        near_the_money: bool,
+        convert: Callable[[List[dict]], List[T]],
+    ) -> List[T]:
         if not symbol:
             raise InvalidArgumentError("Symbol is required")
 
@@ -102,24 +270,24 @@ class OptionsService:
         try:
             # Resolve expiration date if not provided
             if not expiration_date:
-                chains_data = rh.get_chains(symbol)
-                if not chains_data or not isinstance(chains_data, dict):
-                    return []
-                expirations = chains_data.get("expiration_dates", [])
-                if not expirations:
+                expiration_date = _nearest_expiration(symbol)
+                if not expiration_date:
                     return []
-                expiration_date = str(expirations[0])
 
             exp = str(expiration_date)
 
             # --- Targeted lookup (strike_price provided) ---
             # Uses get_option_market_data for full greeks.
             if strike_price:
-                return self._targeted_lookup(symbol, exp, strike_price, option_type)
+                return convert(
+                    self._targeted_lookup(symbol, exp, strike_price, option_type)
+                )
 
             # --- Chain listing (no strike_price) ---
             # Uses find_tradable_options (single paginated call).
-            return self._chain_listing(symbol, exp, option_type)
+            return convert(
+                self._chain_listing(symbol, exp, option_type, near_the_money)
+            )
 
         except (
             RobinhoodAPIError,
@@ -146,23 +314,31 @@ class OptionsService:
         exp: str,
         strike_price: str,
         option_type: Optional[str],
-    ) -> List[OptionContract]:
+    ) -> List[dict]:
         """Fetch market data for a specific strike.
 
         If ``option_type`` is given, returns one contract.
         Otherwise returns both call and put at that strike.
         """
-        contracts: List[OptionContract] = []
+        contracts: List[dict] = []
 
         types_to_fetch: List[str] = [option_type] if option_type else ["call", "put"]
 
-        for ot in types_to_fetch:
-            md = rh.get_option_market_data(
+        def fetch(ot: str) -> list:
+            return rh.get_option_market_data(
                 symbol,
                 expirationDate=exp,
                 strikePrice=str(strike_price),
                 optionType=ot,
             )
+
+        # Call and put are independent requests; make them at the same time.
+        if len(types_to_fetch) == 1:
+            results = [fetch(types_to_fetch[0])]
+        else:
+            results = list(_lookup_pool.map(fetch, types_to_fetch))
+
+        for ot, md in zip(types_to_fetch, results):
             if not md:
                 continue
             # get_option_market_data returns a list of
@@ -180,7 +356,7 @@ class OptionsService:
                     item.setdefault("type", ot)
                     item.setdefault("strike_price", strike_price)
                     item.setdefault("expiration_date", exp)
-                    contracts.append(self._build_contract(item, symbol, exp))
+                    contracts.append(self._contract_row(item, symbol, exp))
 
         return contracts
 
@@ -189,43 +365,37 @@ class OptionsService:
         symbol: str,
         exp: str,
         option_type: Optional[str],
-    ) -> List[OptionContract]:
+        near_the_money: bool,
+    ) -> List[dict]:
         """List strikes for an expiration (no greeks).
 
         Uses ``find_tradable_options`` which is a single paginated
-        API call — fast even for large chains.  Results are filtered
-        to near-the-money (±20% of current price) when possible.
+        API call — fast even for large chains.  Unless ``near_the_money``
+        is False, results are filtered to near-the-money (±20% of current
+        price) when possible.
         """
-        options_data = rh.find_tradable_options(
-            symbol,
-            expirationDate=exp,
-            optionType=option_type,
+        # The reference price for near-the-money filtering doesn't depend on
+        # the listing, so fetch it while the listing request is in flight.
+        price_future = (
+            _lookup_pool.submit(self._get_current_price, symbol)
+            if near_the_money
+            else None
         )
+        options_data = _tradable_options(symbol, exp, option_type)
 
         if not options_data:
             return []
 
         # Near-the-money filtering
-        current_price = self._get_current_price(symbol)
-
-        contracts: List[OptionContract] = []
-        for item in options_data:
-            if not item or not isinstance(item, dict):
-                continue
-
-            if current_price:
-                try:
-                    strike_val = float(item.get("strike_price", 0))
-                    lower = current_price * 0.80
-                    upper = current_price * 1.20
-                    if strike_val < lower or strike_val > upper:
-                        continue
-                except (ValueError, TypeError):
-                    pass
+        current_price = price_future.result() if price_future else None
 
-            contracts.append(self._build_contract(item, symbol, exp))
+        items = [item for item in options_data if item and isinstance(item, dict)]
+        if current_price:
+            lower = current_price * 0.80
+            upper = current_price * 1.20
+            items = [item for item in items if _strike_in_band(item, lower, upper)]
 
-        return contracts
+        return [self._contract_row(item, symbol, exp) for item in items]
 
     def get_option_positions(self) -> List[OptionPosition]:
         """Get all open option positions for the account.
@@ -242,34 +412,27 @@ class OptionsService:
             if not positions_data or positions_data == [None]:
                 return []
 
-            positions: List[OptionPosition] = []
-            for item in positions_data:
-                if not item or not isinstance(item, dict):
-                    continue
+            items = [
+                item for item in positions_data if item and isinstance(item, dict)
+            ]
+            # Resolve each option instrument for strike/expiration/type
+            instruments = _get_option_instruments(
+                [item.get("option") for item in items]
+            )
 
-                # Resolve the option instrument for strike/expiration/type
-                option_url = item.get("option")
+            positions: List[OptionPosition] = []
+            for item, instrument in zip(items, instruments):
                 symbol = item.get("chain_symbol")
                 strike_price = None
                 expiration_date = None
                 option_type = None
 
-                if option_url:
-                    try:
-                        # Extract the option ID from the URL and fetch instrument data
-                        option_id = option_url.rstrip("/").split("/")[-1]
-                        instrument = rh.get_option_instrument_data_by_id(option_id)
-                        if instrument and isinstance(instrument, dict):
-                            strike_price = instrument.get("strike_price")
-                            expiration_date = instrument.get("expiration_date")
-                            option_type = instrument.get("type")
-                            if not symbol:
-                                symbol = instrument.get("chain_symbol")
-                    except Exception:
-                        logger.debug(
-                            "Failed to resolve option instrument: %s",
-                            option_url,
-                        )
+                if instrument:
+                    strike_price = instrument.get("strike_price")
+                    expiration_date = instrument.get("expiration_date")
+                    option_type = instrument.get("type")
+                    if not symbol:
+                        symbol = instrument.get("chain_symbol")
 
                 position = OptionPosition(
                     symbol=symbol,
@@ -1,16 +1,12 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import requests
 import robin_stocks.robinhood as rh
 
-from robinhood_core.models.orders import (
-    CryptoOrder,
-    OptionOrder,
-    OrderExecution,
-    OrderHistory,
-    StockOrder,
-)
+from robinhood_core.models import OrderHistory, parse_order_history
+from robinhood_core.instruments import resolve_symbols
 from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     AuthRequiredError,
@@ -20,6 +16,13 @@ from robinhood_core.errors import (
 
 logger = logging.getLogger(__name__)
 
+# get_order_history("all") loads option and crypto orders here while stock
+# orders load on the calling thread. Kept apart from the instrument lookup
+# pool so these outer fetches can never hold the workers those lookups need.
+_order_type_pool = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="rh-order-history"
+)
+
 
 class OrdersService:
     def __init__(self, client: RobinhoodClient):
@@ -41,24 +44,34 @@ class OrdersService:
             )
 
         try:
-            stock_orders: List[StockOrder] = []
-            option_orders: List[OptionOrder] = []
-            crypto_orders: List[CryptoOrder] = []
+            stock_orders: List[dict] = []
+            option_orders: List[dict] = []
+            crypto_orders: List[dict] = []
+
+            option_future = crypto_future = None
+            if order_type == "all":
+                # The three lists are independent requests; overlap them.
+                option_future = _order_type_pool.submit(
+                    self._get_option_orders, symbol, start_date
+                )
+                crypto_future = _order_type_pool.submit(
+                    self._get_crypto_orders, start_date
+                )
 
             if order_type in ("all", "stock"):
                 stock_orders = self._get_stock_orders(symbol, start_date)
 
-            if order_type in ("all", "option"):
+            if option_future is not None:
+                option_orders = option_future.result()
+            elif order_type == "option":
                 option_orders = self._get_option_orders(symbol, start_date)
 
-            if order_type in ("all", "crypto"):
+            if crypto_future is not None:
+                crypto_orders = crypto_future.result()
+            elif order_type == "crypto":
                 crypto_orders = self._get_crypto_orders(start_date)
 
-            return OrderHistory(
-                stock_orders=stock_orders,
-                option_orders=option_orders,
-                crypto_orders=crypto_orders,
-            )
+            return parse_order_history(stock_orders, option_orders, crypto_orders)
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
@@ -66,57 +79,40 @@ class OrdersService:
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch order history: {e}") from e
 
+    # The helpers below return raw order rows; validation into models happens
+    # once per list in ``parse_order_history``.
+
     def _get_stock_orders(
         self,
         symbol: Optional[str],
         start_date: Optional[str],
-    ) -> List[StockOrder]:
+    ) -> List[dict]:
         raw = rh.get_all_stock_orders(start_date=start_date)
         if not raw:
             return []
 
-        orders: List[StockOrder] = []
-        for item in raw:
-            if not item or not isinstance(item, dict):
-                continue
+        items = [item for item in raw if item and isinstance(item, dict)]
+        # Accounts trade the same few symbols repeatedly, so resolve each
+        # distinct instrument once rather than once per order.
+        url_symbols = resolve_symbols(
+            item.get("instrument") for item in items
+        )
 
-            order_symbol = self._resolve_stock_symbol(item)
+        wanted = symbol.upper() if symbol else None
+        orders: List[dict] = []
+        for item in items:
+            order_symbol = url_symbols.get(item.get("instrument"))
 
-            if symbol and order_symbol and order_symbol.upper() != symbol.upper():
+            if wanted and order_symbol and order_symbol.upper() != wanted:
                 continue
 
             executions = [
-                OrderExecution(
-                    price=ex.get("price"),
-                    quantity=ex.get("quantity"),
-                    settlement_date=ex.get("settlement_date"),
-                    timestamp=ex.get("timestamp"),
-                    id=ex.get("id"),
-                )
+                ex
                 for ex in (item.get("executions") or [])
                 if ex and isinstance(ex, dict)
             ]
 
-            orders.append(
-                StockOrder(
-                    id=item.get("id"),
-                    symbol=order_symbol,
-                    side=item.get("side"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    cumulative_quantity=item.get("cumulative_quantity"),
-                    price=item.get("price"),
-                    average_price=item.get("average_price"),
-                    stop_price=item.get("stop_price"),
-                    executions=executions,
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    last_transaction_at=item.get("last_transaction_at"),
-                    time_in_force=item.get("time_in_force"),
-                    extended_hours=item.get("extended_hours"),
-                )
-            )
+            orders.append({**item, "symbol": order_symbol, "executions": executions})
 
         return orders
 
@@ -124,87 +120,32 @@ class OrdersService:
         self,
         symbol: Optional[str],
         start_date: Optional[str],
-    ) -> List[OptionOrder]:
+    ) -> List[dict]:
         raw = rh.get_all_option_orders(start_date=start_date)
         if not raw:
             return []
 
-        orders: List[OptionOrder] = []
+        wanted = symbol.upper() if symbol else None
+        orders: List[dict] = []
         for item in raw:
             if not item or not isinstance(item, dict):
                 continue
 
             chain_symbol = item.get("chain_symbol")
-            if symbol and chain_symbol and chain_symbol.upper() != symbol.upper():
+            if wanted and chain_symbol and chain_symbol.upper() != wanted:
                 continue
 
-            orders.append(
-                OptionOrder(
-                    id=item.get("id"),
-                    chain_symbol=chain_symbol,
-                    direction=item.get("direction"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    pending_quantity=item.get("pending_quantity"),
-                    processed_quantity=item.get("processed_quantity"),
-                    price=item.get("price"),
-                    premium=item.get("premium"),
-                    processed_premium=item.get("processed_premium"),
-                    opening_strategy=item.get("opening_strategy"),
-                    closing_strategy=item.get("closing_strategy"),
-                    legs=item.get("legs"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    time_in_force=item.get("time_in_force"),
-                )
-            )
+            orders.append(item)
 
         return orders
 
     def _get_crypto_orders(
         self,
         start_date: Optional[str],
-    ) -> List[CryptoOrder]:
+    ) -> List[dict]:
         # robin-stocks crypto orders API does not support start_date
         raw = rh.get_all_crypto_orders()
         if not raw:
             return []
 
-        orders: List[CryptoOrder] = []
-        for item in raw:
-            if not item or not isinstance(item, dict):
-                continue
-
-            orders.append(
-                CryptoOrder(
-                    id=item.get("id"),
-                    currency_pair_id=item.get("currency_pair_id"),
-                    side=item.get("side"),
-                    type=item.get("type"),
-                    state=item.get("state"),
-                    quantity=item.get("quantity"),
-                    cumulative_quantity=item.get("cumulative_quantity"),
-                    price=item.get("price"),
-                    average_price=item.get("average_price"),
-                    executions=item.get("executions"),
-                    created_at=item.get("created_at"),
-                    updated_at=item.get("updated_at"),
-                    time_in_force=item.get("time_in_force"),
-                )
-            )
-
-        return orders
-
-    @staticmethod
-    def _resolve_stock_symbol(item: dict) -> Optional[str]:
-        instrument_url = item.get("instrument")
-        if not instrument_url:
-            return None
-        try:
-            instrument = rh.get_instrument_by_url(instrument_url)
-            if instrument and isinstance(instrument, dict):
-                return instrument.get("symbol")
-        except Exception:
-            logger.debug("Failed to resolve instrument: %s", instrument_url)
-        return None
+        return [item for item in raw if item and isinstance(item, dict)]
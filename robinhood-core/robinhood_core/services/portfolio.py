@@ -1,15 +1,57 @@
 # robin_stocks_mcp/services/portfolio.py
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import PortfolioSummary, Position
+from robinhood_core.models.base import coerce_numeric
 from robinhood_core.client import RobinhoodClient
+from robinhood_core.instruments import resolve_symbols
+from robinhood_core.services.market_data import fetch_quotes
 from robinhood_core.errors import (
     AuthRequiredError,
     InvalidArgumentError,
     RobinhoodAPIError,
 )
 
+# get_portfolio_summary loads the account profile here while the portfolio
+# profile loads on the calling thread.
+_profile_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rh-profile")
+
+def _difference(a, b) -> Optional[float]:
+    """``a - b`` for numeric strings, or None if either is missing or bad."""
+    a, b = coerce_numeric(a), coerce_numeric(b)
+    if a is None or b is None:
+        return None
+    return a - b
+
+
+def _build_position(symbol: str, item: dict, quote: Optional[dict]) -> Position:
+    """Build a Position, pricing it from ``quote`` when one is available."""
+    quantity = item.get("quantity")
+    avg_buy_price = item.get("average_buy_price")
+
+    market_value = None
+    unrealized_pl = None
+
+    if quote:
+        qty = coerce_numeric(quantity)
+        current_price = coerce_numeric(quote.get("last_trade_price", 0))
+        if qty is not None and current_price is not None:
+            market_value = qty * current_price
+
+            avg_cost = coerce_numeric(avg_buy_price)
+            if avg_cost is not None:
+                unrealized_pl = market_value - qty * avg_cost
+
+    return Position(
+        symbol=symbol,
+        quantity=quantity,
+        average_cost=avg_buy_price,
+        market_value=market_value,
+        unrealized_pl=unrealized_pl,
+    )
+
 
 class PortfolioService:
     """Service for portfolio operations."""
@@ -22,18 +64,14 @@ class PortfolioService:
         self.client.ensure_session()
 
         try:
+            account_future = _profile_pool.submit(rh.load_account_profile)
             portfolio = rh.load_portfolio_profile()
-            account = rh.load_account_profile()
+            account = account_future.result()
 
             equity = portfolio.get("equity")
             equity_previous_close = portfolio.get("equity_previous_close")
 
-            day_change = None
-            if equity is not None and equity_previous_close is not None:
-                try:
-                    day_change = float(equity) - float(equity_previous_close)
-                except (ValueError, TypeError):
-                    day_change = None
+            day_change = _difference(equity, equity_previous_close)
 
             return PortfolioSummary(
                 equity=equity,
@@ -57,10 +95,12 @@ class PortfolioService:
             positions_data = rh.get_open_stock_positions()
 
             # First pass: resolve symbols from instrument URLs
+            url_symbols = resolve_symbols(
+                item.get("instrument") for item in positions_data
+            )
             resolved = []
             for item in positions_data:
-                instrument = rh.get_instrument_by_url(item.get("instrument"))
-                symbol = instrument.get("symbol") if instrument else None
+                symbol = url_symbols.get(item.get("instrument"))
 
                 if symbols and symbol not in symbols:
                     continue
@@ -68,47 +108,18 @@ class PortfolioService:
                 resolved.append((symbol or "UNKNOWN", item))
 
             # Batch-fetch current quotes for all position symbols
-            known_symbols = [s for s, _ in resolved if s != "UNKNOWN"]
-            quotes_map: dict = {}
-            if known_symbols:
-                quotes = rh.get_quotes(known_symbols)
-                if quotes:
-                    for q in quotes:
-                        if q and q.get("symbol"):
-                            quotes_map[q["symbol"]] = q
+            known_symbols = list(
+                dict.fromkeys(s for s, _ in resolved if s != "UNKNOWN")
+            )
+            quotes_map = {
+                q["symbol"]: q for q in fetch_quotes(known_symbols) if q.get("symbol")
+            }
 
             # Build position objects with computed market_value / unrealized_pl
-            positions = []
-            for symbol, item in resolved:
-                quantity = item.get("quantity")
-                avg_buy_price = item.get("average_buy_price")
-
-                market_value = None
-                unrealized_pl = None
-
-                quote = quotes_map.get(symbol)
-                if quote and quantity is not None:
-                    try:
-                        current_price = float(quote.get("last_trade_price", 0))
-                        qty = float(quantity)
-                        market_value = qty * current_price
-
-                        if avg_buy_price is not None:
-                            cost_basis = qty * float(avg_buy_price)
-                            unrealized_pl = market_value - cost_basis
-                    except (ValueError, TypeError):
-                        pass
-
-                position = Position(
-                    symbol=symbol,
-                    quantity=quantity,
-                    average_cost=avg_buy_price,
-                    market_value=market_value,
-                    unrealized_pl=unrealized_pl,
-                )
-                positions.append(position)
-
-            return positions
+            return [
+                _build_position(symbol, item, quotes_map.get(symbol))
+                for symbol, item in resolved
+            ]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
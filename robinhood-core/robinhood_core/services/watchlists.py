@@ -1,15 +1,21 @@
 # robin_stocks_mcp/services/watchlists.py
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 import requests
 import robin_stocks.robinhood as rh
 from robinhood_core.models import Watchlist
 from robinhood_core.client import RobinhoodClient
+from robinhood_core.instruments import resolve_symbols
 from robinhood_core.errors import (
     AuthRequiredError,
     InvalidArgumentError,
     RobinhoodAPIError,
 )
 
+# Watchlist contents load here; their instrument URLs then resolve together on
+# the shared instrument lookup pool.
+_watchlist_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="rh-watchlist")
+
 
 class WatchlistsService:
     """Service for watchlist operations."""
@@ -32,22 +38,24 @@ class WatchlistsService:
                 else []
             )
 
-            watchlists = []
-            for item in results:
-                wl_id = item.get("id", "")
-                wl_name = item.get("display_name", "")
+            names = [item.get("display_name", "") for item in results]
 
-                # Fetch instruments for this watchlist and resolve symbols
-                symbols = self._get_watchlist_symbols(wl_name)
+            # Fetch every watchlist's instruments, then resolve the distinct
+            # URLs across all of them in one pass
+            if len(names) > 1:
+                url_lists = list(_watchlist_pool.map(self._get_watchlist_urls, names))
+            else:
+                url_lists = [self._get_watchlist_urls(name) for name in names]
+            url_symbols = resolve_symbols(url for urls in url_lists for url in urls)
 
-                watchlist = Watchlist(
-                    id=wl_id,
-                    name=wl_name,
-                    symbols=symbols,
+            return [
+                Watchlist(
+                    id=item.get("id", ""),
+                    name=name,
+                    symbols=[url_symbols[url] for url in urls if url_symbols[url]],
                 )
-                watchlists.append(watchlist)
-
-            return watchlists
+                for item, name, urls in zip(results, names, url_lists)
+            ]
         except (RobinhoodAPIError, InvalidArgumentError, AuthRequiredError):
             raise
         except (requests.RequestException, ConnectionError, TimeoutError) as e:
@@ -55,22 +63,17 @@ class WatchlistsService:
         except Exception as e:
             raise RobinhoodAPIError(f"Failed to fetch watchlists: {e}") from e
 
-    def _get_watchlist_symbols(self, name: str) -> List[str]:
-        """Fetch symbols for a watchlist by name."""
+    def _get_watchlist_urls(self, name: str) -> List[str]:
+        """Fetch the instrument URLs in a watchlist by name."""
         try:
             items = rh.get_watchlist_by_name(name=name)
             if not items or not isinstance(items, list):
                 return []
 
-            symbols = []
-            for entry in items:
-                if not isinstance(entry, dict):
-                    continue
-                instrument_url = entry.get("instrument")
-                if instrument_url:
-                    symbol = rh.get_symbol_by_url(instrument_url)
-                    if symbol:
-                        symbols.append(symbol)
-            return symbols
+            return [
+                url
+                for entry in items
+                if isinstance(entry, dict) and (url := entry.get("instrument"))
+            ]
         except Exception:
             return []
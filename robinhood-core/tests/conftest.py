@@ -0,0 +1,31 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from robinhood_core.cache import invalidate
+from robinhood_core.client import RobinhoodClient
+
+
+@pytest.fixture(autouse=True)
+def clear_service_caches(tmp_path, monkeypatch):
+    monkeypatch.setenv("RH_CACHE_DIR", str(tmp_path / "cache"))
+    invalidate()
+    yield
+    invalidate()
+
+
+@pytest.fixture
+def mock_client():
+    return MagicMock(spec=RobinhoodClient)
+
+
+@pytest.fixture(autouse=True)
+def isolate_client_sessions(tmp_path, monkeypatch):
+    # Logins recorded by other tests, or a real ~/.tokens pickle, must not
+    # let a client skip rh.login.
+    monkeypatch.setattr(
+        "robinhood_core.client._DEFAULT_PICKLE_DIR", tmp_path / "tokens"
+    )
+    RobinhoodClient._last_validated_at.clear()
+    yield
+    RobinhoodClient._last_validated_at.clear()
@@ -0,0 +1,162 @@
+# tests/unit/test_cache.py
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robinhood_core.cache import invalidate, peek, prime, ttl_cache
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.services.fundamentals import FundamentalsService
+
+
+def test_ttl_cache_reuses_result_until_expiry():
+    calls = []
+
+    @ttl_cache(60)
+    def fetch(symbols):
+        calls.append(symbols)
+        return [s.lower() for s in symbols]
+
+    assert fetch(["AAPL"]) == ["aapl"]
+    assert fetch(["AAPL"]) == ["aapl"]
+    assert fetch(["MSFT"]) == ["msft"]
+    assert calls == [["AAPL"], ["MSFT"]]
+
+    with patch("robinhood_core.cache.time.monotonic", return_value=1e12):
+        fetch(["AAPL"])
+    assert len(calls) == 3
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    calls = []
+
+    @ttl_cache(60, maxsize=2)
+    def fetch(symbol):
+        calls.append(symbol)
+        return symbol
+
+    fetch("A")
+    fetch("B")
+    fetch("A")
+    fetch("C")  # evicts B
+    fetch("A")
+    fetch("B")
+    assert calls == ["A", "B", "C", "B"]
+
+
+def test_ttl_cache_does_not_cache_errors():
+    calls = []
+
+    @ttl_cache(60)
+    def fetch(symbol):
+        calls.append(symbol)
+        raise ValueError(symbol)
+
+    for _ in range(2):
+        try:
+            fetch("AAPL")
+        except ValueError:
+            pass
+    assert len(calls) == 2
+
+
+def test_ttl_cache_shares_one_call_between_concurrent_misses():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @ttl_cache(60)
+    def fetch(symbol):
+        calls.append(symbol)
+        started.set()
+        release.wait(5)
+        return [symbol]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(fetch, "AAPL")
+        started.wait(5)
+        second = pool.submit(fetch, "AAPL")
+        release.set()
+        assert first.result() == second.result() == ["AAPL"]
+
+    assert calls == ["AAPL"]
+
+
+def test_ttl_cache_shares_errors_between_concurrent_misses():
+    started = threading.Event()
+    release = threading.Event()
+
+    @ttl_cache(60)
+    def fetch(symbol):
+        started.set()
+        release.wait(5)
+        raise ValueError(symbol)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(fetch, "AAPL")
+        started.wait(5)
+        second = pool.submit(fetch, "AAPL")
+        release.set()
+        for future in (first, second):
+            with pytest.raises(ValueError):
+                future.result()
+
+
+def test_invalidate_symbol():
+    calls = []
+
+    @ttl_cache(60)
+    def fetch(symbol):
+        calls.append(symbol)
+        return symbol
+
+    fetch("AAPL")
+    fetch("MSFT")
+    invalidate("aapl")
+    fetch("AAPL")
+    fetch("MSFT")
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_fundamentals_are_cached(mock_rh):
+    service = FundamentalsService(MagicMock(spec=RobinhoodClient))
+    mock_rh.get_fundamentals.return_value = [{"pe_ratio": "28.5"}]
+
+    assert service.get_fundamentals("AAPL").pe_ratio == 28.5
+    assert service.get_fundamentals("AAPL").pe_ratio == 28.5
+    mock_rh.get_fundamentals.assert_called_once_with("AAPL")
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_peek_reports_cached_calls_without_making_them(mock_rh):
+    service = FundamentalsService(MagicMock(spec=RobinhoodClient))
+    mock_rh.get_fundamentals.return_value = [{"pe_ratio": "28.5"}]
+
+    assert peek(service.get_fundamentals, "AAPL") == (False, None)
+    service.get_fundamentals("AAPL")
+    hit, fundamentals = peek(service.get_fundamentals, "AAPL")
+
+    assert hit
+    assert fundamentals.pe_ratio == 28.5
+    mock_rh.get_fundamentals.assert_called_once_with("AAPL")
+
+
+def test_peek_ignores_uncached_callables():
+    assert peek(MagicMock(), "AAPL") == (False, None)
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_prime_seeds_entries_for_peek_and_calls(mock_rh):
+    service = FundamentalsService(MagicMock(spec=RobinhoodClient))
+    cached = MagicMock()
+
+    assert prime(service.get_fundamentals, cached, "AAPL")
+    assert peek(service.get_fundamentals, "AAPL") == (True, cached)
+    assert service.get_fundamentals("AAPL") is cached
+    mock_rh.get_fundamentals.assert_not_called()
+
+
+def test_prime_ignores_uncached_callables():
+    assert not prime(MagicMock(), "value", "AAPL")
@@ -0,0 +1,67 @@
+# tests/unit/test_disk_cache.py
+from unittest.mock import MagicMock, patch
+
+from robinhood_core.cache import invalidate
+from robinhood_core.client import RobinhoodClient
+from robinhood_core.disk_cache import FileCache
+from robinhood_core.instruments import instrument_symbol
+from robinhood_core.services.fundamentals import FundamentalsService
+
+
+def test_file_cache_round_trip_and_expiry(tmp_path):
+    cache = FileCache(tmp_path / "cache.db")
+
+    cache.set("k", b"value", 60)
+    assert cache.get("k") == b"value"
+
+    cache.set("old", b"value", -1)
+    assert cache.get("old") is None
+    assert cache.get("missing") is None
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_fundamentals_survive_a_restart(mock_rh):
+    mock_rh.get_fundamentals.return_value = [{"pe_ratio": "28.5"}]
+    FundamentalsService(MagicMock(spec=RobinhoodClient)).get_fundamentals("AAPL")
+
+    # A fresh service with an empty in-memory cache, as after a restart.
+    invalidate()
+    service = FundamentalsService(MagicMock(spec=RobinhoodClient))
+    fundamentals = service.get_fundamentals("AAPL")
+
+    assert fundamentals.pe_ratio == 28.5
+    mock_rh.get_fundamentals.assert_called_once_with("AAPL")
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_disk_cache_can_be_disabled(mock_rh, monkeypatch):
+    monkeypatch.setenv("RH_DISK_CACHE", "0")
+    mock_rh.get_fundamentals.return_value = [{"pe_ratio": "28.5"}]
+
+    FundamentalsService(MagicMock(spec=RobinhoodClient)).get_fundamentals("AAPL")
+    FundamentalsService(MagicMock(spec=RobinhoodClient)).get_fundamentals("AAPL")
+
+    assert mock_rh.get_fundamentals.call_count == 2
+
+
+def test_instrument_symbols_survive_a_restart():
+    with patch("robinhood_core.instruments.rh") as mock_rh:
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+
+        assert instrument_symbol("u/abc/") == "AAPL"
+        invalidate()  # a new process starts with an empty memory cache
+        assert instrument_symbol("u/abc/") == "AAPL"
+
+        mock_rh.get_instrument_by_url.assert_called_once()
+
+
+@patch("robinhood_core.services.fundamentals.rh")
+def test_unwritable_cache_dir_is_a_miss(mock_rh, tmp_path, monkeypatch):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setenv("RH_CACHE_DIR", str(blocker / "cache"))
+    mock_rh.get_fundamentals.return_value = [{"pe_ratio": "28.5"}]
+
+    service = FundamentalsService(MagicMock(spec=RobinhoodClient))
+
+    assert service.get_fundamentals("AAPL").pe_ratio == 28.5
@@ -0,0 +1,43 @@
+from unittest.mock import patch
+
+from robinhood_core.instruments import resolve_symbol, resolve_symbols
+
+
+def test_resolve_symbols_dedupes_and_caches():
+    with patch("robinhood_core.instruments.rh") as mock_rh:
+        mock_rh.get_instrument_by_url.side_effect = lambda url: {
+            "symbol": "AAPL" if url.endswith("/abc/") else "MSFT"
+        }
+
+        first = resolve_symbols(["u/abc/", "u/def/", "u/abc/", None])
+        second = resolve_symbols(["u/def/"])
+
+        assert first == {"u/abc/": "AAPL", "u/def/": "MSFT"}
+        assert second == {"u/def/": "MSFT"}
+        assert mock_rh.get_instrument_by_url.call_count == 2
+
+
+def test_unresolved_instrument_is_not_cached():
+    with patch("robinhood_core.instruments.rh") as mock_rh:
+        mock_rh.get_instrument_by_url.side_effect = [None, {"symbol": "AAPL"}]
+
+        assert resolve_symbol("u/abc/") is None
+        assert resolve_symbol("u/abc/") == "AAPL"
+
+
+def test_symbols_resolve_when_the_disk_cache_fails():
+    with (
+        patch("robinhood_core.instruments.rh") as mock_rh,
+        patch(
+            "robinhood_core.disk_cache.FileCache.get",
+            side_effect=OSError("read-only"),
+        ),
+        patch(
+            "robinhood_core.disk_cache.FileCache.set",
+            side_effect=OSError("read-only"),
+        ),
+    ):
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+
+        assert resolve_symbol("u/abc/") == "AAPL"
+        mock_rh.get_instrument_by_url.assert_called_once_with("u/abc/")
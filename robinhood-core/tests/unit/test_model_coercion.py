@@ -92,3 +92,45 @@ def test_quote_accepts_integer_prices():
     quote = Quote(symbol="AAPL", last_price=150, timestamp="2026-02-11T10:00:00Z")
     assert quote.last_price == 150.0
     assert isinstance(quote.last_price, float)
+
+
+def test_coerced_field_types():
+    from pydantic import BaseModel
+
+    from robinhood_core.models.base import CoercedFloat, CoercedInt, CoercedTimestamp
+
+    class Row(BaseModel):
+        price: CoercedFloat = None
+        volume: CoercedInt = None
+        at: CoercedTimestamp = None
+
+    row = Row(price="1.25", volume="10.0", at="2026-02-11T10:00:00+00:00")
+    assert row.price == 1.25
+    assert row.volume == 10
+    assert row.at == "2026-02-11T10:00:00Z"
+    assert Row(price="bad", volume="", at="").model_dump() == {
+        "price": None,
+        "volume": None,
+        "at": None,
+    }
+
+
+def test_coercers_pass_through_native_types():
+    value = 150.5
+    assert coerce_numeric(value) is value
+    assert coerce_int(100) == 100
+    assert coerce_int(True) == 1
+    ts = "2026-02-11T10:00:00Z"
+    assert coerce_timestamp(ts) is ts
+
+
+def test_coerce_timestamp_normalizes_20_char_non_canonical_strings():
+    assert coerce_timestamp("2024-01-01 10:00:00Z") == "2024-01-01T10:00:00Z"
+
+
+def test_interned_enum_strings_are_shared():
+    from robinhood_core.models.orders import StockOrder
+
+    first = StockOrder(state="".join(["fill", "ed"]))
+    second = StockOrder(state="".join(["fill", "ed"]))
+    assert first.state is second.state
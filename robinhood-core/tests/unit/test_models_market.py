@@ -1,4 +1,4 @@
-from robinhood_core.models.market import Quote, Candle
+from robinhood_core.models.market import Quote, Candle, parse_candle_rows
 
 
 def test_quote_creation():
@@ -24,3 +24,22 @@ def test_candle_creation():
     )
     assert candle.open == 150.0
     assert candle.volume == 1000000
+
+
+def test_parse_candle_rows_reads_robinhood_keys():
+    candles = parse_candle_rows(
+        [
+            {
+                "begins_at": "2026-02-11T10:00:00Z",
+                "open_price": "150.00",
+                "high_price": "151.00",
+                "low_price": "149.00",
+                "close_price": "150.50",
+                "volume": 1000000,
+                "session": "reg",
+            }
+        ]
+    )
+    assert candles[0].timestamp == "2026-02-11T10:00:00Z"
+    assert candles[0].close == 150.5
+    assert candles[0].model_dump()["open"] == 150.0
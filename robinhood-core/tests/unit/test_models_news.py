@@ -11,3 +11,11 @@ def test_news_item_creation():
         published_at="2026-02-11T10:00:00Z",
     )
     assert item.headline == "Apple releases new product"
+
+
+def test_news_model_is_lazily_exported():
+    import robinhood_core.models as models
+    from robinhood_core.models.news import NewsItem as Direct
+
+    assert models.NewsItem is Direct
+    assert "NewsItem" in dir(models)
@@ -81,3 +81,42 @@ def test_option_contract_greeks_string_coercion():
     assert contract.strike == 150.0
     assert contract.delta == -0.45
     assert contract.implied_volatility == 0.30
+
+
+def test_parse_option_contract_rows():
+    from robinhood_core.models.options import parse_option_contract_rows
+
+    rows = parse_option_contract_rows(
+        [{"symbol": "AAPL", "strike": "150.00", "type": "call", "volume": "5"}]
+    )
+    assert rows == [{"symbol": "AAPL", "strike": 150.0, "type": "call", "volume": 5}]
+
+
+def test_option_contract_td_mirrors_the_model():
+    from typing import get_type_hints
+
+    from robinhood_core.models.options import OptionContractTD
+
+    model_hints = get_type_hints(OptionContract, include_extras=True)
+    td_hints = get_type_hints(OptionContractTD, include_extras=True)
+
+    assert set(td_hints) == set(OptionContract.model_fields)
+    for name, hint in td_hints.items():
+        assert hint == model_hints[name], name
+
+
+def test_parse_option_contracts():
+    from robinhood_core.models.options import OptionContract, parse_option_contracts
+
+    contracts = parse_option_contracts(
+        [
+            {
+                "symbol": "AAPL",
+                "expiration": "2026-03-20",
+                "strike": "150.00",
+                "type": "call",
+            }
+        ]
+    )
+    assert isinstance(contracts[0], OptionContract)
+    assert contracts[0].strike == 150.0
@@ -1,11 +1,14 @@
 import pytest
+from pydantic import ValidationError
 
 from robinhood_core.models.orders import (
     CryptoOrder,
+    OptionLeg,
     OptionOrder,
     OrderExecution,
     OrderHistory,
     StockOrder,
+    parse_order_history,
 )
 
 
@@ -67,6 +70,15 @@ class TestStockOrder:
         order = StockOrder()
         assert order.executions == []
 
+    def test_is_frozen(self):
+        order = StockOrder(symbol="AAPL")
+        with pytest.raises(ValidationError):
+            order.symbol = "MSFT"
+
+    def test_ignores_unknown_fields(self):
+        order = StockOrder(symbol="AAPL", ref_id="abc")
+        assert "ref_id" not in order.model_dump()
+
 
 class TestOptionOrder:
     def test_full_construction(self):
@@ -94,6 +106,33 @@ class TestOptionOrder:
         assert order.processed_quantity == 5.0
         assert order.processed_premium == 500.0
 
+    def test_legs_are_typed(self):
+        order = OptionOrder(
+            legs=[
+                {
+                    "side": "buy",
+                    "position_effect": "open",
+                    "ratio_quantity": 1,
+                    "option": "https://api.robinhood.com/options/instruments/abc/",
+                    "executions": [{"price": "3.50", "quantity": "1"}],
+                }
+            ]
+        )
+        leg = order.legs[0]
+        assert isinstance(leg, OptionLeg)
+        assert leg.side == "buy"
+        assert leg.ratio_quantity == 1
+        assert leg.executions[0].price == 3.5
+
+    def test_defaults_to_empty_legs(self):
+        assert OptionOrder().legs == []
+
+    def test_null_nested_lists_become_empty(self):
+        assert OptionOrder(legs=None).legs == []
+        order = OptionOrder(legs=[None, {"side": "buy", "executions": None}, "x"])
+        assert len(order.legs) == 1
+        assert order.legs[0].executions == []
+
 
 class TestCryptoOrder:
     def test_full_construction(self):
@@ -108,6 +147,16 @@ class TestCryptoOrder:
         assert order.quantity == 0.5
         assert order.price == 40000.0
 
+    def test_executions_are_typed(self):
+        order = CryptoOrder(executions=[{"price": "40000.00", "quantity": "0.5"}])
+        assert isinstance(order.executions[0], OrderExecution)
+        assert order.executions[0].quantity == 0.5
+
+    def test_null_executions_become_empty(self):
+        assert CryptoOrder(executions=None).executions == []
+        order = CryptoOrder(executions=[None, {"price": "1.00"}])
+        assert [e.price for e in order.executions] == [1.0]
+
 
 class TestOrderHistory:
     def test_empty_defaults(self):
@@ -127,3 +176,55 @@ class TestOrderHistory:
         assert len(dumped["option_orders"]) == 1
         assert len(dumped["crypto_orders"]) == 1
         assert dumped["stock_orders"][0]["symbol"] == "AAPL"
+        assert "orders" not in dumped
+        for key in ("stock_orders", "option_orders", "crypto_orders"):
+            assert "asset_class" not in dumped[key][0]
+
+    def test_orders_dispatch_on_asset_class(self):
+        history = OrderHistory(
+            orders=[
+                {"asset_class": "option", "id": "o1"},
+                {"asset_class": "stock", "id": "s1"},
+                {"asset_class": "crypto", "id": "c1"},
+            ]
+        )
+        assert [type(o) for o in history.orders] == [
+            OptionOrder,
+            StockOrder,
+            CryptoOrder,
+        ]
+        assert [o.id for o in history.stock_orders] == ["s1"]
+        assert [o.id for o in history.option_orders] == ["o1"]
+        assert [o.id for o in history.crypto_orders] == ["c1"]
+
+    def test_json_round_trip(self):
+        history = OrderHistory(
+            stock_orders=[StockOrder(id="s1")],
+            crypto_orders=[{"id": "c1", "price": "1.5"}],
+        )
+        assert OrderHistory.model_validate_json(history.model_dump_json()) == history
+
+
+class TestParseOrderHistory:
+    def test_validates_raw_rows(self):
+        history = parse_order_history(
+            stock=[
+                {
+                    "id": "s1",
+                    "symbol": "AAPL",
+                    "quantity": "10",
+                    "executions": [{"price": "150.25", "quantity": "10"}],
+                    "instrument": "https://api.robinhood.com/instruments/abc/",
+                }
+            ],
+            option=[{"id": "o1", "chain_symbol": "SPY", "premium": "350.00"}],
+            crypto=[{"id": "c1", "price": "40000.00"}],
+        )
+        assert history.stock_orders[0].quantity == 10.0
+        assert history.stock_orders[0].executions[0].price == 150.25
+        assert history.option_orders[0].premium == 350.0
+        assert history.crypto_orders[0].price == 40000.0
+
+    def test_defaults_to_empty(self):
+        history = parse_order_history()
+        assert history == OrderHistory()
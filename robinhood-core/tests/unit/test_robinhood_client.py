@@ -136,14 +136,14 @@ def test_robinhood_client_exported():
     assert AuthRequiredError is not None
 
 
-def test_ensure_session_calls_rh_login():
+def test_ensure_session_calls_rh_login(tmp_path):
     """rh.login is called with correct kwargs including pickle_path."""
     from robinhood_core.client import RobinhoodClient
 
     client = RobinhoodClient(
         username="user",
         password="pass",
-        session_path="/tmp/sessions",
+        session_path=str(tmp_path),
     )
 
     with patch("robinhood_core.client.rh") as mock_rh:
@@ -154,7 +154,7 @@ def test_ensure_session_calls_rh_login():
             username="user",
             password="pass",
             store_session=True,
-            pickle_path="/tmp/sessions",
+            pickle_path=str(tmp_path),
         )
         assert result is client
         assert client._authenticated is True
@@ -257,6 +257,19 @@ def test_ensure_session_challenge_exception():
             client.ensure_session()
 
 
+def test_ensure_session_challenge_exception_mixed_case():
+    """Challenge detection is case-insensitive."""
+    from robinhood_core.client import RobinhoodClient
+    from robinhood_core.errors import AuthRequiredError
+
+    client = RobinhoodClient(username="user", password="pass")
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+        mock_rh.login.side_effect = Exception("Verification CHALLENGE issued")
+        with pytest.raises(AuthRequiredError, match="challenge"):
+            client.ensure_session()
+
+
 def test_ensure_session_network_exception():
     """NetworkError raised on generic exception."""
     from robinhood_core.client import RobinhoodClient
@@ -344,18 +357,18 @@ def test_no_save_session_or_load_session_methods():
     assert not hasattr(client, "_is_session_valid")
 
 
-def test_ensure_session_tries_pickle_when_no_credentials():
+def test_ensure_session_tries_pickle_when_no_credentials(tmp_path):
     """When no credentials are given but session_path is set, try the pickle."""
     from robinhood_core.client import RobinhoodClient
     from unittest.mock import patch
 
     with patch("robinhood_core.client.rh.login", return_value={"access_token": "tok"}) as mock_login:
-        client = RobinhoodClient(session_path="/tmp/fake_session")
+        client = RobinhoodClient(session_path=str(tmp_path))
         client.ensure_session()
         assert client._authenticated is True
         # Note: store_session=True is required for robin_stocks to load from pickle
         mock_login.assert_called_once_with(
-            pickle_path="/tmp/fake_session",
+            pickle_path=str(tmp_path),
             store_session=True,
         )
 
@@ -367,3 +380,126 @@ def test_ensure_session_raises_when_no_credentials_no_session_path():
     client = RobinhoodClient()  # no credentials, no session path
     with pytest.raises(AuthRequiredError):
         client.ensure_session()
+
+
+def test_get_shared_client_reuses_instance():
+    from robinhood_core.client import get_shared_client
+
+    get_shared_client.cache_clear()
+    first = get_shared_client(username="user", password="pass")
+    assert get_shared_client(username="user", password="pass") is first
+    assert get_shared_client(username="other", password="pass") is not first
+    get_shared_client.cache_clear()
+
+
+def test_ensure_session_reuses_recently_validated_pickle(tmp_path):
+    """A second client on the same pickle skips rh.login within the TTL."""
+    from robinhood_core.client import RobinhoodClient
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+
+        def fake_login(**kwargs):
+            (tmp_path / "robinhood.pickle").write_bytes(b"token")
+            return {"access_token": "tok"}
+
+        mock_rh.login.side_effect = fake_login
+        RobinhoodClient(session_path=str(tmp_path)).ensure_session()
+        second = RobinhoodClient(session_path=str(tmp_path))
+        second.ensure_session()
+
+        assert mock_rh.login.call_count == 1
+        assert second._authenticated is True
+
+        second.logout()
+        RobinhoodClient(
+            username="user", password="pass", session_path=str(tmp_path)
+        ).ensure_session()
+        assert mock_rh.login.call_count == 2
+
+
+def test_recent_login_is_not_reused_with_other_credentials(tmp_path):
+    """A client with different credentials on the same pickle logs in itself."""
+    from robinhood_core.client import RobinhoodClient
+    from robinhood_core.errors import AuthRequiredError
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+
+        def fake_login(**kwargs):
+            (tmp_path / "robinhood.pickle").write_bytes(b"token")
+            return {"access_token": "tok"} if kwargs["password"] == "pass" else None
+
+        mock_rh.login.side_effect = fake_login
+        RobinhoodClient(
+            username="user", password="pass", session_path=str(tmp_path)
+        ).ensure_session()
+
+        with pytest.raises(AuthRequiredError):
+            RobinhoodClient(
+                username="user", password="wrong", session_path=str(tmp_path)
+            ).ensure_session()
+        assert mock_rh.login.call_count == 2
+
+
+def test_ensure_session_concurrent_calls_login_once():
+    """Threads racing on one client share a single rh.login call."""
+    import threading
+    import time
+
+    from robinhood_core.client import RobinhoodClient
+
+    client = RobinhoodClient(username="user", password="pass")
+
+    def slow_login(**kwargs):
+        time.sleep(0.05)
+        return {"access_token": "tok"}
+
+    with patch("robinhood_core.client.rh") as mock_rh:
+        mock_rh.login.side_effect = slow_login
+        threads = [
+            threading.Thread(target=client.ensure_session) for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert mock_rh.login.call_count == 1
+        assert client._authenticated is True
+
+
+def test_client_mounts_pooled_http_adapter():
+    from robin_stocks.robinhood.globals import SESSION
+    from robinhood_core.client import RobinhoodClient
+
+    RobinhoodClient(username="u", password="p")
+
+    adapter = SESSION.get_adapter("https://api.robinhood.com/quotes/")
+    assert adapter._pool_maxsize == 48
+    assert adapter.max_retries.total == 2
+
+
+def test_http_pool_covers_every_worker_thread(monkeypatch):
+    from robinhood_core import instruments
+    from robinhood_core.client import _LIBRARY_HTTP_THREADS, _http_pool_maxsize
+    from robinhood_core.services import (
+        market_data,
+        news,
+        options,
+        orders,
+        portfolio,
+        watchlists,
+    )
+
+    pools = [
+        instruments._lookup_pool,
+        news._news_pool,
+        options._lookup_pool,
+        orders._order_type_pool,
+        portfolio._profile_pool,
+        market_data._quote_pool,
+        watchlists._watchlist_pool,
+    ]
+    assert sum(pool._max_workers for pool in pools) <= _LIBRARY_HTTP_THREADS
+
+    monkeypatch.setenv("RH_MAX_WORKERS", "4")
+    assert _http_pool_maxsize() == 4 + _LIBRARY_HTTP_THREADS
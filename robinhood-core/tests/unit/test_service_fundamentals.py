@@ -86,6 +86,8 @@ def test_get_fundamentals_empty_response():
         assert fundamentals.dividend_yield is None
         assert fundamentals.week_52_high is None
         assert fundamentals.week_52_low is None
+        # Unknown symbols share one frozen empty instance.
+        assert service.get_fundamentals("NOPE") is fundamentals
 
 
 def test_get_fundamentals_api_error():
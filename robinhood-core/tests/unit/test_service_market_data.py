@@ -37,6 +37,7 @@ def test_get_current_price_single_symbol(mock_rh):
 
     quotes = service.get_current_price(["AAPL"])
 
+    mock_rh.get_quotes.assert_called_once_with(["AAPL"])
     assert len(quotes) == 1
     assert quotes[0].symbol == "AAPL"
     assert quotes[0].last_price == 150.50
@@ -71,6 +72,23 @@ def test_get_current_price_multiple_symbols(mock_rh):
     assert len(quotes) == 2
     assert quotes[0].symbol == "AAPL"
     assert quotes[1].symbol == "GOOGL"
+    mock_rh.get_quotes.assert_called_once_with(["AAPL", "GOOGL"])
+
+
+@patch("robinhood_core.services.market_data.rh")
+def test_get_current_price_batches_long_symbol_lists(mock_rh):
+    service = MarketDataService(MagicMock(spec=RobinhoodClient))
+    mock_rh.get_quotes.side_effect = lambda symbols: [
+        {"symbol": s, "last_trade_price": "1.00", "updated_at": "2026-02-11T10:00:00Z"}
+        for s in symbols
+    ]
+    symbols = [f"S{i}" for i in range(80)]
+
+    quotes = service.get_current_price(symbols)
+
+    batch_sizes = sorted(len(c.args[0]) for c in mock_rh.get_quotes.call_args_list)
+    assert batch_sizes == [5, 75]
+    assert [q.symbol for q in quotes] == symbols
 
 
 @patch("robinhood_core.services.market_data.rh")
@@ -207,3 +225,116 @@ def test_get_price_history_no_data(mock_rh):
     candles = service.get_price_history("AAPL")
 
     assert len(candles) == 0
+
+
+@pytest.mark.asyncio
+@patch("robinhood_core.services.market_data.rh")
+async def test_get_current_price_async_coalesces_concurrent_calls(mock_rh):
+    import asyncio
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = MarketDataService(mock_client)
+
+    mock_rh.get_quotes.return_value = [
+        {
+            "symbol": "AAPL",
+            "last_trade_price": "150.50",
+            "updated_at": "2026-02-11T10:00:00Z",
+        },
+        {
+            "symbol": "GOOGL",
+            "last_trade_price": "2800.00",
+            "updated_at": "2026-02-11T10:00:00Z",
+        },
+    ]
+
+    aapl, both = await asyncio.gather(
+        service.get_current_price_async(["aapl"]),
+        service.get_current_price_async(["GOOGL", "AAPL"]),
+    )
+
+    assert [q.symbol for q in aapl] == ["AAPL"]
+    assert [q.symbol for q in both] == ["GOOGL", "AAPL"]
+    mock_rh.get_quotes.assert_called_once_with(["AAPL", "GOOGL"])
+
+
+@pytest.mark.asyncio
+async def test_quote_batcher_holds_its_task_until_done():
+    import asyncio
+    import threading
+
+    from robinhood_core.services.market_data import _QuoteBatcher
+
+    release = threading.Event()
+    batcher = _QuoteBatcher(lambda symbols: release.wait(5) and [], window=0)
+    request = asyncio.ensure_future(batcher.get(["AAPL"]))
+    while not batcher._tasks:
+        await asyncio.sleep(0)
+
+    release.set()
+    assert await request == []
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert not batcher._tasks
+
+
+@pytest.mark.asyncio
+@patch("robinhood_core.services.market_data.rh")
+async def test_get_current_price_async_propagates_errors(mock_rh):
+    from robinhood_core.errors import RobinhoodAPIError
+
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = MarketDataService(mock_client)
+    mock_rh.get_quotes.side_effect = Exception("boom")
+
+    with pytest.raises(RobinhoodAPIError):
+        await service.get_current_price_async(["AAPL"])
+
+
+@pytest.mark.asyncio
+@patch("robinhood_core.services.market_data.rh")
+async def test_prime_quotes_serves_single_symbol_lookups(mock_rh):
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = MarketDataService(mock_client)
+    mock_rh.get_quotes.return_value = [
+        {
+            "symbol": "AAPL",
+            "last_trade_price": "150.50",
+            "updated_at": "2026-02-11T10:00:00Z",
+        },
+        {
+            "symbol": "GOOGL",
+            "last_trade_price": "2800.00",
+            "updated_at": "2026-02-11T10:00:00Z",
+        },
+    ]
+
+    service.prime_quotes(service.get_current_price(["AAPL", "GOOGL"]))
+    quotes = await service.get_current_price_async(["googl"])
+
+    assert [q.last_price for q in quotes] == [2800.00]
+    mock_rh.get_quotes.assert_called_once_with(["AAPL", "GOOGL"])
+
+
+@pytest.mark.asyncio
+@patch("robinhood_core.services.market_data.rh")
+async def test_primed_quotes_outlive_the_quote_ttl(mock_rh):
+    service = MarketDataService(MagicMock(spec=RobinhoodClient))
+    mock_rh.get_quotes.return_value = [
+        {
+            "symbol": "AAPL",
+            "last_trade_price": "150.50",
+            "updated_at": "2026-02-11T10:00:00Z",
+        },
+    ]
+
+    with patch("robinhood_core.cache.time.monotonic", return_value=1000.0):
+        service.prime_quotes(service.get_current_price(["AAPL"]), ttl=15)
+    # Past the 2s quote TTL, but inside the priming TTL.
+    with patch("robinhood_core.cache.time.monotonic", return_value=1005.0):
+        quotes = await service.get_current_price_async(["AAPL"])
+        assert [q.last_price for q in quotes] == [150.50]
+        mock_rh.get_quotes.assert_called_once()
+    with patch("robinhood_core.cache.time.monotonic", return_value=1016.0):
+        service.get_current_price(["AAPL"])
+    assert mock_rh.get_quotes.call_count == 2
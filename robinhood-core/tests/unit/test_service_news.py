@@ -118,3 +118,36 @@ def test_get_news_skips_non_dict_items():
 
         assert len(items) == 1
         assert items[0].headline == "Valid Item"
+
+
+def test_get_news_many_fetches_each_symbol_once():
+    mock_client = MagicMock(spec=RobinhoodClient)
+    service = NewsService(mock_client)
+
+    def fake_news(symbol):
+        return [
+            {
+                "uuid": f"{symbol}-1",
+                "title": f"{symbol} headline",
+                "published_at": "2026-02-11T10:00:00Z",
+            }
+        ]
+
+    with patch("robinhood_core.services.news.rh") as mock_rh:
+        mock_rh.get_news.side_effect = fake_news
+
+        news = service.get_news_many(["AAPL", "MSFT", "AAPL"])
+
+        assert list(news) == ["AAPL", "MSFT"]
+        assert news["MSFT"][0].id == "MSFT-1"
+        assert sorted(c.args[0] for c in mock_rh.get_news.call_args_list) == [
+            "AAPL",
+            "MSFT",
+        ]
+
+
+def test_get_news_many_requires_symbols():
+    service = NewsService(MagicMock(spec=RobinhoodClient))
+
+    with pytest.raises(InvalidArgumentError):
+        service.get_news_many([])
@@ -1,8 +1,9 @@
 # tests/unit/test_service_option_positions.py
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock
 from robinhood_core.services.options import OptionsService
-from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import RobinhoodAPIError
 
 
@@ -23,176 +24,167 @@ MOCK_INSTRUMENT = {
     "chain_symbol": "AAPL",
 }
 
+# MOCK_POSITION joined with MOCK_INSTRUMENT, as the service should return it.
+EXPECTED_POSITION = {
+    "symbol": "AAPL",
+    "strike_price": 150.0,
+    "expiration_date": "2026-03-20",
+    "option_type": "put",
+    "direction": "short",
+    "quantity": 2.0,
+    "average_price": 3.5,
+    "created_at": "2025-01-15T10:00:00Z",
+    "updated_at": "2025-02-01T15:30:00Z",
+}
+
+MOCK_POSITION_TSLA = {
+    "option": "https://api.robinhood.com/options/instruments/def-456/",
+    "chain_symbol": "TSLA",
+    "type": "long",
+    "quantity": "1.0000",
+    "average_price": "12.0000",
+    "created_at": "2025-02-01T09:00:00Z",
+    "updated_at": "2025-02-10T12:00:00Z",
+}
+
+MOCK_INSTRUMENT_TSLA = {
+    "strike_price": "250.0000",
+    "expiration_date": "2026-04-17",
+    "type": "call",
+    "chain_symbol": "TSLA",
+}
+
+EXPECTED_POSITION_TSLA = {
+    "symbol": "TSLA",
+    "strike_price": 250.0,
+    "expiration_date": "2026-04-17",
+    "option_type": "call",
+    "direction": "long",
+    "quantity": 1.0,
+    "average_price": 12.0,
+    "created_at": "2025-02-01T09:00:00Z",
+    "updated_at": "2025-02-10T12:00:00Z",
+}
 
-def test_get_option_positions_success():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
-        mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
+# The robin_stocks functions these tests stub out.
+_RH_API = [
+    "get_open_option_positions",
+    "get_option_instrument_data_by_id",
+]
 
-        positions = service.get_option_positions()
 
-        assert len(positions) == 1
-        pos = positions[0]
-        assert pos.symbol == "AAPL"
-        assert pos.strike_price == 150.0
-        assert pos.expiration_date == "2026-03-20"
-        assert pos.option_type == "put"
-        assert pos.direction == "short"
-        assert pos.quantity == 2.0
-        assert pos.average_price == 3.5
-        assert pos.created_at == "2025-01-15T10:00:00Z"
-        assert pos.updated_at == "2025-02-01T15:30:00Z"
+@pytest.fixture
+def service(mock_client):
+    return OptionsService(mock_client)
 
-        mock_rh.get_open_option_positions.assert_called_once()
-        mock_rh.get_option_instrument_data_by_id.assert_called_once_with("abc-123")
 
+@pytest.fixture
+def mock_rh(monkeypatch):
+    # A plain Mock limited to _RH_API: cheaper than a MagicMock, and a call
+    # to any other rh function fails loudly instead of returning a mock.
+    mock_rh = Mock(spec=_RH_API)
+    monkeypatch.setattr("robinhood_core.services.options.rh", mock_rh)
+    return mock_rh
 
-def test_get_option_positions_empty():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = []
+def test_get_option_positions_success(service, mock_rh):
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
+    mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
 
-        positions = service.get_option_positions()
-        assert positions == []
+    positions = service.get_option_positions()
 
+    assert len(positions) == 1
+    assert positions[0].model_dump(include=EXPECTED_POSITION.keys()) == (
+        EXPECTED_POSITION
+    )
 
-def test_get_option_positions_none_response():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+    mock_rh.get_open_option_positions.assert_called_once()
+    mock_rh.get_option_instrument_data_by_id.assert_called_once_with("abc-123")
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = None
 
-        positions = service.get_option_positions()
-        assert positions == []
+@pytest.mark.parametrize("response", [[], None])
+def test_get_option_positions_empty(service, mock_rh, response):
+    mock_rh.get_open_option_positions.return_value = response
 
+    positions = service.get_option_positions()
+    assert positions == []
 
-def test_get_option_positions_none_items_filtered():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [None, MOCK_POSITION, None]
-        mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
+def test_get_option_positions_none_items_filtered(service, mock_rh):
+    mock_rh.get_open_option_positions.return_value = [None, MOCK_POSITION, None]
+    mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
 
-        positions = service.get_option_positions()
-        assert len(positions) == 1
-        assert positions[0].symbol == "AAPL"
+    positions = service.get_option_positions()
+    assert len(positions) == 1
+    assert positions[0].symbol == "AAPL"
 
 
-def test_get_option_positions_instrument_resolve_failure():
+def test_get_option_positions_instrument_resolve_failure(service, mock_rh):
     """When instrument resolution fails, position still returned with partial data."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
-        mock_rh.get_option_instrument_data_by_id.side_effect = Exception("503 Error")
-
-        positions = service.get_option_positions()
-
-        assert len(positions) == 1
-        pos = positions[0]
-        # Symbol comes from chain_symbol on the position itself
-        assert pos.symbol == "AAPL"
-        assert pos.direction == "short"
-        assert pos.quantity == 2.0
-        # These are None because instrument resolution failed
-        assert pos.strike_price is None
-        assert pos.expiration_date is None
-        assert pos.option_type is None
-
-
-def test_get_option_positions_multiple():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
-    position_2 = {
-        "option": "https://api.robinhood.com/options/instruments/def-456/",
-        "chain_symbol": "TSLA",
-        "type": "long",
-        "quantity": "1.0000",
-        "average_price": "12.0000",
-        "created_at": "2025-02-01T09:00:00Z",
-        "updated_at": "2025-02-10T12:00:00Z",
-    }
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
+    mock_rh.get_option_instrument_data_by_id.side_effect = Exception("503 Error")
 
-    instrument_2 = {
-        "strike_price": "250.0000",
-        "expiration_date": "2026-04-17",
-        "type": "call",
-        "chain_symbol": "TSLA",
-    }
+    positions = service.get_option_positions()
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [MOCK_POSITION, position_2]
-        mock_rh.get_option_instrument_data_by_id.side_effect = [
-            MOCK_INSTRUMENT,
-            instrument_2,
-        ]
+    assert len(positions) == 1
+    pos = positions[0]
+    # Symbol comes from chain_symbol on the position itself
+    assert pos.symbol == "AAPL"
+    assert pos.direction == "short"
+    assert pos.quantity == 2.0
+    # These are None because instrument resolution failed
+    assert pos.strike_price is None
+    assert pos.expiration_date is None
+    assert pos.option_type is None
 
-        positions = service.get_option_positions()
 
-        assert len(positions) == 2
-        assert positions[0].symbol == "AAPL"
-        assert positions[0].strike_price == 150.0
-        assert positions[0].option_type == "put"
-        assert positions[1].symbol == "TSLA"
-        assert positions[1].strike_price == 250.0
-        assert positions[1].option_type == "call"
-        assert positions[1].direction == "long"
+def test_get_option_positions_multiple(service, mock_rh):
+    mock_rh.get_open_option_positions.return_value = [
+        MOCK_POSITION,
+        MOCK_POSITION_TSLA,
+    ]
+    instruments = {"abc-123": MOCK_INSTRUMENT, "def-456": MOCK_INSTRUMENT_TSLA}
+    mock_rh.get_option_instrument_data_by_id.side_effect = instruments.get
 
+    positions = service.get_option_positions()
 
-def test_get_option_positions_calls_ensure_session():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+    assert [p.model_dump(include=EXPECTED_POSITION.keys()) for p in positions] == [
+        EXPECTED_POSITION,
+        EXPECTED_POSITION_TSLA,
+    ]
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = []
 
-        service.get_option_positions()
+def test_get_option_positions_calls_ensure_session(service, mock_client, mock_rh):
+    mock_rh.get_open_option_positions.return_value = []
 
-        mock_client.ensure_session.assert_called_once()
+    service.get_option_positions()
 
+    mock_client.ensure_session.assert_called_once()
 
-def test_get_option_positions_api_error():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.side_effect = Exception("API Error")
+def test_get_option_positions_api_error(service, mock_rh):
+    mock_rh.get_open_option_positions.side_effect = Exception("API Error")
 
-        with pytest.raises(RobinhoodAPIError, match="Failed to fetch option positions"):
-            service.get_option_positions()
+    with pytest.raises(RobinhoodAPIError, match="Failed to fetch option positions"):
+        service.get_option_positions()
 
 
-def test_get_option_positions_string_values_coerced():
+def test_get_option_positions_string_values_coerced(service, mock_rh):
     """Test that string numeric values from API are properly coerced."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
+    mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
-        mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
+    positions = service.get_option_positions()
 
-        positions = service.get_option_positions()
+    pos = positions[0]
+    assert isinstance(pos.quantity, float)
+    assert isinstance(pos.average_price, float)
+    assert isinstance(pos.strike_price, float)
 
-        pos = positions[0]
-        assert isinstance(pos.quantity, float)
-        assert isinstance(pos.average_price, float)
-        assert isinstance(pos.strike_price, float)
 
-
-def test_get_option_positions_no_option_url():
+def test_get_option_positions_no_option_url(service, mock_rh):
     """Test position with missing option URL still processes."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
     position_no_url = {
         "option": None,
         "chain_symbol": "SPY",
@@ -203,13 +195,58 @@ def test_get_option_positions_no_option_url():
         "updated_at": None,
     }
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_open_option_positions.return_value = [position_no_url]
+    mock_rh.get_open_option_positions.return_value = [position_no_url]
+
+    positions = service.get_option_positions()
+
+    assert len(positions) == 1
+    assert positions[0].symbol == "SPY"
+    assert positions[0].direction == "long"
+    assert positions[0].strike_price is None
+    assert positions[0].expiration_date is None
+
+
+def test_get_option_positions_fetches_instruments_concurrently(service, mock_rh):
+    position_2 = dict(
+        MOCK_POSITION,
+        option="https://api.robinhood.com/options/instruments/def-456/",
+    )
+    # Both lookups must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def mock_get_instrument(option_id):
+        barrier.wait()
+        if option_id == "def-456":
+            raise Exception("503 Error")
+        return MOCK_INSTRUMENT
+
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION, position_2]
+    mock_rh.get_option_instrument_data_by_id.side_effect = mock_get_instrument
+
+    positions = service.get_option_positions()
+
+    # A failed lookup leaves only that position unresolved.
+    assert [p.strike_price for p in positions] == [150.0, None]
+    assert [p.symbol for p in positions] == ["AAPL", "AAPL"]
+
+
+def test_get_option_positions_caches_instruments(service, mock_rh):
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
+    mock_rh.get_option_instrument_data_by_id.return_value = MOCK_INSTRUMENT
+
+    service.get_option_positions()
+    positions = service.get_option_positions()
+
+    assert positions[0].strike_price == 150.0
+    mock_rh.get_option_instrument_data_by_id.assert_called_once_with("abc-123")
+
 
-        positions = service.get_option_positions()
+def test_get_option_positions_does_not_cache_missing_instruments(service, mock_rh):
+    mock_rh.get_open_option_positions.return_value = [MOCK_POSITION]
+    mock_rh.get_option_instrument_data_by_id.side_effect = [
+        None,
+        MOCK_INSTRUMENT,
+    ]
 
-        assert len(positions) == 1
-        assert positions[0].symbol == "SPY"
-        assert positions[0].direction == "long"
-        assert positions[0].strike_price is None
-        assert positions[0].expiration_date is None
+    assert service.get_option_positions()[0].strike_price is None
+    assert service.get_option_positions()[0].strike_price == 150.0
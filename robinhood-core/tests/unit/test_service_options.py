@@ -1,9 +1,9 @@
 # tests/unit/test_service_options.py
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import Mock
 
 import pytest
 
-from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import (
     InvalidArgumentError,
     RobinhoodAPIError,
@@ -54,139 +54,127 @@ MOCK_MARKET_DATA = [
     ]
 ]
 
+# MOCK_MARKET_DATA's numbers after coercion to floats.
+EXPECTED_MARKET_DATA = {
+    "bid": 5.50,
+    "ask": 5.75,
+    "mark_price": 5.625,
+    "implied_volatility": 0.3245,
+    "delta": 0.55,
+    "gamma": 0.025,
+    "theta": -0.05,
+    "vega": 0.2,
+    "rho": 0.08,
+    "chance_of_profit_short": 0.45,
+}
 
-# -- Tests: initialisation & validation -----------------------------
-
-
-def test_service_initialization():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-    assert service.client == mock_client
-
-
-def test_get_options_chain_requires_symbol():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
-    with pytest.raises(InvalidArgumentError, match="Symbol is required"):
-        service.get_options_chain("")
-
-
-def test_get_options_chain_calls_ensure_session():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = []
-        mock_rh.get_latest_price.return_value = [None]
-
-        service.get_options_chain("AAPL", "2026-03-20")
-
-        mock_client.ensure_session.assert_called_once()
+# The robin_stocks functions these tests stub out.
+_RH_API = [
+    "find_tradable_options",
+    "get_chains",
+    "get_latest_price",
+    "get_option_market_data",
+]
 
 
-# -- Tests: chain listing (no strike_price) -------------------------
+@pytest.fixture
+def service(mock_client):
+    return OptionsService(mock_client)
 
 
-def test_chain_listing_with_expiration_date():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+@pytest.fixture
+def mock_rh(monkeypatch):
+    # A plain Mock limited to _RH_API: cheaper than a MagicMock, and a call
+    # to any other rh function fails loudly instead of returning a mock.
+    mock_rh = Mock(spec=_RH_API)
+    # Defaults for chain listings; tests override them as needed.
+    mock_rh.get_latest_price.return_value = ["150.00"]
+    mock_rh.find_tradable_options.return_value = []
+    monkeypatch.setattr("robinhood_core.services.options.rh", mock_rh)
+    return mock_rh
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = [
-            MOCK_INSTRUMENT_CALL,
-            MOCK_INSTRUMENT_PUT,
-        ]
-        mock_rh.get_latest_price.return_value = ["152.00"]
 
-        contracts = service.get_options_chain("AAPL", "2026-03-20")
+# -- Tests: initialisation & validation -----------------------------
 
-        assert len(contracts) == 2
-        assert contracts[0].symbol == "AAPL"
-        assert contracts[0].strike == 150.0
-        assert contracts[0].type == "call"
-        assert contracts[0].expiration == "2026-03-20"
-        # Instrument data has no bid/ask/greeks
-        assert contracts[0].bid is None
-        assert contracts[0].delta is None
 
-        assert contracts[1].strike == 155.0
-        assert contracts[1].type == "put"
+def test_service_initialization(service, mock_client):
+    assert service.client == mock_client
 
-        mock_rh.find_tradable_options.assert_called_once_with(
-            "AAPL", expirationDate="2026-03-20", optionType=None
-        )
 
+def test_get_options_chain_requires_symbol(service):
+    with pytest.raises(InvalidArgumentError, match="Symbol is required"):
+        service.get_options_chain("")
 
-def test_chain_listing_with_option_type():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
-        mock_rh.get_latest_price.return_value = ["150.00"]
+def test_get_options_chain_calls_ensure_session(service, mock_client, mock_rh):
+    mock_rh.get_latest_price.return_value = [None]
 
-        contracts = service.get_options_chain("AAPL", "2026-03-20", option_type="call")
+    service.get_options_chain("AAPL", "2026-03-20")
 
-        assert len(contracts) == 1
-        assert contracts[0].type == "call"
-        mock_rh.find_tradable_options.assert_called_once_with(
-            "AAPL", expirationDate="2026-03-20", optionType="call"
-        )
+    mock_client.ensure_session.assert_called_once()
 
 
-def test_chain_listing_resolves_nearest_expiration():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+# -- Tests: chain listing (no strike_price) -------------------------
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_chains.return_value = {
-            "expiration_dates": ["2026-03-20", "2026-04-17"]
-        }
-        mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
-        mock_rh.get_latest_price.return_value = ["150.00"]
 
-        contracts = service.get_options_chain("AAPL")
+@pytest.mark.parametrize("option_type", [None, "call", "put"])
+def test_chain_listing_with_option_type(service, mock_rh, option_type):
+    listed = [
+        item
+        for item in (MOCK_INSTRUMENT_CALL, MOCK_INSTRUMENT_PUT)
+        if option_type in (None, item["type"])
+    ]
+    mock_rh.find_tradable_options.return_value = listed
+    mock_rh.get_latest_price.return_value = ["152.00"]
 
-        assert len(contracts) == 1
-        assert contracts[0].expiration == "2026-03-20"
+    contracts = service.get_options_chain(
+        "AAPL", "2026-03-20", option_type=option_type
+    )
 
-        mock_rh.get_chains.assert_called_once_with("AAPL")
-        mock_rh.find_tradable_options.assert_called_once_with(
-            "AAPL", expirationDate="2026-03-20", optionType=None
-        )
+    assert [(c.strike, c.type) for c in contracts] == [
+        (float(item["strike_price"]), item["type"]) for item in listed
+    ]
+    for contract in contracts:
+        assert contract.symbol == "AAPL"
+        assert contract.expiration == "2026-03-20"
+        # Instrument data has no bid/ask/greeks
+        assert contract.bid is None
+        assert contract.delta is None
 
+    mock_rh.find_tradable_options.assert_called_once_with(
+        "AAPL", expirationDate="2026-03-20", optionType=option_type
+    )
 
-def test_chain_listing_empty_expirations():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_chains.return_value = {"expiration_dates": []}
+def test_chain_listing_resolves_nearest_expiration(service, mock_rh):
+    mock_rh.get_chains.return_value = {
+        "expiration_dates": ["2026-03-20", "2026-04-17"]
+    }
+    mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
 
-        contracts = service.get_options_chain("AAPL")
+    contracts = service.get_options_chain("AAPL")
 
-        assert len(contracts) == 0
-        mock_rh.find_tradable_options.assert_not_called()
+    assert len(contracts) == 1
+    assert contracts[0].expiration == "2026-03-20"
 
+    mock_rh.get_chains.assert_called_once_with("AAPL")
+    mock_rh.find_tradable_options.assert_called_once_with(
+        "AAPL", expirationDate="2026-03-20", optionType=None
+    )
 
-def test_chain_listing_chains_returns_none():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_chains.return_value = None
+@pytest.mark.parametrize("chains", [{"expiration_dates": []}, None])
+def test_chain_listing_no_expirations(service, mock_rh, chains):
+    mock_rh.get_chains.return_value = chains
 
-        contracts = service.get_options_chain("AAPL")
+    contracts = service.get_options_chain("AAPL")
 
-        assert len(contracts) == 0
+    assert len(contracts) == 0
+    mock_rh.find_tradable_options.assert_not_called()
 
 
-def test_chain_listing_near_the_money_filter():
+def test_chain_listing_near_the_money_filter(service, mock_rh):
     """Strikes outside ±20% of current price are filtered out."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
     far_otm = {
         "chain_symbol": "TEST",
         "strike_price": "200.00",
@@ -198,21 +186,17 @@ def test_chain_listing_near_the_money_filter():
         "type": "call",
     }
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = [far_otm, near_money]
-        mock_rh.get_latest_price.return_value = ["100.00"]
+    mock_rh.find_tradable_options.return_value = [far_otm, near_money]
+    mock_rh.get_latest_price.return_value = ["100.00"]
 
-        contracts = service.get_options_chain("TEST", "2026-03-20", option_type="call")
+    contracts = service.get_options_chain("TEST", "2026-03-20", option_type="call")
 
-        assert len(contracts) == 1
-        assert contracts[0].strike == 100.0
+    assert len(contracts) == 1
+    assert contracts[0].strike == 100.0
 
 
-def test_chain_listing_no_price_skips_filter():
+def test_chain_listing_no_price_skips_filter(service, mock_rh):
     """If current price unavailable, all strikes returned."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
     far_otm = {
         "chain_symbol": "TEST",
         "strike_price": "200.00",
@@ -224,124 +208,203 @@ def test_chain_listing_no_price_skips_filter():
         "type": "call",
     }
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = [far_otm, near_money]
-        mock_rh.get_latest_price.return_value = [None]
-
-        contracts = service.get_options_chain("TEST", "2026-03-20")
+    mock_rh.find_tradable_options.return_value = [far_otm, near_money]
+    mock_rh.get_latest_price.return_value = [None]
 
-        assert len(contracts) == 2
+    contracts = service.get_options_chain("TEST", "2026-03-20")
 
+    assert len(contracts) == 2
 
-def test_chain_listing_skips_none_items():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.return_value = [
-            None,
-            MOCK_INSTRUMENT_CALL,
-            None,
-        ]
-        mock_rh.get_latest_price.return_value = ["150.00"]
+def test_chain_listing_skips_none_items(service, mock_rh):
+    mock_rh.find_tradable_options.return_value = [
+        None,
+        MOCK_INSTRUMENT_CALL,
+        None,
+    ]
 
-        contracts = service.get_options_chain("AAPL", "2026-03-20")
+    contracts = service.get_options_chain("AAPL", "2026-03-20")
 
-        assert len(contracts) == 1
-        assert contracts[0].strike == 150.0
+    assert len(contracts) == 1
+    assert contracts[0].strike == 150.0
 
 
 # -- Tests: targeted lookup (with strike_price) ---------------------
 
 
-def test_targeted_lookup_with_greeks():
+def test_targeted_lookup_with_greeks(service, mock_rh):
     """strike_price uses get_option_market_data for full greeks."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
-
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_option_market_data.return_value = MOCK_MARKET_DATA
-
-        contracts = service.get_options_chain(
-            "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
-        )
-
-        assert len(contracts) == 1
-        c = contracts[0]
-        assert c.bid == 5.50
-        assert c.ask == 5.75
-        assert c.mark_price == 5.625
-        assert c.implied_volatility == 0.3245
-        assert c.delta == 0.55
-        assert c.gamma == 0.025
-        assert c.theta == -0.05
-        assert c.vega == 0.2
-        assert c.rho == 0.08
-        assert c.chance_of_profit_short == 0.45
-
-        mock_rh.get_option_market_data.assert_called_once_with(
-            "AAPL",
-            expirationDate="2026-03-20",
-            strikePrice="150.00",
-            optionType="call",
-        )
-        # Should NOT use find_tradable_options for targeted lookup
-        mock_rh.find_tradable_options.assert_not_called()
-
-
-def test_targeted_lookup_both_types():
-    """No option_type fetches both call and put."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+    mock_rh.get_option_market_data.return_value = MOCK_MARKET_DATA
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_option_market_data.return_value = MOCK_MARKET_DATA
+    contracts = service.get_options_chain(
+        "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
+    )
 
-        service.get_options_chain("AAPL", "2026-03-20", strike_price="150.00")
+    assert len(contracts) == 1
+    assert contracts[0].model_dump(include=EXPECTED_MARKET_DATA.keys()) == (
+        EXPECTED_MARKET_DATA
+    )
 
-        # Called twice: once for call, once for put
-        assert mock_rh.get_option_market_data.call_count == 2
+    mock_rh.get_option_market_data.assert_called_once_with(
+        "AAPL",
+        expirationDate="2026-03-20",
+        strikePrice="150.00",
+        optionType="call",
+    )
+    # Should NOT use find_tradable_options for targeted lookup
+    mock_rh.find_tradable_options.assert_not_called()
 
 
-def test_targeted_lookup_empty_result():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+def test_options_chain_raw_matches_models(service, mock_rh):
+    """get_options_chain_raw returns the same data as plain dicts."""
+    mock_rh.get_option_market_data.return_value = MOCK_MARKET_DATA
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_option_market_data.return_value = None
+    rows = service.get_options_chain_raw(
+        "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
+    )
+    contracts = service.get_options_chain(
+        "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
+    )
 
-        contracts = service.get_options_chain(
-            "AAPL", "2026-03-20", option_type="call", strike_price="999.00"
-        )
+    assert isinstance(rows[0], dict)
+    assert rows[0]["bid"] == 5.50
+    assert rows == [c.model_dump() for c in contracts]
 
-        assert len(contracts) == 0
 
+def test_targeted_lookup_both_types(service, mock_rh):
+    """No option_type fetches both call and put."""
+    mock_rh.get_option_market_data.return_value = MOCK_MARKET_DATA
+
+    service.get_options_chain("AAPL", "2026-03-20", strike_price="150.00")
 
-def test_targeted_lookup_none_entries():
-    """None entries in market data are skipped."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+    # Called twice: once for call, once for put
+    assert mock_rh.get_option_market_data.call_count == 2
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.get_option_market_data.return_value = [[None]]
 
-        contracts = service.get_options_chain(
-            "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
-        )
+def test_targeted_lookup_fetches_call_and_put_concurrently(service, mock_rh):
+    # Both requests must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
 
-        assert len(contracts) == 0
+    def mock_market_data(symbol, expirationDate, strikePrice, optionType):
+        barrier.wait()
+        return [[{"chain_symbol": symbol, "delta": "0.5"}]]
+
+    mock_rh.get_option_market_data.side_effect = mock_market_data
+
+    contracts = service.get_options_chain(
+        "AAPL", "2026-03-20", strike_price="150.00"
+    )
+
+    assert [c.type for c in contracts] == ["call", "put"]
+    assert all(c.strike == 150.0 for c in contracts)
+
+
+@pytest.mark.parametrize("market_data", [None, [[None]]])
+def test_targeted_lookup_empty_result(service, mock_rh, market_data):
+    """A missing result, or None entries in it, yield no contracts."""
+    mock_rh.get_option_market_data.return_value = market_data
+
+    contracts = service.get_options_chain(
+        "AAPL", "2026-03-20", option_type="call", strike_price="150.00"
+    )
+
+    assert len(contracts) == 0
 
 
 # -- Tests: error handling ------------------------------------------
 
 
-def test_api_error_wrapped():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = OptionsService(mock_client)
+def test_api_error_wrapped(service, mock_rh):
+    mock_rh.find_tradable_options.side_effect = Exception("API Error")
+    mock_rh.get_latest_price.return_value = [None]
+
+    with pytest.raises(RobinhoodAPIError, match="Failed to fetch options chain"):
+        service.get_options_chain("AAPL", "2026-03-20")
+
+
+def test_chain_listing_caches_current_price(service, mock_rh):
+    mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
+    mock_rh.get_latest_price.return_value = ["152.00"]
+
+    service.get_options_chain("AAPL", "2026-03-20")
+    service.get_options_chain("AAPL", "2026-03-20", "call")
+
+    mock_rh.get_latest_price.assert_called_once_with("AAPL")
+
+
+def test_chain_listing_fetches_price_alongside_listing(service, mock_rh):
+    # Both requests must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def mock_find_tradable_options(symbol, expirationDate, optionType):
+        barrier.wait()
+        return [MOCK_INSTRUMENT_CALL]
+
+    def mock_latest_price(symbol):
+        barrier.wait()
+        return ["152.00"]
+
+    mock_rh.find_tradable_options.side_effect = mock_find_tradable_options
+    mock_rh.get_latest_price.side_effect = mock_latest_price
+
+    contracts = service.get_options_chain("AAPL", "2026-03-20")
+
+    assert [c.strike for c in contracts] == [150.0]
+
+
+def test_contract_row_defaults_and_fallbacks():
+    row = OptionsService._contract_row(
+        {"strike_price": "150.00", "type": "call", "mark_price": "1.25"},
+        "AAPL",
+        "2026-03-20",
+    )
+
+    assert row["symbol"] == "AAPL"
+    assert row["expiration"] == "2026-03-20"
+    assert row["strike"] == "150.00"
+    assert row["type"] == "call"
+    assert row["mark_price"] == "1.25"
+    assert row["delta"] is None
+
+    row = OptionsService._contract_row(
+        {"chain_symbol": None, "type": "weird", "adjusted_mark_price": "1.30"},
+        "AAPL",
+        "2026-03-20",
+    )
+
+    # A key that is present (even as None) wins over the default.
+    assert row["symbol"] is None
+    assert row["type"] == "put"
+    assert row["mark_price"] == "1.30"
+
+
+def test_chain_listing_caches_tradable_options(service, mock_rh):
+    mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
+    mock_rh.get_latest_price.return_value = ["152.00"]
+
+    service.get_options_chain("AAPL", "2026-03-20", "call")
+    contracts = service.get_options_chain("AAPL", "2026-03-20", "call")
+    service.get_options_chain("AAPL", "2026-03-20", "put")
+
+    assert [c.strike for c in contracts] == [150.0]
+    assert mock_rh.find_tradable_options.call_count == 2
+
+
+def test_chain_listing_caches_get_chains(service, mock_rh):
+    mock_rh.get_chains.return_value = {"expiration_dates": ["2026-03-20"]}
+    mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL]
+
+    service.get_options_chain("AAPL")
+    service.get_options_chain("AAPL", option_type="call")
+
+    mock_rh.get_chains.assert_called_once_with("AAPL")
+
+
+def test_chain_listing_without_near_the_money_skips_price(service, mock_rh):
+    far_otm = {**MOCK_INSTRUMENT_CALL, "strike_price": "400.00"}
+    mock_rh.find_tradable_options.return_value = [MOCK_INSTRUMENT_CALL, far_otm]
 
-    with patch("robinhood_core.services.options.rh") as mock_rh:
-        mock_rh.find_tradable_options.side_effect = Exception("API Error")
-        mock_rh.get_latest_price.return_value = [None]
+    contracts = service.get_options_chain("AAPL", "2026-03-20", near_the_money=False)
 
-        with pytest.raises(RobinhoodAPIError, match="Failed to fetch options chain"):
-            service.get_options_chain("AAPL", "2026-03-20")
+    assert [c.strike for c in contracts] == [150.0, 400.0]
+    mock_rh.get_latest_price.assert_not_called()
@@ -1,8 +1,8 @@
-from unittest.mock import MagicMock, patch
+import threading
+from unittest.mock import Mock, patch
 
 import pytest
 
-from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import InvalidArgumentError, RobinhoodAPIError
 from robinhood_core.services.orders import OrdersService
 
@@ -70,213 +70,248 @@ MOCK_CRYPTO_ORDER = {
     "time_in_force": "gtc",
 }
 
+# robin_stocks fetch for each order type, in history order.
+_ORDER_FETCHES = (
+    "get_all_stock_orders",
+    "get_all_option_orders",
+    "get_all_crypto_orders",
+)
 
-def _make_service():
-    client = MagicMock(spec=RobinhoodClient)
-    return OrdersService(client), client
 
+# The robin_stocks functions these tests stub out (get_instrument_by_url is
+# reached through robinhood_core.instruments).
+_RH_API = [
+    "get_all_stock_orders",
+    "get_all_option_orders",
+    "get_all_crypto_orders",
+    "get_instrument_by_url",
+]
 
-class TestInit:
-    def test_service_initialization(self):
-        service, client = _make_service()
-        assert service.client == client
-
-
-class TestGetOrderHistory:
-    def test_calls_ensure_session(self):
-        service, client = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
-            mock_rh.get_all_option_orders.return_value = []
-            mock_rh.get_all_crypto_orders.return_value = []
-            service.get_order_history()
-            client.ensure_session.assert_called_once()
-
-    def test_invalid_order_type_raises(self):
-        service, _ = _make_service()
-        with pytest.raises(InvalidArgumentError, match="Invalid order type"):
-            service.get_order_history(order_type="invalid")
-
-    def test_all_types_returned(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
-            mock_rh.get_all_crypto_orders.return_value = [MOCK_CRYPTO_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
-            history = service.get_order_history()
+@pytest.fixture
+def service(mock_client):
+    return OrdersService(mock_client)
 
-            assert len(history.stock_orders) == 1
-            assert len(history.option_orders) == 1
-            assert len(history.crypto_orders) == 1
 
-    def test_stock_only(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+@pytest.fixture
+def mock_rh():
+    """Patch ``rh`` for the service and the shared instrument resolver."""
+    mock_rh = Mock(spec=_RH_API)
+    with patch("robinhood_core.services.orders.rh", mock_rh), patch(
+        "robinhood_core.instruments.rh", mock_rh
+    ):
+        yield mock_rh
 
-            history = service.get_order_history(order_type="stock")
 
-            assert len(history.stock_orders) == 1
-            assert history.option_orders == []
-            assert history.crypto_orders == []
-            mock_rh.get_all_option_orders.assert_not_called()
-            mock_rh.get_all_crypto_orders.assert_not_called()
-
-    def test_option_only(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
-
-            history = service.get_order_history(order_type="option")
-
-            assert history.stock_orders == []
-            assert len(history.option_orders) == 1
-            assert history.crypto_orders == []
-
-    def test_crypto_only(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_crypto_orders.return_value = [MOCK_CRYPTO_ORDER]
-
-            history = service.get_order_history(order_type="crypto")
-
-            assert history.stock_orders == []
-            assert history.option_orders == []
-            assert len(history.crypto_orders) == 1
+class TestInit:
+    def test_service_initialization(self, service, mock_client):
+        assert service.client == mock_client
 
-    def test_none_defaults_to_all(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
-            mock_rh.get_all_option_orders.return_value = []
-            mock_rh.get_all_crypto_orders.return_value = []
 
-            service.get_order_history(order_type=None)
+class TestGetOrderHistory:
+    def test_calls_ensure_session(self, service, mock_client, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = []
+        mock_rh.get_all_option_orders.return_value = []
+        mock_rh.get_all_crypto_orders.return_value = []
+        service.get_order_history()
+        mock_client.ensure_session.assert_called_once()
+
+    def test_invalid_order_type_raises(self, service):
+        with pytest.raises(InvalidArgumentError, match="Invalid order type"):
+            service.get_order_history(order_type="invalid")
 
-            mock_rh.get_all_stock_orders.assert_called_once()
-            mock_rh.get_all_option_orders.assert_called_once()
-            mock_rh.get_all_crypto_orders.assert_called_once()
+    def test_all_types_returned(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+        mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
+        mock_rh.get_all_crypto_orders.return_value = [MOCK_CRYPTO_ORDER]
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+
+        history = service.get_order_history()
+
+        assert len(history.stock_orders) == 1
+        assert len(history.option_orders) == 1
+        assert len(history.crypto_orders) == 1
+
+    @pytest.mark.parametrize(
+        "order_type,fetch,order",
+        [
+            ("stock", "get_all_stock_orders", MOCK_STOCK_ORDER),
+            ("option", "get_all_option_orders", MOCK_OPTION_ORDER),
+            ("crypto", "get_all_crypto_orders", MOCK_CRYPTO_ORDER),
+        ],
+    )
+    def test_single_type(self, service, mock_rh, order_type, fetch, order):
+        getattr(mock_rh, fetch).return_value = [order]
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+
+        history = service.get_order_history(order_type=order_type)
+
+        assert [o.id for o in history.orders] == [order["id"]]
+        assert len(getattr(history, f"{order_type}_orders")) == 1
+        for other in _ORDER_FETCHES:
+            if other != fetch:
+                getattr(mock_rh, other).assert_not_called()
+
+    # Crypto orders have no start_date filter, so it is not passed on.
+    @pytest.mark.parametrize(
+        "order_type,fetch,expected_kwargs",
+        [
+            ("stock", "get_all_stock_orders", {"start_date": "2026-01-01"}),
+            ("option", "get_all_option_orders", {"start_date": "2026-01-01"}),
+            ("crypto", "get_all_crypto_orders", {}),
+        ],
+    )
+    def test_start_date(self, service, mock_rh, order_type, fetch, expected_kwargs):
+        getattr(mock_rh, fetch).return_value = []
+
+        service.get_order_history(order_type=order_type, start_date="2026-01-01")
+
+        getattr(mock_rh, fetch).assert_called_once_with(**expected_kwargs)
+
+    def test_null_legs_and_executions(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = []
+        mock_rh.get_all_option_orders.return_value = [
+            {**MOCK_OPTION_ORDER, "legs": None}
+        ]
+        mock_rh.get_all_crypto_orders.return_value = [
+            {**MOCK_CRYPTO_ORDER, "executions": None}
+        ]
+
+        history = service.get_order_history()
+
+        assert history.option_orders[0].legs == []
+        assert history.crypto_orders[0].executions == []
+
+    def test_none_defaults_to_all(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = []
+        mock_rh.get_all_option_orders.return_value = []
+        mock_rh.get_all_crypto_orders.return_value = []
+
+        service.get_order_history(order_type=None)
+
+        mock_rh.get_all_stock_orders.assert_called_once()
+        mock_rh.get_all_option_orders.assert_called_once()
+        mock_rh.get_all_crypto_orders.assert_called_once()
+
+    def test_all_fetches_order_types_concurrently(self, service, mock_rh):
+        # All three requests must be in flight at once to get past the barrier.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(rows):
+            def wait(*args, **kwargs):
+                barrier.wait()
+                return rows
+
+            return wait
+
+        mock_rh.get_all_stock_orders.side_effect = fetch([MOCK_STOCK_ORDER])
+        mock_rh.get_all_option_orders.side_effect = fetch([MOCK_OPTION_ORDER])
+        mock_rh.get_all_crypto_orders.side_effect = fetch([MOCK_CRYPTO_ORDER])
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+
+        history = service.get_order_history()
+
+        assert [o.id for o in history.orders] == [
+            "stock-001",
+            "option-001",
+            "crypto-001",
+        ]
+
+    def test_all_propagates_background_errors(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = []
+        mock_rh.get_all_option_orders.side_effect = Exception("503 Error")
+        mock_rh.get_all_crypto_orders.return_value = []
+
+        with pytest.raises(RobinhoodAPIError, match="503 Error"):
+            service.get_order_history()
 
 
 class TestStockOrders:
-    def test_symbol_filter(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+    @pytest.mark.parametrize("symbol,expected", [("MSFT", []), ("AAPL", ["AAPL"])])
+    def test_symbol_filter(self, service, mock_rh, symbol, expected):
+        mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
-            history = service.get_order_history(order_type="stock", symbol="MSFT")
+        history = service.get_order_history(order_type="stock", symbol=symbol)
 
-            assert len(history.stock_orders) == 0
+        assert [o.symbol for o in history.stock_orders] == expected
 
-    def test_symbol_filter_matches(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+    def test_execution_parsing(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
-            history = service.get_order_history(order_type="stock", symbol="AAPL")
+        history = service.get_order_history(order_type="stock")
 
-            assert len(history.stock_orders) == 1
-            assert history.stock_orders[0].symbol == "AAPL"
+        order = history.stock_orders[0]
+        assert len(order.executions) == 1
+        assert order.executions[0].price == 150.25
+        assert order.executions[0].quantity == 10.0
 
-    def test_start_date_passed_through(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = []
+    def test_skips_none_items(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = [None, MOCK_STOCK_ORDER, None]
+        mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
-            service.get_order_history(order_type="stock", start_date="2026-01-01")
+        history = service.get_order_history(order_type="stock")
 
-            mock_rh.get_all_stock_orders.assert_called_once_with(
-                start_date="2026-01-01"
-            )
+        assert len(history.stock_orders) == 1
 
-    def test_execution_parsing(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+    def test_empty_response(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = None
 
-            history = service.get_order_history(order_type="stock")
+        history = service.get_order_history(order_type="stock")
 
-            order = history.stock_orders[0]
-            assert len(order.executions) == 1
-            assert order.executions[0].price == 150.25
-            assert order.executions[0].quantity == 10.0
+        assert history.stock_orders == []
 
-    def test_skips_none_items(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = [None, MOCK_STOCK_ORDER, None]
-            mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
+    def test_resolves_each_instrument_once(self, service, mock_rh):
+        msft_order = {
+            **MOCK_STOCK_ORDER,
+            "id": "stock-002",
+            "instrument": "https://api.robinhood.com/instruments/def/",
+        }
+        mock_rh.get_all_stock_orders.return_value = [
+            MOCK_STOCK_ORDER,
+            msft_order,
+            MOCK_STOCK_ORDER,
+        ]
+        mock_rh.get_instrument_by_url.side_effect = lambda url: {
+            "symbol": "AAPL" if url.endswith("/abc/") else "MSFT"
+        }
 
-            history = service.get_order_history(order_type="stock")
+        history = service.get_order_history(order_type="stock")
+        service.get_order_history(order_type="stock")
 
-            assert len(history.stock_orders) == 1
+        assert [o.symbol for o in history.stock_orders] == [
+            "AAPL",
+            "MSFT",
+            "AAPL",
+        ]
+        # Two distinct instruments, and the second history call is cached.
+        assert mock_rh.get_instrument_by_url.call_count == 2
 
-    def test_empty_response(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.return_value = None
+    def test_unresolved_instrument_leaves_symbol_empty(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.return_value = [MOCK_STOCK_ORDER]
+        mock_rh.get_instrument_by_url.side_effect = Exception("503 Error")
 
-            history = service.get_order_history(order_type="stock")
+        history = service.get_order_history(order_type="stock")
 
-            assert history.stock_orders == []
+        assert history.stock_orders[0].symbol is None
 
 
 class TestOptionOrders:
-    def test_symbol_filter(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
-
-            history = service.get_order_history(order_type="option", symbol="MSFT")
-
-            assert len(history.option_orders) == 0
-
-    def test_symbol_filter_matches(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
+    @pytest.mark.parametrize("symbol,expected", [("MSFT", []), ("AAPL", ["AAPL"])])
+    def test_symbol_filter(self, service, mock_rh, symbol, expected):
+        mock_rh.get_all_option_orders.return_value = [MOCK_OPTION_ORDER]
 
-            history = service.get_order_history(order_type="option", symbol="AAPL")
+        history = service.get_order_history(order_type="option", symbol=symbol)
 
-            assert len(history.option_orders) == 1
-            assert history.option_orders[0].chain_symbol == "AAPL"
-
-    def test_start_date_passed_through(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_option_orders.return_value = []
-
-            service.get_order_history(order_type="option", start_date="2026-01-01")
-
-            mock_rh.get_all_option_orders.assert_called_once_with(
-                start_date="2026-01-01"
-            )
-
-
-class TestCryptoOrders:
-    def test_start_date_not_passed(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_crypto_orders.return_value = []
-
-            service.get_order_history(order_type="crypto", start_date="2026-01-01")
-
-            mock_rh.get_all_crypto_orders.assert_called_once_with()
+        assert [o.chain_symbol for o in history.option_orders] == expected
 
 
 class TestErrorHandling:
-    def test_api_error_wrapped(self):
-        service, _ = _make_service()
-        with patch("robinhood_core.services.orders.rh") as mock_rh:
-            mock_rh.get_all_stock_orders.side_effect = Exception("API Error")
-
-            with pytest.raises(
-                RobinhoodAPIError, match="Failed to fetch order history"
-            ):
-                service.get_order_history(order_type="stock")
+    def test_api_error_wrapped(self, service, mock_rh):
+        mock_rh.get_all_stock_orders.side_effect = Exception("API Error")
+
+        with pytest.raises(
+            RobinhoodAPIError, match="Failed to fetch order history"
+        ):
+            service.get_order_history(order_type="stock")
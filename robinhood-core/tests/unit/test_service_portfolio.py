@@ -1,21 +1,56 @@
 # tests/unit/test_service_portfolio.py
+import threading
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 from robinhood_core.services.portfolio import PortfolioService
-from robinhood_core.client import RobinhoodClient
+from robinhood_core.errors import RobinhoodAPIError
 
 
-def test_service_initialization():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
+# The robin_stocks functions these tests stub out (get_instrument_by_url is
+# reached through robinhood_core.instruments).
+_RH_API = [
+    "load_portfolio_profile",
+    "load_account_profile",
+    "get_open_stock_positions",
+    "get_quotes",
+    "get_instrument_by_url",
+]
+
+
+@pytest.fixture
+def mock_rh():
+    """Patch ``rh`` for the service and the shared quote and instrument helpers."""
+    mock_rh = Mock(spec=_RH_API)
+    with patch("robinhood_core.services.portfolio.rh", mock_rh), patch(
+        "robinhood_core.services.market_data.rh", mock_rh
+    ), patch("robinhood_core.instruments.rh", mock_rh):
+        yield mock_rh
+
+
+@pytest.fixture
+def service(mock_client):
+    return PortfolioService(mock_client)
+
+
+def test_service_initialization(service, mock_client):
     assert service.client == mock_client
 
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_portfolio_summary_success(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
+@pytest.mark.parametrize("method", ["get_portfolio_summary", "get_positions"])
+def test_calls_ensure_session(service, mock_client, mock_rh, method):
+    mock_rh.load_portfolio_profile.return_value = {"equity": "0.00"}
+    mock_rh.load_account_profile.return_value = {
+        "cash": "0.00",
+        "buying_power": "0.00",
+    }
+    mock_rh.get_open_stock_positions.return_value = []
+
+    getattr(service, method)()
 
+    mock_client.ensure_session.assert_called_once()
+
+
+def test_get_portfolio_summary_success(service, mock_rh):
     mock_rh.load_portfolio_profile.return_value = {
         "equity": "10000.50",
         "equity_previous_close": "9975.00",
@@ -27,21 +62,16 @@ def test_get_portfolio_summary_success(mock_rh):
 
     summary = service.get_portfolio_summary()
 
-    mock_client.ensure_session.assert_called_once()
     mock_rh.load_portfolio_profile.assert_called_once()
     mock_rh.load_account_profile.assert_called_once()
     assert summary.equity == 10000.50
     assert summary.cash == 2500.00
     assert summary.buying_power == 12500.00
-    assert summary.day_change == pytest.approx(25.50)
-    assert summary.unrealized_pl == pytest.approx(25.50)
+    assert summary.day_change == 25.5
+    assert summary.unrealized_pl == 25.5
 
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_portfolio_summary_missing_previous_close(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
-
+def test_get_portfolio_summary_missing_previous_close(service, mock_rh):
     mock_rh.load_portfolio_profile.return_value = {
         "equity": "10000.50",
         "equity_previous_close": None,
@@ -58,174 +88,128 @@ def test_get_portfolio_summary_missing_previous_close(mock_rh):
     assert summary.unrealized_pl is None
 
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_portfolio_summary_api_error(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
-
+def test_get_portfolio_summary_api_error(service, mock_rh):
     mock_rh.load_portfolio_profile.side_effect = Exception("API Error")
 
-    from robinhood_core.errors import RobinhoodAPIError
-
     with pytest.raises(RobinhoodAPIError, match="Failed to fetch portfolio"):
         service.get_portfolio_summary()
 
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_positions_success(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
-
-    # Mock positions data
-    mock_rh.get_open_stock_positions.return_value = [
-        {
-            "instrument": "https://api.robinhood.com/instruments/123/",
-            "quantity": "100.0000",
-            "average_buy_price": "145.00",
-        },
-        {
-            "instrument": "https://api.robinhood.com/instruments/456/",
-            "quantity": "50.0000",
-            "average_buy_price": "200.00",
-        },
-    ]
-
-    # Mock instrument lookup
-    def mock_get_instrument(url):
-        if "123" in url:
-            return {"symbol": "AAPL"}
-        elif "456" in url:
-            return {"symbol": "GOOGL"}
-        return None
-
-    mock_rh.get_instrument_by_url.side_effect = mock_get_instrument
-
-    # Mock quotes
-    mock_rh.get_quotes.return_value = [
-        {"symbol": "AAPL", "last_trade_price": "150.00"},
-        {"symbol": "GOOGL", "last_trade_price": "210.00"},
-    ]
-
-    positions = service.get_positions()
-
-    mock_client.ensure_session.assert_called_once()
-    assert len(positions) == 2
-
-    assert positions[0].symbol == "AAPL"
-    assert positions[0].quantity == 100.0
-    assert positions[0].average_cost == 145.00
-    assert positions[0].market_value == pytest.approx(15000.00)  # 100 * 150
-    assert positions[0].unrealized_pl == pytest.approx(500.00)  # 15000 - (100 * 145)
-
-    assert positions[1].symbol == "GOOGL"
-    assert positions[1].quantity == 50.0
-    assert positions[1].average_cost == 200.00
-    assert positions[1].market_value == pytest.approx(10500.00)  # 50 * 210
-    assert positions[1].unrealized_pl == pytest.approx(500.00)  # 10500 - (50 * 200)
+_AAPL_URL = "https://api.robinhood.com/instruments/123/"
+_GOOGL_URL = "https://api.robinhood.com/instruments/456/"
+
+_POSITIONS_TWO = (
+    {
+        "instrument": _AAPL_URL,
+        "quantity": "100.0000",
+        "average_buy_price": "145.00",
+    },
+    {
+        "instrument": _GOOGL_URL,
+        "quantity": "50.0000",
+        "average_buy_price": "200.00",
+    },
+)
+_SYMBOLS_BY_URL = {_AAPL_URL: "AAPL", _GOOGL_URL: "GOOGL"}
+_AAPL_QUOTE = {"symbol": "AAPL", "last_trade_price": "150.00"}
+_GOOGL_QUOTE = {"symbol": "GOOGL", "last_trade_price": "210.00"}
+
+
+@pytest.mark.parametrize(
+    "positions,symbols_by_url,quotes,filter_symbols,expected",
+    [
+        (
+            _POSITIONS_TWO,
+            _SYMBOLS_BY_URL,
+            [_AAPL_QUOTE, _GOOGL_QUOTE],
+            None,
+            # market_value = quantity * last price; unrealized_pl subtracts cost
+            [
+                ("AAPL", 100.0, 145.0, 15000.0, 500.0),
+                ("GOOGL", 50.0, 200.0, 10500.0, 500.0),
+            ],
+        ),
+        (
+            _POSITIONS_TWO,
+            _SYMBOLS_BY_URL,
+            [_AAPL_QUOTE],
+            ["AAPL"],
+            [("AAPL", 100.0, 145.0, 15000.0, 500.0)],
+        ),
+        # No known symbols, so there is nothing to quote
+        (_POSITIONS_TWO[:1], {}, [], None, [("UNKNOWN", 100.0, 145.0, None, None)]),
+        # A None quote entry (can happen with the Robinhood API) leaves the
+        # computed fields empty
+        (
+            _POSITIONS_TWO[:1],
+            {_AAPL_URL: "AAPL"},
+            [None],
+            None,
+            [("AAPL", 100.0, 145.0, None, None)],
+        ),
+    ],
+    ids=["success", "with_filter", "unknown_symbol", "quote_unavailable"],
+)
+def test_get_positions(
+    service, mock_rh, positions, symbols_by_url, quotes, filter_symbols, expected
+):
+    mock_rh.get_open_stock_positions.return_value = list(positions)
+    mock_rh.get_instrument_by_url.side_effect = lambda url: (
+        {"symbol": symbols_by_url[url]} if url in symbols_by_url else None
+    )
+    mock_rh.get_quotes.return_value = quotes
+
+    result = service.get_positions(symbols=filter_symbols)
+
+    assert [
+        (p.symbol, p.quantity, p.average_cost, p.market_value, p.unrealized_pl)
+        for p in result
+    ] == expected
+
+
+def test_get_positions_api_error(service, mock_rh):
+    mock_rh.get_open_stock_positions.side_effect = Exception("API Error")
 
+    with pytest.raises(RobinhoodAPIError, match="Failed to fetch positions"):
+        service.get_positions()
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_positions_with_filter(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
 
-    # Mock positions data
-    mock_rh.get_open_stock_positions.return_value = [
-        {
-            "instrument": "https://api.robinhood.com/instruments/123/",
-            "quantity": "100.0000",
-            "average_buy_price": "145.00",
-        },
-        {
-            "instrument": "https://api.robinhood.com/instruments/456/",
-            "quantity": "50.0000",
-            "average_buy_price": "200.00",
-        },
-    ]
+def test_get_positions_resolves_instruments_concurrently(service, mock_rh):
+    mock_rh.get_open_stock_positions.return_value = list(_POSITIONS_TWO)
+    # Both lookups must be in flight at once to get past the barrier.
+    barrier = threading.Barrier(2, timeout=5)
 
     def mock_get_instrument(url):
-        if "123" in url:
-            return {"symbol": "AAPL"}
-        elif "456" in url:
-            return {"symbol": "GOOGL"}
-        return None
+        barrier.wait()
+        return {"symbol": _SYMBOLS_BY_URL[url]}
 
     mock_rh.get_instrument_by_url.side_effect = mock_get_instrument
-
-    # Mock quotes (only AAPL since filter excludes GOOGL)
-    mock_rh.get_quotes.return_value = [
-        {"symbol": "AAPL", "last_trade_price": "150.00"},
-    ]
-
-    # Filter for only AAPL
-    positions = service.get_positions(symbols=["AAPL"])
-
-    assert len(positions) == 1
-    assert positions[0].symbol == "AAPL"
-    assert positions[0].market_value == pytest.approx(15000.00)
-
-
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_positions_unknown_symbol(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
-
-    mock_rh.get_open_stock_positions.return_value = [
-        {
-            "instrument": "https://api.robinhood.com/instruments/123/",
-            "quantity": "100.0000",
-            "average_buy_price": "145.00",
-        }
-    ]
-
-    mock_rh.get_instrument_by_url.return_value = None
-
-    # No known symbols, so get_quotes won't be called
     mock_rh.get_quotes.return_value = []
 
     positions = service.get_positions()
 
-    assert len(positions) == 1
-    assert positions[0].symbol == "UNKNOWN"
-    assert positions[0].market_value is None
-    assert positions[0].unrealized_pl is None
-
+    assert [p.symbol for p in positions] == ["AAPL", "GOOGL"]
 
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_positions_quote_unavailable(mock_rh):
-    """Positions with no matching quote should have None for computed fields."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
 
+def test_get_positions_batches_large_quote_requests(service, mock_rh):
     mock_rh.get_open_stock_positions.return_value = [
         {
-            "instrument": "https://api.robinhood.com/instruments/123/",
-            "quantity": "100.0000",
-            "average_buy_price": "145.00",
+            "instrument": f"https://api.robinhood.com/instruments/{i}/",
+            "quantity": "1",
+            "average_buy_price": "10.00",
         }
+        for i in range(80)
+    ]
+    mock_rh.get_instrument_by_url.side_effect = lambda url: {
+        "symbol": f"S{url.rstrip('/').rsplit('/', 1)[-1]}"
+    }
+    mock_rh.get_quotes.side_effect = lambda symbols: [
+        {"symbol": s, "last_trade_price": "11.00"} for s in symbols
     ]
-
-    mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
-
-    # Quote returns None entry (can happen with Robinhood API)
-    mock_rh.get_quotes.return_value = [None]
 
     positions = service.get_positions()
 
-    assert len(positions) == 1
-    assert positions[0].symbol == "AAPL"
-    assert positions[0].market_value is None
-    assert positions[0].unrealized_pl is None
-
-
-@patch("robinhood_core.services.portfolio.rh")
-def test_get_positions_api_error(mock_rh):
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = PortfolioService(mock_client)
-
-    mock_rh.get_open_stock_positions.side_effect = Exception("API Error")
-
-    from robinhood_core.errors import RobinhoodAPIError
-
-    with pytest.raises(RobinhoodAPIError, match="Failed to fetch positions"):
-        service.get_positions()
+    batch_sizes = sorted(len(c.args[0]) for c in mock_rh.get_quotes.call_args_list)
+    assert batch_sizes == [5, 75]
+    assert len(positions) == 80
+    assert all(p.market_value == 11.0 for p in positions)
@@ -1,125 +1,143 @@
 # tests/unit/test_service_watchlists.py
-from unittest.mock import MagicMock, patch, call
+from unittest.mock import Mock, patch
 from robinhood_core.services.watchlists import WatchlistsService
-from robinhood_core.client import RobinhoodClient
 from robinhood_core.errors import RobinhoodAPIError
 import pytest
 
 
-def test_service_initialization():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
-    assert service.client == mock_client
-
-
-def test_get_watchlists_parses_results_dict():
-    """get_all_watchlists returns a dict with a 'results' key."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
-
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.return_value = {
-            "results": [
-                {"id": "abc-123", "display_name": "My First List"},
-                {"id": "def-456", "display_name": "Tech Stocks"},
-            ]
-        }
-        # get_watchlist_by_name returns instrument entries
-        mock_rh.get_watchlist_by_name.side_effect = [
-            [{"instrument": "https://api.robinhood.com/instruments/inst1/"}],
-            [
-                {"instrument": "https://api.robinhood.com/instruments/inst2/"},
-                {"instrument": "https://api.robinhood.com/instruments/inst3/"},
-            ],
-        ]
-        mock_rh.get_symbol_by_url.side_effect = ["AAPL", "GOOGL", "MSFT"]
-
-        watchlists = service.get_watchlists()
-
-        assert len(watchlists) == 2
-
-        assert watchlists[0].id == "abc-123"
-        assert watchlists[0].name == "My First List"
-        assert watchlists[0].symbols == ["AAPL"]
-
-        assert watchlists[1].id == "def-456"
-        assert watchlists[1].name == "Tech Stocks"
-        assert watchlists[1].symbols == ["GOOGL", "MSFT"]
+# The robin_stocks functions these tests stub out (get_instrument_by_url is
+# reached through robinhood_core.instruments).
+_RH_API = [
+    "get_all_watchlists",
+    "get_watchlist_by_name",
+    "get_instrument_by_url",
+]
 
-        mock_client.ensure_session.assert_called_once()
-        mock_rh.get_watchlist_by_name.assert_any_call(name="My First List")
-        mock_rh.get_watchlist_by_name.assert_any_call(name="Tech Stocks")
 
+@pytest.fixture
+def mock_rh():
+    """Patch ``rh`` for the service and the shared instrument resolver."""
+    mock_rh = Mock(spec=_RH_API)
+    with patch("robinhood_core.services.watchlists.rh", mock_rh), patch(
+        "robinhood_core.instruments.rh", mock_rh
+    ):
+        yield mock_rh
 
-def test_get_watchlists_empty_results():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
 
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.return_value = {"results": []}
+@pytest.fixture
+def service(mock_client):
+    return WatchlistsService(mock_client)
 
-        watchlists = service.get_watchlists()
 
-        assert watchlists == []
-
-
-def test_get_watchlists_none_response():
-    """Handle case where get_all_watchlists returns None."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
-
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.return_value = None
+def test_service_initialization(service, mock_client):
+    assert service.client == mock_client
 
-        watchlists = service.get_watchlists()
 
-        assert watchlists == []
+def test_get_watchlists_calls_ensure_session(service, mock_client, mock_rh):
+    mock_rh.get_all_watchlists.return_value = {"results": []}
 
+    service.get_watchlists()
 
-def test_get_watchlists_symbol_resolution_failure_returns_empty_symbols():
-    """If symbol resolution fails for a watchlist, return empty symbols list."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
+    mock_client.ensure_session.assert_called_once()
 
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.return_value = {
-            "results": [
-                {"id": "abc-123", "display_name": "My List"},
-            ]
-        }
-        mock_rh.get_watchlist_by_name.side_effect = Exception("API error")
 
-        watchlists = service.get_watchlists()
+def test_get_watchlists_parses_results_dict(service, mock_rh):
+    """get_all_watchlists returns a dict with a 'results' key."""
+    mock_rh.get_all_watchlists.return_value = {
+        "results": [
+            {"id": "abc-123", "display_name": "My First List"},
+            {"id": "def-456", "display_name": "Tech Stocks"},
+        ]
+    }
+    # get_watchlist_by_name returns instrument entries
+    # Lookups run concurrently, so answer by argument rather than by order
+    entries = {
+        "My First List": [
+            {"instrument": "https://api.robinhood.com/instruments/inst1/"}
+        ],
+        "Tech Stocks": [
+            {"instrument": "https://api.robinhood.com/instruments/inst2/"},
+            {"instrument": "https://api.robinhood.com/instruments/inst3/"},
+        ],
+    }
+    symbols = {
+        "https://api.robinhood.com/instruments/inst1/": "AAPL",
+        "https://api.robinhood.com/instruments/inst2/": "GOOGL",
+        "https://api.robinhood.com/instruments/inst3/": "MSFT",
+    }
+    mock_rh.get_watchlist_by_name.side_effect = lambda name: entries[name]
+    mock_rh.get_instrument_by_url.side_effect = lambda url: {
+        "symbol": symbols[url]
+    }
+
+    watchlists = service.get_watchlists()
+
+    assert len(watchlists) == 2
+
+    assert watchlists[0].id == "abc-123"
+    assert watchlists[0].name == "My First List"
+    assert watchlists[0].symbols == ["AAPL"]
+
+    assert watchlists[1].id == "def-456"
+    assert watchlists[1].name == "Tech Stocks"
+    assert watchlists[1].symbols == ["GOOGL", "MSFT"]
+
+    mock_rh.get_watchlist_by_name.assert_any_call(name="My First List")
+    mock_rh.get_watchlist_by_name.assert_any_call(name="Tech Stocks")
+
+
+@pytest.mark.parametrize("response", [{"results": []}, None])
+def test_get_watchlists_no_lists(service, mock_rh, response):
+    mock_rh.get_all_watchlists.return_value = response
+
+    assert service.get_watchlists() == []
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [[], Exception("API error")],
+    ids=["no_instruments", "lookup_fails"],
+)
+def test_get_watchlists_without_symbols(service, mock_rh, entries):
+    """A list with no instruments, or whose lookup fails, has no symbols."""
+    mock_rh.get_all_watchlists.return_value = {
+        "results": [
+            {"id": "abc-123", "display_name": "My List"},
+        ]
+    }
+    if isinstance(entries, Exception):
+        mock_rh.get_watchlist_by_name.side_effect = entries
+    else:
+        mock_rh.get_watchlist_by_name.return_value = entries
 
-        assert len(watchlists) == 1
-        assert watchlists[0].symbols == []
+    watchlists = service.get_watchlists()
 
+    assert [(w.id, w.name, w.symbols) for w in watchlists] == [
+        ("abc-123", "My List", [])
+    ]
 
-def test_get_watchlists_api_error_propagates():
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
 
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.side_effect = Exception("Connection failed")
+def test_get_watchlists_api_error_propagates(service, mock_rh):
+    mock_rh.get_all_watchlists.side_effect = Exception("Connection failed")
 
-        with pytest.raises(RobinhoodAPIError, match="Failed to fetch watchlists"):
-            service.get_watchlists()
+    with pytest.raises(RobinhoodAPIError, match="Failed to fetch watchlists"):
+        service.get_watchlists()
 
 
-def test_get_watchlist_symbols_with_no_instruments():
-    """Watchlist with no instruments returns empty symbols."""
-    mock_client = MagicMock(spec=RobinhoodClient)
-    service = WatchlistsService(mock_client)
+def test_get_watchlists_resolves_shared_instruments_once(service, mock_rh):
+    """An instrument in several watchlists is looked up only once."""
+    aapl = {"instrument": "https://api.robinhood.com/instruments/inst1/"}
 
-    with patch("robinhood_core.services.watchlists.rh") as mock_rh:
-        mock_rh.get_all_watchlists.return_value = {
-            "results": [
-                {"id": "abc-123", "display_name": "Empty List"},
-            ]
-        }
-        mock_rh.get_watchlist_by_name.return_value = []
+    mock_rh.get_all_watchlists.return_value = {
+        "results": [
+            {"id": "abc-123", "display_name": "One"},
+            {"id": "def-456", "display_name": "Two"},
+        ]
+    }
+    mock_rh.get_watchlist_by_name.return_value = [aapl, aapl]
+    mock_rh.get_instrument_by_url.return_value = {"symbol": "AAPL"}
 
-        watchlists = service.get_watchlists()
+    watchlists = service.get_watchlists()
 
-        assert len(watchlists) == 1
-        assert watchlists[0].symbols == []
+    assert [w.symbols for w in watchlists] == [["AAPL", "AAPL"], ["AAPL", "AAPL"]]
+    mock_rh.get_instrument_by_url.assert_called_once()
@@ -3,21 +3,49 @@
 
 import argparse
 import asyncio
-import json
+import functools
 import logging
-from typing import List, Optional
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    BinaryIO,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import fastjsonschema
+import orjson
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
+from pydantic import TypeAdapter
 
-from robinhood_core.client import RobinhoodClient
+from robinhood_core.cache import peek
+from robinhood_core.client import RobinhoodClient, get_shared_client
 from robinhood_core.errors import (
     AuthRequiredError,
     InvalidArgumentError,
     RobinhoodAPIError,
     NetworkError,
 )
+from robinhood_core.models import (
+    Candle,
+    NewsItem,
+    OptionPosition,
+    Position,
+    Quote,
+    Watchlist,
+)
 from robinhood_core.services import (
     FundamentalsService,
     NewsService,
@@ -41,10 +69,188 @@ orders_service: OrdersService  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Whether per-call debug logging is on; refreshed by main() once logging is
+# configured so call_tool can skip the logger entirely otherwise.
+_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
 # Create MCP server
 mcp = Server("robinhood-mcp")
 
 
+# Dedicated pool for the blocking robin_stocks calls, created by
+# _init_services(). robin_stocks keeps a single module-level requests.Session,
+# so every worker shares its keep-alive connections and TLS sessions.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+async def _run_blocking(fn, *args):
+    """Run a blocking service call on the I/O executor."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, fn, *args)
+
+
+async def _call_service(fn, *args):
+    """Like _run_blocking, but answers service-level cache hits inline."""
+    hit, value = peek(fn, *args)
+    if hit:
+        return value
+    return await _run_blocking(fn, *args)
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool response payload to JSON text."""
+    return orjson.dumps(obj).decode()
+
+
+# A handler's response: one JSON text, or several when split into chunks.
+_Payload = Union[str, List[str]]
+
+
+def _text(payload: _Payload) -> List[TextContent]:
+    """Wrap JSON response text (or its chunks) as the tool's content list."""
+    if isinstance(payload, str):
+        return [TextContent(type="text", text=payload)]
+    return [TextContent(type="text", text=part) for part in payload]
+
+
+def _chunked(
+    items: list, chunk_size: Optional[int], dump: Callable[[list], str]
+) -> _Payload:
+    """Serialize items whole, or as JSON arrays of at most chunk_size items.
+
+    An empty result still yields one (empty) chunk.
+    """
+    if not chunk_size:
+        return dump(items)
+    return [
+        dump(items[i : i + chunk_size])
+        for i in range(0, len(items) or 1, chunk_size)
+    ]
+
+
+# Error code reported for each service exception type; anything else is
+# INTERNAL_ERROR.
+_ERROR_CODES: Dict[type, str] = {
+    AuthRequiredError: "AUTH_REQUIRED",
+    InvalidArgumentError: "INVALID_ARGUMENT",
+    RobinhoodAPIError: "ROBINHOOD_ERROR",
+    NetworkError: "NETWORK_ERROR",
+}
+
+
+def _error_code(exc: Exception) -> str:
+    """Map an exception to its error code, including subclasses."""
+    for cls in type(exc).__mro__:
+        code = _ERROR_CODES.get(cls)
+        if code is not None:
+            return code
+    return "INTERNAL_ERROR"
+
+
+@functools.lru_cache(maxsize=128)
+def _error_payload(message: str) -> str:
+    """Serialize an error response; repeated failures reuse the cached text."""
+    return _dumps({"error": message})
+
+
+# List adapters serialize service results straight to JSON in pydantic-core,
+# without building an intermediate list of dicts.
+_QUOTES_ADAPTER = TypeAdapter(List[Quote])
+_CANDLES_ADAPTER = TypeAdapter(List[Candle])
+_OPTION_POSITIONS_ADAPTER = TypeAdapter(List[OptionPosition])
+_POSITIONS_ADAPTER = TypeAdapter(List[Position])
+_WATCHLISTS_ADAPTER = TypeAdapter(List[Watchlist])
+_NEWS_ADAPTER = TypeAdapter(List[NewsItem])
+_NEWS_BY_SYMBOL_ADAPTER = TypeAdapter(Dict[str, List[NewsItem]])
+
+
+# Per-tool response cache: (tool, canonical arguments) -> (expires_at, JSON
+# text), least recently used first and capped at _CACHE_MAXSIZE entries.
+# TTLs follow how often the upstream data actually changes; the short portfolio
+# TTLs only merge bursts of polling. Tools not listed here (option positions,
+# orders, auth) are never cached.
+_CACHE_MAXSIZE = 1024
+_CACHE: "OrderedDict[Tuple[str, bytes], Tuple[float, _Payload]]" = OrderedDict()
+# Fetches in progress, so concurrent misses on a key share one; an entry only
+# lives while its fetch runs, and holds the only reference to its task.
+_CACHE_INFLIGHT: Dict[Tuple[str, bytes], "asyncio.Task[_Payload]"] = {}
+
+_TOOL_TTLS = {
+    "robinhood.market.current_price": 2.0,
+    "robinhood.market.quote": 2.0,
+    "robinhood.portfolio.summary": 2.0,
+    "robinhood.portfolio.positions": 2.0,
+    "robinhood.news.latest": 300.0,
+    "robinhood.news.latest_many": 300.0,
+    "robinhood.watchlists.list": 600.0,
+    "robinhood.fundamentals.get": 3600.0,
+}
+
+_PRICE_HISTORY_TTLS = {
+    "day": 60.0,
+    "week": 300.0,
+    "month": 3600.0,
+    "3month": 3600.0,
+    "year": 3600.0,
+    "5year": 3600.0,
+}
+
+
+def _cache_ttl(name: str, arguments: dict) -> Optional[float]:
+    """Return the cache TTL in seconds for a tool call, or None if uncached."""
+    if name == "robinhood.market.price_history":
+        return _PRICE_HISTORY_TTLS.get(arguments.get("span", "week"))
+    return _TOOL_TTLS.get(name)
+
+
+def _cache_key(name: str, arguments: dict) -> Tuple[str, bytes]:
+    return name, orjson.dumps(arguments, option=orjson.OPT_SORT_KEYS)
+
+
+async def _fill_cache(
+    key: Tuple[str, bytes],
+    ttl: float,
+    fetch: Callable[[], Awaitable[_Payload]],
+) -> _Payload:
+    try:
+        text = await fetch()
+    finally:
+        del _CACHE_INFLIGHT[key]
+
+    _CACHE[key] = (time.monotonic() + ttl, text)
+    while len(_CACHE) > _CACHE_MAXSIZE:
+        _CACHE.popitem(last=False)
+    return text
+
+
+async def _cached(
+    key: Tuple[str, bytes],
+    ttl: float,
+    fetch: Callable[[], Awaitable[_Payload]],
+) -> _Payload:
+    """Return a fresh cached response for key, fetching it on a miss.
+
+    Concurrent misses on the same key wait on one fetch instead of each
+    hitting Robinhood. The fetch runs as its own task, so a caller that is
+    cancelled stops waiting without cancelling it for the others. Failed
+    fetches are not cached.
+    """
+    entry = _CACHE.get(key)
+    if entry is not None:
+        if entry[0] > time.monotonic():
+            _CACHE.move_to_end(key)
+            return entry[1]
+        del _CACHE[key]
+
+    task = _CACHE_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fill_cache(key, ttl, fetch))
+        # Callers read the outcome; this keeps a failure nobody is still
+        # waiting for from being reported as never retrieved.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        _CACHE_INFLIGHT[key] = task
+    return await asyncio.shield(task)
+
+
 def _init_services(
     username: Optional[str] = None,
     password: Optional[str] = None,
@@ -52,9 +258,15 @@ def _init_services(
     allow_mfa: Optional[bool] = None,
 ):
     """Initialize client and services. Args override env vars."""
-    global client, market_service, options_service, portfolio_service, watchlists_service, news_service, fundamentals_service, orders_service
+    global client, market_service, options_service, portfolio_service, watchlists_service, news_service, fundamentals_service, orders_service, _EXECUTOR
 
-    client = RobinhoodClient(
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=int(os.getenv("RH_MAX_WORKERS", "16")),
+            thread_name_prefix="rh-io",
+        )
+
+    client = get_shared_client(
         username=username,
         password=password,
         session_path=session_path,
@@ -98,205 +310,385 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Enable MFA fallback (overrides RH_ALLOW_MFA env var)",
     )
+    parser.add_argument(
+        "--prefetch-watchlists",
+        action="store_true",
+        default=False,
+        help="Keep quotes for watchlist symbols warm in the background",
+    )
     return parser.parse_args(argv)
 
 
-@mcp.list_tools()
-async def list_tools() -> List[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="robinhood.market.current_price",
-            description="Get current price quotes for one or more symbols",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbols": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Stock ticker symbols",
-                    }
-                },
-                "required": ["symbols"],
+# Tool definitions are static, so build them once at import and hand the same
+# list back on every list_tools request.
+_NO_ARGS_SCHEMA = {"type": "object", "properties": {}}
+
+# Optional on tools with potentially large array results.
+_CHUNK_SIZE_PROPERTY = {
+    "type": "integer",
+    "minimum": 1,
+    "description": "Split the result into JSON arrays of at most this many items, one text part each. Concatenate the arrays to get the full result.",
+}
+
+_TOOLS: List[Tool] = [
+    Tool(
+        name="robinhood.market.current_price",
+        description="Get current price quotes for one or more symbols",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Stock ticker symbols",
+                }
             },
-        ),
-        Tool(
-            name="robinhood.market.price_history",
-            description="Get historical price data for a symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol",
-                    },
-                    "interval": {
-                        "type": "string",
-                        "description": "Data interval: 5minute, 10minute, hour, day, week",
-                        "default": "hour",
-                    },
-                    "span": {
-                        "type": "string",
-                        "description": "Time span: day, week, month, 3month, year, 5year",
-                        "default": "week",
-                    },
-                    "bounds": {
-                        "type": "string",
-                        "description": "Price bounds: extended, trading, regular",
-                        "default": "regular",
-                    },
+            "required": ["symbols"],
+        },
+    ),
+    Tool(
+        name="robinhood.market.price_history",
+        description="Get historical price data for a symbol",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol",
                 },
-                "required": ["symbol"],
-            },
-        ),
-        Tool(
-            name="robinhood.market.quote",
-            description="Get detailed stock quote for one or more symbols. Returns current price, previous close, change amount, and change percent. Use this instead of current_price when you need change/percent data.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbols": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Stock ticker symbols",
-                    }
+                "interval": {
+                    "type": "string",
+                    "description": "Data interval: 5minute, 10minute, hour, day, week",
+                    "default": "hour",
                 },
-                "required": ["symbols"],
-            },
-        ),
-        Tool(
-            name="robinhood.options.chain",
-            description=(
-                "Get options chain for a symbol. This tool has TWO data tiers depending on whether strike_price is provided:\n\n"
-                "TIER 1 — Chain listing (strike_price OMITTED): Returns a list of option contracts near the money (±20%% of current price) "
-                "with basic instrument data: strike, type (call/put), expiration. Does NOT include bid/ask, Greeks, or market data. "
-                "This is fast — use it to browse available strikes.\n\n"
-                "TIER 2 — Targeted lookup (strike_price PROVIDED): Returns 1-2 contracts with FULL market data including: "
-                "bid/ask, mark price, last trade price, open interest, volume, implied volatility, all Greeks "
-                "(delta, gamma, theta, vega, rho), and chance of profit (long/short). This is the ONLY way to get Greeks from Robinhood.\n\n"
-                "RECOMMENDED WORKFLOW for agents:\n"
-                "  Step 1: Call with just symbol (and optionally expiration_date + option_type) to see available strikes.\n"
-                "  Step 2: Pick a strike from the results.\n"
-                "  Step 3: Call again with symbol + expiration_date + strike_price (+ option_type) to get full Greeks and market data.\n\n"
-                "IMPORTANT: If you need Greeks, bid/ask, or IV — you MUST provide strike_price. Without it you only get strike/type/expiration.\n"
-                "NOTE: expiration_date defaults to nearest available expiration if omitted."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., 'AAPL', 'TSLA')",
-                    },
-                    "expiration_date": {
-                        "type": "string",
-                        "description": "Expiration date in YYYY-MM-DD format. If omitted, defaults to the nearest available expiration. Required for targeted Greek lookups.",
-                    },
-                    "option_type": {
-                        "type": "string",
-                        "description": "Filter by option type: 'call' or 'put'. If omitted, returns both calls and puts.",
-                    },
-                    "strike_price": {
-                        "type": "string",
-                        "description": "Specific strike price (e.g., '150.00'). CRITICAL: When provided, switches to targeted lookup mode which returns full market data including bid/ask, Greeks (delta/gamma/theta/vega/rho), IV, and profit probability. Without this, only basic strike/type/expiration data is returned.",
-                    },
+                "span": {
+                    "type": "string",
+                    "description": "Time span: day, week, month, 3month, year, 5year",
+                    "default": "week",
                 },
-                "required": ["symbol"],
-            },
-        ),
-        Tool(
-            name="robinhood.options.positions",
-            description=(
-                "Get all open option positions for the authenticated account. Returns each position with: "
-                "underlying symbol, strike price, expiration date, option type (call/put), direction (long/short), "
-                "quantity, and average cost basis. Does NOT include current Greeks or market data — use "
-                "robinhood.options.chain with the position's strike_price to get live Greeks and pricing."
-            ),
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="robinhood.portfolio.summary",
-            description="Get portfolio summary",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="robinhood.portfolio.positions",
-            description="Get portfolio positions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbols": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Optional filter by symbols",
-                    }
+                "bounds": {
+                    "type": "string",
+                    "description": "Price bounds: extended, trading, regular",
+                    "default": "regular",
                 },
+                "chunk_size": _CHUNK_SIZE_PROPERTY,
             },
-        ),
-        Tool(
-            name="robinhood.watchlists.list",
-            description="Get watchlists",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="robinhood.news.latest",
-            description="Get latest news for a stock symbol",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol",
-                    }
-                },
-                "required": ["symbol"],
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="robinhood.market.quote",
+        description="Get detailed stock quote for one or more symbols. Returns current price, previous close, change amount, and change percent. Use this instead of current_price when you need change/percent data.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Stock ticker symbols",
+                }
             },
+            "required": ["symbols"],
+        },
+    ),
+    Tool(
+        name="robinhood.options.chain",
+        description=(
+            "Get options chain for a symbol. This tool has TWO data tiers depending on whether strike_price is provided:\n\n"
+            "TIER 1 — Chain listing (strike_price OMITTED): Returns a list of option contracts near the money (±20%% of current price) "
+            "with basic instrument data: strike, type (call/put), expiration. Does NOT include bid/ask, Greeks, or market data. "
+            "This is fast — use it to browse available strikes.\n\n"
+            "TIER 2 — Targeted lookup (strike_price PROVIDED): Returns 1-2 contracts with FULL market data including: "
+            "bid/ask, mark price, last trade price, open interest, volume, implied volatility, all Greeks "
+            "(delta, gamma, theta, vega, rho), and chance of profit (long/short). This is the ONLY way to get Greeks from Robinhood.\n\n"
+            "RECOMMENDED WORKFLOW for agents:\n"
+            "  Step 1: Call with just symbol (and optionally expiration_date + option_type) to see available strikes.\n"
+            "  Step 2: Pick a strike from the results.\n"
+            "  Step 3: Call again with symbol + expiration_date + strike_price (+ option_type) to get full Greeks and market data.\n\n"
+            "IMPORTANT: If you need Greeks, bid/ask, or IV — you MUST provide strike_price. Without it you only get strike/type/expiration.\n"
+            "NOTE: expiration_date defaults to nearest available expiration if omitted."
         ),
-        Tool(
-            name="robinhood.fundamentals.get",
-            description="Get company fundamentals (market cap, P/E, dividend yield, 52-week range)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Stock ticker symbol",
-                    }
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol (e.g., 'AAPL', 'TSLA')",
+                },
+                "expiration_date": {
+                    "type": "string",
+                    "description": "Expiration date in YYYY-MM-DD format. If omitted, defaults to the nearest available expiration. Required for targeted Greek lookups.",
+                },
+                "option_type": {
+                    "type": "string",
+                    "description": "Filter by option type: 'call' or 'put'. If omitted, returns both calls and puts.",
                 },
-                "required": ["symbol"],
+                "strike_price": {
+                    "type": "string",
+                    "description": "Specific strike price (e.g., '150.00'). CRITICAL: When provided, switches to targeted lookup mode which returns full market data including bid/ask, Greeks (delta/gamma/theta/vega/rho), IV, and profit probability. Without this, only basic strike/type/expiration data is returned.",
+                },
+                "near_the_money": {
+                    "type": "boolean",
+                    "description": "Chain listings only. Defaults to true, keeping strikes within ±20% of the current price. Set false to list every strike.",
+                },
+                "chunk_size": _CHUNK_SIZE_PROPERTY,
             },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="robinhood.options.positions",
+        description=(
+            "Get all open option positions for the authenticated account. Returns each position with: "
+            "underlying symbol, strike price, expiration date, option type (call/put), direction (long/short), "
+            "quantity, and average cost basis. Does NOT include current Greeks or market data — use "
+            "robinhood.options.chain with the position's strike_price to get live Greeks and pricing."
         ),
-        Tool(
-            name="robinhood.auth.status",
-            description="Check authentication status",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="robinhood.orders.history",
-            description="Get order history for stocks, options, and/or crypto. Returns past trades with execution details, prices, quantities, and timestamps.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "type": {
-                        "type": "string",
-                        "description": "Order type to retrieve: stock, option, crypto, or all (default: all)",
-                        "default": "all",
-                    },
-                    "symbol": {
-                        "type": "string",
-                        "description": "Filter by stock ticker symbol (applies to stock and option orders only)",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date filter in YYYY-MM-DD format. Returns orders from this date to now.",
-                    },
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="robinhood.portfolio.summary",
+        description="Get portfolio summary",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="robinhood.portfolio.positions",
+        description="Get portfolio positions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional filter by symbols",
+                }
+            },
+        },
+    ),
+    Tool(
+        name="robinhood.watchlists.list",
+        description="Get watchlists",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="robinhood.news.latest",
+        description="Get latest news for a stock symbol",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol",
+                }
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="robinhood.news.latest_many",
+        description="Get latest news for several stock symbols in one call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbols": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 1,
+                    "description": "Stock ticker symbols",
+                }
+            },
+            "required": ["symbols"],
+        },
+    ),
+    Tool(
+        name="robinhood.fundamentals.get",
+        description="Get company fundamentals (market cap, P/E, dividend yield, 52-week range)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Stock ticker symbol",
+                }
+            },
+            "required": ["symbol"],
+        },
+    ),
+    Tool(
+        name="robinhood.auth.status",
+        description="Check authentication status",
+        inputSchema=_NO_ARGS_SCHEMA,
+    ),
+    Tool(
+        name="robinhood.orders.history",
+        description="Get order history for stocks, options, and/or crypto. Returns past trades with execution details, prices, quantities, and timestamps.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "type": {
+                    "type": "string",
+                    "description": "Order type to retrieve: stock, option, crypto, or all (default: all)",
+                    "default": "all",
+                },
+                "symbol": {
+                    "type": "string",
+                    "description": "Filter by stock ticker symbol (applies to stock and option orders only)",
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date filter in YYYY-MM-DD format. Returns orders from this date to now.",
                 },
             },
-        ),
-    ]
+        },
+    ),
+]
+
+
+# Argument validators compiled once from each tool's inputSchema. call_tool
+# checks arguments with these, so the SDK's per-call jsonschema pass is off.
+_VALIDATORS = {tool.name: fastjsonschema.compile(tool.inputSchema) for tool in _TOOLS}
+
+
+@mcp.list_tools()
+async def list_tools() -> List[Tool]:
+    """List available tools."""
+    return _TOOLS
+
+
+# Optional arguments read together by a handler; see _pluck().
+_CHAIN_OPTIONAL = ("expiration_date", "option_type", "strike_price")
+_ORDERS_OPTIONAL = ("symbol", "start_date")
+
+
+def _pluck(arguments: dict, keys: Tuple[str, ...]) -> tuple:
+    """Return arguments.get(key) for each key, None where absent."""
+    return tuple(map(arguments.get, keys))
+
+
+async def _h_current_price(arguments: dict) -> str:
+    symbols = arguments["symbols"]
+    quotes = await market_service.get_current_price_async(symbols)
+    return _QUOTES_ADAPTER.dump_json(quotes).decode()
+
+
+async def _h_price_history(arguments: dict) -> _Payload:
+    symbol = arguments["symbol"]
+    interval = arguments.get("interval", "hour")
+    span = arguments.get("span", "week")
+    bounds = arguments.get("bounds", "regular")
+    candles = await _call_service(
+        market_service.get_price_history,
+        symbol,
+        interval,
+        span,
+        bounds,
+    )
+    return _chunked(
+        candles,
+        arguments.get("chunk_size"),
+        lambda chunk: _CANDLES_ADAPTER.dump_json(chunk).decode(),
+    )
+
+
+async def _h_options_chain(arguments: dict) -> _Payload:
+    symbol = arguments["symbol"]
+    expiration_date, option_type, strike_price = _pluck(arguments, _CHAIN_OPTIONAL)
+    rows = await _run_blocking(
+        options_service.get_options_chain_raw,
+        symbol,
+        expiration_date,
+        option_type,
+        strike_price,
+        arguments.get("near_the_money", True),
+    )
+    return _chunked(rows, arguments.get("chunk_size"), _dumps)
+
+
+async def _h_option_positions(arguments: dict) -> str:
+    positions = await _run_blocking(options_service.get_option_positions)
+    return _OPTION_POSITIONS_ADAPTER.dump_json(positions).decode()
+
+
+async def _h_portfolio_summary(arguments: dict) -> str:
+    summary = await _run_blocking(portfolio_service.get_portfolio_summary)
+    return summary.model_dump_json()
+
+
+async def _h_portfolio_positions(arguments: dict) -> str:
+    symbols = arguments.get("symbols")
+    positions = await _run_blocking(portfolio_service.get_positions, symbols)
+    return _POSITIONS_ADAPTER.dump_json(positions).decode()
+
+
+async def _h_watchlists(arguments: dict) -> str:
+    watchlists = await _run_blocking(watchlists_service.get_watchlists)
+    return _WATCHLISTS_ADAPTER.dump_json(watchlists).decode()
+
+
+async def _h_news(arguments: dict) -> str:
+    symbol = arguments["symbol"]
+    news = await _call_service(news_service.get_news, symbol)
+    return _NEWS_ADAPTER.dump_json(news).decode()
+
+
+async def _h_news_many(arguments: dict) -> str:
+    news = await _run_blocking(news_service.get_news_many, arguments["symbols"])
+    return _NEWS_BY_SYMBOL_ADAPTER.dump_json(news).decode()
+
+
+async def _h_fundamentals(arguments: dict) -> str:
+    symbol = arguments["symbol"]
+    fundamentals = await _call_service(fundamentals_service.get_fundamentals, symbol)
+    return fundamentals.model_dump_json()
+
+
+# auth.status only ever returns one of these two payloads.
+_AUTHENTICATED = _dumps({"authenticated": True})
+_NOT_AUTHENTICATED = _dumps(
+    {"authenticated": False, "error": "Authentication required"}
+)
 
 
-@mcp.call_tool()
+async def _h_auth_status(arguments: dict) -> str:
+    try:
+        await _run_blocking(client.ensure_session)
+        return _AUTHENTICATED
+    except AuthRequiredError:
+        return _NOT_AUTHENTICATED
+
+
+async def _h_order_history(arguments: dict) -> str:
+    order_type = arguments.get("type", "all")
+    symbol, start_date = _pluck(arguments, _ORDERS_OPTIONAL)
+    history = await _run_blocking(
+        orders_service.get_order_history,
+        order_type,
+        symbol,
+        start_date,
+    )
+    return history.model_dump_json()
+
+
+# Tool name -> handler returning the JSON response text (or its chunks). Service errors
+# propagate to call_tool(), which maps them to error payloads.
+_HANDLERS: Dict[str, Callable[[dict], Awaitable[_Payload]]] = {
+    "robinhood.market.current_price": _h_current_price,
+    "robinhood.market.price_history": _h_price_history,
+    "robinhood.market.quote": _h_current_price,
+    "robinhood.options.chain": _h_options_chain,
+    "robinhood.options.positions": _h_option_positions,
+    "robinhood.portfolio.summary": _h_portfolio_summary,
+    "robinhood.portfolio.positions": _h_portfolio_positions,
+    "robinhood.watchlists.list": _h_watchlists,
+    "robinhood.news.latest": _h_news,
+    "robinhood.news.latest_many": _h_news_many,
+    "robinhood.fundamentals.get": _h_fundamentals,
+    "robinhood.auth.status": _h_auth_status,
+    "robinhood.orders.history": _h_order_history,
+}
+
+
+@mcp.call_tool(validate_input=False)
 async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool calls."""
     assert client is not None, "Services not initialized. Call _init_services() first."
@@ -307,204 +699,195 @@ async def call_tool(name: str, arguments: dict) -> List[TextContent]:
     assert news_service is not None
     assert fundamentals_service is not None
 
-    logger.debug("Tool called: %s", name)
+    if _DEBUG:
+        logger.debug("Tool called: %s", name)
+
+    # The name is looked up in several tables below; interning it makes every
+    # hit against their (literal, already interned) keys an identity compare.
+    name = sys.intern(name)
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _text(_error_payload(f"Unknown tool: {name}"))
 
     try:
-        if name == "robinhood.market.current_price":
-            symbols = arguments["symbols"]
-            quotes = await asyncio.to_thread(
-                market_service.get_current_price, symbols
-            )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([q.model_dump() for q in quotes])
-                )
-            ]
-
-        elif name == "robinhood.market.price_history":
-            symbol = arguments["symbol"]
-            interval = arguments.get("interval", "hour")
-            span = arguments.get("span", "week")
-            bounds = arguments.get("bounds", "regular")
-            candles = await asyncio.to_thread(
-                market_service.get_price_history,
-                symbol,
-                interval,
-                span,
-                bounds,
-            )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([c.model_dump() for c in candles])
-                )
-            ]
-
-        elif name == "robinhood.market.quote":
-            symbols = arguments["symbols"]
-            quotes = await asyncio.to_thread(
-                market_service.get_current_price, symbols
-            )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([q.model_dump() for q in quotes])
-                )
-            ]
-
-        elif name == "robinhood.options.chain":
-            symbol = arguments["symbol"]
-            expiration_date = arguments.get("expiration_date")
-            option_type = arguments.get("option_type")
-            strike_price = arguments.get("strike_price")
-            contracts = await asyncio.to_thread(
-                options_service.get_options_chain,
-                symbol,
-                expiration_date,
-                option_type,
-                strike_price,
-            )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([c.model_dump() for c in contracts])
-                )
-            ]
-
-        elif name == "robinhood.options.positions":
-            positions = await asyncio.to_thread(
-                options_service.get_option_positions,
-            )
-            return [
-                TextContent(
-                    type="text", text=json.dumps([p.model_dump() for p in positions])
-                )
-            ]
-
-        elif name == "robinhood.portfolio.summary":
-            summary = portfolio_service.get_portfolio_summary()
-            return [TextContent(type="text", text=json.dumps(summary.model_dump()))]
-
-        elif name == "robinhood.portfolio.positions":
-            symbols = arguments.get("symbols")
-            positions = portfolio_service.get_positions(symbols)
-            return [
-                TextContent(
-                    type="text", text=json.dumps([p.model_dump() for p in positions])
-                )
-            ]
-
-        elif name == "robinhood.watchlists.list":
-            watchlists = watchlists_service.get_watchlists()
-            return [
-                TextContent(
-                    type="text", text=json.dumps([w.model_dump() for w in watchlists])
-                )
-            ]
-
-        elif name == "robinhood.news.latest":
-            symbol = arguments["symbol"]
-            news = await asyncio.to_thread(news_service.get_news, symbol)
-            return [
-                TextContent(
-                    type="text", text=json.dumps([n.model_dump() for n in news])
-                )
-            ]
-
-        elif name == "robinhood.fundamentals.get":
-            symbol = arguments["symbol"]
-            fundamentals = await asyncio.to_thread(
-                fundamentals_service.get_fundamentals, symbol
+        _VALIDATORS[name](arguments)
+    except fastjsonschema.JsonSchemaException as e:
+        return _text(_error_payload(f"INVALID_ARGUMENT: {e.message}"))
+
+    try:
+        ttl = _cache_ttl(name, arguments)
+        if ttl is None:
+            payload = await handler(arguments)
+        else:
+            payload = await _cached(
+                _cache_key(name, arguments), ttl, lambda: handler(arguments)
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps(fundamentals.model_dump())
-                )
-            ]
-
-        elif name == "robinhood.auth.status":
-            try:
-                client.ensure_session()
-                return [
-                    TextContent(type="text", text=json.dumps({"authenticated": True}))
-                ]
-            except AuthRequiredError:
-                return [
-                    TextContent(
-                        type="text",
-                        text=json.dumps(
-                            {"authenticated": False, "error": "Authentication required"}
-                        ),
-                    )
-                ]
-
-        elif name == "robinhood.orders.history":
-            order_type = arguments.get("type", "all")
-            symbol = arguments.get("symbol")
-            start_date = arguments.get("start_date")
-            history = await asyncio.to_thread(
-                orders_service.get_order_history,
-                order_type,
-                symbol,
-                start_date,
+        return _text(payload)
+
+    except Exception as e:
+        # Format the exception once; the log record and the payload share it.
+        message = f"{_error_code(e)}: {e}"
+        logger.warning("Tool %s failed: %s", name, message)
+        return _text(_error_payload(message))
+
+
+class _BatchedStdout:
+    """Write-coalescing stand-in for the stdout file given to stdio_server.
+
+    The SDK writes and flushes every JSON-RPC message separately, each a thread
+    hop. Here write() only buffers, and flush() starts one background drain
+    that sends everything queued in the meantime with a single write + flush.
+    Writes run on a thread of their own, so replies never queue behind
+    Robinhood calls occupying the I/O executor.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self._raw = raw
+        self._pending: List[str] = []
+        self._drain_task: Optional[asyncio.Task] = None
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rh-stdout"
+        )
+
+    async def write(self, data: str) -> None:
+        self._pending.append(data)
+
+    async def flush(self) -> None:
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+            self._drain_task.add_done_callback(self._report_drain_failure)
+
+    async def drain(self) -> None:
+        """Wait until everything written so far has reached the raw stream."""
+        if self._drain_task is not None:
+            await self._drain_task
+        if self._pending:
+            await self._drain()
+
+    async def _drain(self) -> None:
+        # Yield once so responses finishing in the same tick share the write.
+        await asyncio.sleep(0)
+        while self._pending:
+            # Encode the whole batch once; the SDK only hands us str messages.
+            chunk = "".join(self._pending).encode("utf-8")
+            self._pending.clear()
+            await asyncio.get_running_loop().run_in_executor(
+                self._writer, self._write_through, chunk
             )
-            return [
-                TextContent(
-                    type="text", text=json.dumps(history.model_dump())
-                )
-            ]
 
-        else:
-            return [
-                TextContent(
-                    type="text", text=json.dumps({"error": f"Unknown tool: {name}"})
-                )
-            ]
+    def _write_through(self, chunk: bytes) -> None:
+        self._raw.write(chunk)
+        self._raw.flush()
 
+    @staticmethod
+    def _report_drain_failure(task: asyncio.Task) -> None:
+        # Retrieve the exception so a broken pipe is reported, not dropped.
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to write to stdout: %s", task.exception())
+
+    def close(self) -> None:
+        self._writer.shutdown(wait=False)
+
+
+async def _warm_session() -> None:
+    """Authenticate in the background so the first tool call finds a session."""
+    try:
+        await _run_blocking(client.ensure_session)
     except AuthRequiredError as e:
-        logger.warning("Tool %s failed: AUTH_REQUIRED: %s", name, e)
-        return [
-            TextContent(type="text", text=json.dumps({"error": f"AUTH_REQUIRED: {e}"}))
-        ]
-    except InvalidArgumentError as e:
-        logger.warning("Tool %s failed: INVALID_ARGUMENT: %s", name, e)
-        return [
-            TextContent(
-                type="text", text=json.dumps({"error": f"INVALID_ARGUMENT: {e}"})
-            )
-        ]
-    except RobinhoodAPIError as e:
-        logger.warning("Tool %s failed: ROBINHOOD_ERROR: %s", name, e)
-        return [
-            TextContent(
-                type="text", text=json.dumps({"error": f"ROBINHOOD_ERROR: {e}"})
-            )
-        ]
-    except NetworkError as e:
-        logger.warning("Tool %s failed: NETWORK_ERROR: %s", name, e)
-        return [
-            TextContent(type="text", text=json.dumps({"error": f"NETWORK_ERROR: {e}"}))
-        ]
+        logger.warning("Starting without auth; will retry on demand: %s", e)
     except Exception as e:
-        logger.warning("Tool %s failed: INTERNAL_ERROR: %s", name, e)
-        return [
-            TextContent(type="text", text=json.dumps({"error": f"INTERNAL_ERROR: {e}"}))
-        ]
+        logger.warning("Session warm-up failed; will retry on demand: %s", e)
+
+
+# Seconds between refreshes of the watchlist quote prefetch. Prefetched
+# quotes stay cached for the whole interval, so watchlist symbols are served
+# from a quote at most this old rather than expiring after the usual 2s.
+_PREFETCH_INTERVAL = 15.0
+
+
+async def _prefetch_watchlist_quotes(session_ready: Awaitable[None]) -> None:
+    """Periodically fetch quotes for every watchlist symbol in one call.
+
+    ``get_current_price`` splits long lists into URL-sized batches, the same
+    way portfolio positions are quoted. Watchlist symbols are the likeliest
+    to be asked about, so each refresh seeds the quote cache with a
+    single-symbol entry per quote. Runs until cancelled; failures (e.g. no
+    auth yet) just wait for the next round.
+    """
+    await session_ready
+    while True:
+        try:
+            watchlists = await _run_blocking(watchlists_service.get_watchlists)
+            symbols = list(dict.fromkeys(s for w in watchlists for s in w.symbols))
+            if symbols:
+                quotes = await _run_blocking(market_service.get_current_price, symbols)
+                market_service.prime_quotes(quotes, ttl=_PREFETCH_INTERVAL)
+        except Exception as e:
+            logger.debug("Watchlist quote prefetch failed: %s", e)
+        await asyncio.sleep(_PREFETCH_INTERVAL)
+
+
+async def run_server(prefetch_watchlists: bool = False):
+    """Run the MCP server over stdio."""
+    if _EXECUTOR is not None:
+        asyncio.get_running_loop().set_default_executor(_EXECUTOR)
+    stdout = _BatchedStdout(sys.stdout.buffer)
+    warm_task = asyncio.create_task(_warm_session())
+    background = [warm_task]
+    if prefetch_watchlists:
+        background.append(
+            asyncio.create_task(_prefetch_watchlist_quotes(warm_task))
+        )
+    try:
+        async with stdio_server(stdout=stdout) as (read_stream, write_stream):
+            await mcp.run(
+                read_stream, write_stream, mcp.create_initialization_options()
+            )
+        await stdout.drain()
+    finally:
+        for task in background:
+            task.cancel()
+        stdout.close()
+        if _EXECUTOR is not None:
+            _EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 
-async def run_server():
-    """Run the MCP server over stdio."""
-    async with stdio_server() as (read_stream, write_stream):
-        await mcp.run(read_stream, write_stream, mcp.create_initialization_options())
+def _install_event_loop_policy() -> None:
+    """Use uvloop (winloop on Windows) for the server loop when installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+
+
+def _configure_logging() -> None:
+    """Set up stderr logging at ``RH_LOG_LEVEL``, falling back to WARNING."""
+    name = os.getenv("RH_LOG_LEVEL", "WARNING").strip().upper()
+    level = logging.getLevelNamesMapping().get(name)
+    logging.basicConfig(level=logging.WARNING if level is None else level)
+    if level is None:
+        logger.warning("Unknown RH_LOG_LEVEL %r, using WARNING", name)
 
 
 def main():
     """Entry point: parse args, init services, start server."""
+    global _DEBUG
+
     args = parse_args()
+    _configure_logging()
+    _DEBUG = logger.isEnabledFor(logging.DEBUG)
     _init_services(
         username=args.username,
         password=args.password,
         session_path=args.session_path,
         allow_mfa=args.allow_mfa,
     )
-    asyncio.run(run_server())
+    _install_event_loop_policy()
+    asyncio.run(run_server(prefetch_watchlists=args.prefetch_watchlists))
 
 
 if __name__ == "__main__":
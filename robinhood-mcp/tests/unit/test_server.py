@@ -1,7 +1,27 @@
 # tests/unit/test_server.py
+import orjson
 import pytest
 from unittest.mock import MagicMock, patch
 
+from robinhood_core.models import (
+    Candle,
+    Fundamentals,
+    NewsItem,
+    PortfolioSummary,
+    Position,
+    Quote,
+    Watchlist,
+)
+from robinhood_core.services.market_data import MarketDataService
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    import robin_stocks_mcp.server as srv
+
+    srv._CACHE.clear()
+    srv._CACHE_INFLIGHT.clear()
+
 
 def test_server_imports():
     from robin_stocks_mcp.server import mcp
@@ -29,6 +49,7 @@ def test_parse_args_defaults():
     assert args.password is None
     assert args.session_path is None
     assert args.allow_mfa is None
+    assert args.prefetch_watchlists is False
 
 
 def test_parse_args_with_values():
@@ -83,12 +104,28 @@ def test_init_services_passes_all_args():
     assert srv.client._allow_mfa is True
 
 
+def test_init_services_creates_io_executor(monkeypatch):
+    import robin_stocks_mcp.server as srv
+
+    monkeypatch.setattr(srv, "_EXECUTOR", None)
+    monkeypatch.setenv("RH_MAX_WORKERS", "4")
+    srv._init_services(username="u", password="p")
+    executor = srv._EXECUTOR
+    try:
+        assert executor._max_workers == 4
+        assert executor._thread_name_prefix == "rh-io"
+        srv._init_services(username="u", password="p")
+        assert srv._EXECUTOR is executor
+    finally:
+        executor.shutdown(wait=False)
+
+
 @pytest.mark.asyncio
 async def test_list_tools_returns_tools():
     from robin_stocks_mcp.server import list_tools
 
     tools = await list_tools()
-    assert len(tools) == 12
+    assert len(tools) == 13
 
     tool_names = [tool.name for tool in tools]
     expected_tools = [
@@ -101,6 +138,7 @@ async def test_list_tools_returns_tools():
         "robinhood.portfolio.positions",
         "robinhood.watchlists.list",
         "robinhood.news.latest",
+        "robinhood.news.latest_many",
         "robinhood.fundamentals.get",
         "robinhood.auth.status",
         "robinhood.orders.history",
@@ -109,43 +147,60 @@ async def test_list_tools_returns_tools():
         assert expected in tool_names
 
 
+@pytest.mark.asyncio
+async def test_list_tools_is_built_once():
+    from robin_stocks_mcp.server import list_tools
+
+    assert await list_tools() is await list_tools()
+
+
+def test_every_listed_tool_has_a_handler():
+    from robin_stocks_mcp.server import _HANDLERS, _TOOLS
+
+    assert {tool.name for tool in _TOOLS} == set(_HANDLERS)
+
+
 @pytest.mark.asyncio
 async def test_call_tool_current_price():
     from robin_stocks_mcp.server import call_tool
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_quote = MagicMock()
-        mock_quote.model_dump.return_value = {
-            "symbol": "AAPL",
-            "last_price": 150.50,
-            "timestamp": "2026-02-11T10:00:00Z",
-        }
-        mock_service.get_current_price.return_value = [mock_quote]
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.return_value = [
+            Quote(
+                symbol="AAPL",
+                last_price=150.50,
+                timestamp="2026-02-11T10:00:00Z",
+            )
+        ]
 
         result = await call_tool(
             "robinhood.market.current_price", {"symbols": ["AAPL"]}
         )
 
         assert len(result) == 1
-        assert '"symbol": "AAPL"' in result[0].text
-        mock_service.get_current_price.assert_called_once_with(["AAPL"])
+        assert '"symbol":"AAPL"' in result[0].text
+        mock_service.get_current_price_async.assert_called_once_with(["AAPL"])
 
 
 @pytest.mark.asyncio
 async def test_call_tool_price_history():
     from robin_stocks_mcp.server import call_tool
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_candle = MagicMock()
-        mock_candle.model_dump.return_value = {
-            "timestamp": "2026-02-11T10:00:00Z",
-            "open": 150.0,
-            "high": 151.0,
-            "low": 149.0,
-            "close": 150.5,
-            "volume": 1000000,
-        }
-        mock_service.get_price_history.return_value = [mock_candle]
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_price_history.return_value = [
+            Candle(
+                timestamp="2026-02-11T10:00:00Z",
+                open=150.0,
+                high=151.0,
+                low=149.0,
+                close=150.5,
+                volume=1000000,
+            )
+        ]
 
         result = await call_tool(
             "robinhood.market.price_history",
@@ -153,7 +208,7 @@ async def test_call_tool_price_history():
         )
 
         assert len(result) == 1
-        assert '"close": 150.5' in result[0].text
+        assert '"close":150.5' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -161,19 +216,69 @@ async def test_call_tool_options_chain():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.options_service") as mock_service:
-        mock_contract = MagicMock()
-        mock_contract.model_dump.return_value = {
-            "symbol": "AAPL",
-            "expiration": "2026-03-20",
-            "strike": 150.0,
-            "type": "call",
-        }
-        mock_service.get_options_chain.return_value = [mock_contract]
+        mock_service.get_options_chain_raw.return_value = [
+            {
+                "symbol": "AAPL",
+                "expiration": "2026-03-20",
+                "strike": 150.0,
+                "type": "call",
+            }
+        ]
 
         result = await call_tool("robinhood.options.chain", {"symbol": "AAPL"})
 
         assert len(result) == 1
-        assert '"symbol": "AAPL"' in result[0].text
+        assert '"symbol":"AAPL"' in result[0].text
+        mock_service.get_options_chain_raw.assert_called_once_with(
+            "AAPL", None, None, None, True
+        )
+
+
+@pytest.mark.asyncio
+async def test_call_tool_options_chain_chunked():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.options_service") as mock_service:
+        mock_service.get_options_chain_raw.return_value = [
+            {"symbol": "AAPL", "expiration": "2026-03-20", "strike": s, "type": "call"}
+            for s in (140.0, 145.0, 150.0)
+        ]
+
+        result = await call_tool(
+            "robinhood.options.chain", {"symbol": "AAPL", "chunk_size": 2}
+        )
+
+        assert [len(orjson.loads(part.text)) for part in result] == [2, 1]
+        mock_service.get_options_chain_raw.assert_called_once_with(
+            "AAPL", None, None, None, True
+        )
+
+
+@pytest.mark.asyncio
+async def test_call_tool_chunked_empty_result_is_one_empty_array():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_price_history.return_value = []
+
+        result = await call_tool(
+            "robinhood.market.price_history", {"symbol": "AAPL", "chunk_size": 50}
+        )
+
+        assert [part.text for part in result] == ["[]"]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_rejects_non_positive_chunk_size():
+    from robin_stocks_mcp.server import call_tool
+
+    result = await call_tool(
+        "robinhood.options.chain", {"symbol": "AAPL", "chunk_size": 0}
+    )
+
+    assert "INVALID_ARGUMENT" in result[0].text
 
 
 @pytest.mark.asyncio
@@ -181,18 +286,16 @@ async def test_call_tool_portfolio_summary():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.portfolio_service") as mock_service:
-        mock_summary = MagicMock()
-        mock_summary.model_dump.return_value = {
-            "equity": 10000.50,
-            "cash": 2500.0,
-            "buying_power": 12500.0,
-        }
-        mock_service.get_portfolio_summary.return_value = mock_summary
+        mock_service.get_portfolio_summary.return_value = PortfolioSummary(
+            equity=10000.50,
+            cash=2500.0,
+            buying_power=12500.0,
+        )
 
         result = await call_tool("robinhood.portfolio.summary", {})
 
         assert len(result) == 1
-        assert '"equity": 10000.5' in result[0].text
+        assert '"equity":10000.5' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -200,18 +303,14 @@ async def test_call_tool_portfolio_positions():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.portfolio_service") as mock_service:
-        mock_position = MagicMock()
-        mock_position.model_dump.return_value = {
-            "symbol": "AAPL",
-            "quantity": 100,
-            "average_cost": 145.0,
-        }
-        mock_service.get_positions.return_value = [mock_position]
+        mock_service.get_positions.return_value = [
+            Position(symbol="AAPL", quantity=100, average_cost=145.0)
+        ]
 
         result = await call_tool("robinhood.portfolio.positions", {})
 
         assert len(result) == 1
-        assert '"symbol": "AAPL"' in result[0].text
+        assert '"symbol":"AAPL"' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -219,18 +318,18 @@ async def test_call_tool_watchlists():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.watchlists_service") as mock_service:
-        mock_watchlist = MagicMock()
-        mock_watchlist.model_dump.return_value = {
-            "id": "watchlist-123",
-            "name": "My Watchlist",
-            "symbols": ["AAPL", "GOOGL"],
-        }
-        mock_service.get_watchlists.return_value = [mock_watchlist]
+        mock_service.get_watchlists.return_value = [
+            Watchlist(
+                id="watchlist-123",
+                name="My Watchlist",
+                symbols=["AAPL", "GOOGL"],
+            )
+        ]
 
         result = await call_tool("robinhood.watchlists.list", {})
 
         assert len(result) == 1
-        assert '"name": "My Watchlist"' in result[0].text
+        assert '"name":"My Watchlist"' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -238,18 +337,44 @@ async def test_call_tool_news():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.news_service") as mock_service:
-        mock_news = MagicMock()
-        mock_news.model_dump.return_value = {
-            "id": "news-123",
-            "headline": "Test News",
-            "source": "TestSource",
-        }
-        mock_service.get_news.return_value = [mock_news]
+        mock_service.get_news.return_value = [
+            NewsItem(
+                id="news-123",
+                headline="Test News",
+                source="TestSource",
+                published_at="2026-02-11T10:00:00Z",
+            )
+        ]
 
         result = await call_tool("robinhood.news.latest", {"symbol": "AAPL"})
 
         assert len(result) == 1
-        assert '"headline": "Test News"' in result[0].text
+        assert '"headline":"Test News"' in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_call_tool_news_many():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.news_service") as mock_service:
+        mock_service.get_news_many.return_value = {
+            "AAPL": [
+                NewsItem(
+                    id="news-123",
+                    headline="Test News",
+                    published_at="2026-02-11T10:00:00Z",
+                )
+            ],
+            "MSFT": [],
+        }
+
+        result = await call_tool(
+            "robinhood.news.latest_many", {"symbols": ["AAPL", "MSFT"]}
+        )
+
+        mock_service.get_news_many.assert_called_once_with(["AAPL", "MSFT"])
+        assert result[0].text.startswith('{"AAPL":[{"id":"news-123"')
+        assert result[0].text.endswith('"MSFT":[]}')
 
 
 @pytest.mark.asyncio
@@ -257,17 +382,15 @@ async def test_call_tool_fundamentals():
     from robin_stocks_mcp.server import call_tool
 
     with patch("robin_stocks_mcp.server.fundamentals_service") as mock_service:
-        mock_fundamentals = MagicMock()
-        mock_fundamentals.model_dump.return_value = {
-            "pe_ratio": 28.5,
-            "market_cap": 2500000000000.0,
-        }
-        mock_service.get_fundamentals.return_value = mock_fundamentals
+        mock_service.get_fundamentals.return_value = Fundamentals(
+            pe_ratio=28.5,
+            market_cap=2500000000000.0,
+        )
 
         result = await call_tool("robinhood.fundamentals.get", {"symbol": "AAPL"})
 
         assert len(result) == 1
-        assert '"pe_ratio": 28.5' in result[0].text
+        assert '"pe_ratio":28.5' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -280,7 +403,7 @@ async def test_call_tool_auth_status_authenticated():
         result = await call_tool("robinhood.auth.status", {})
 
         assert len(result) == 1
-        assert '"authenticated": true' in result[0].text
+        assert '"authenticated":true' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -294,7 +417,7 @@ async def test_call_tool_auth_status_not_authenticated():
         result = await call_tool("robinhood.auth.status", {})
 
         assert len(result) == 1
-        assert '"authenticated": false' in result[0].text
+        assert '"authenticated":false' in result[0].text
 
 
 @pytest.mark.asyncio
@@ -313,8 +436,12 @@ async def test_call_tool_handles_auth_required_error():
     from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import AuthRequiredError
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_service.get_current_price.side_effect = AuthRequiredError("Auth required")
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.side_effect = AuthRequiredError(
+            "Auth required"
+        )
 
         result = await call_tool(
             "robinhood.market.current_price", {"symbols": ["AAPL"]}
@@ -329,8 +456,10 @@ async def test_call_tool_handles_invalid_argument_error():
     from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import InvalidArgumentError
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_service.get_current_price.side_effect = InvalidArgumentError(
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.side_effect = InvalidArgumentError(
             "Invalid argument"
         )
 
@@ -345,8 +474,12 @@ async def test_call_tool_handles_robinhood_api_error():
     from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import RobinhoodAPIError
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_service.get_current_price.side_effect = RobinhoodAPIError("API error")
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.side_effect = RobinhoodAPIError(
+            "API error"
+        )
 
         result = await call_tool(
             "robinhood.market.current_price", {"symbols": ["AAPL"]}
@@ -361,8 +494,10 @@ async def test_call_tool_handles_network_error():
     from robin_stocks_mcp.server import call_tool
     from robinhood_core.errors import NetworkError
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_service.get_current_price.side_effect = NetworkError("Network error")
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.side_effect = NetworkError("Network error")
 
         result = await call_tool(
             "robinhood.market.current_price", {"symbols": ["AAPL"]}
@@ -376,8 +511,10 @@ async def test_call_tool_handles_network_error():
 async def test_call_tool_handles_generic_error():
     from robin_stocks_mcp.server import call_tool
 
-    with patch("robin_stocks_mcp.server.market_service") as mock_service:
-        mock_service.get_current_price.side_effect = Exception("Generic error")
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        mock_service.get_current_price_async.side_effect = Exception("Generic error")
 
         result = await call_tool(
             "robinhood.market.current_price", {"symbols": ["AAPL"]}
@@ -385,3 +522,298 @@ async def test_call_tool_handles_generic_error():
 
         assert len(result) == 1
         assert "INTERNAL_ERROR" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_run_server_shuts_down_executor(monkeypatch):
+    import contextlib
+    from concurrent.futures import ThreadPoolExecutor
+
+    import robin_stocks_mcp.server as srv
+
+    @contextlib.asynccontextmanager
+    async def fake_stdio(stdout=None):
+        yield (MagicMock(), MagicMock())
+
+    async def fake_run(*args):
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(srv, "_EXECUTOR", executor)
+    monkeypatch.setattr(srv, "stdio_server", fake_stdio)
+    monkeypatch.setattr(srv.mcp, "run", fake_run)
+    monkeypatch.setattr(srv, "client", MagicMock())
+
+    await srv.run_server()
+
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_caches_fundamentals():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.fundamentals_service") as mock_service:
+        mock_service.get_fundamentals.return_value = Fundamentals(pe_ratio=28.5)
+
+        first = await call_tool("robinhood.fundamentals.get", {"symbol": "AAPL"})
+        second = await call_tool("robinhood.fundamentals.get", {"symbol": "AAPL"})
+
+        assert first[0].text == second[0].text
+        mock_service.get_fundamentals.assert_called_once_with("AAPL")
+
+
+@pytest.mark.asyncio
+async def test_call_tool_does_not_cache_positions():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.options_service") as mock_service:
+        mock_service.get_option_positions.return_value = []
+
+        await call_tool("robinhood.options.positions", {})
+        await call_tool("robinhood.options.positions", {})
+
+        assert mock_service.get_option_positions.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_coalesces_concurrent_misses():
+    import asyncio
+
+    from robin_stocks_mcp.server import _cached
+
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "[]"
+
+    results = await asyncio.gather(*(_cached(("k", b""), 60, fetch) for _ in range(5)))
+
+    assert results == ["[]"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_fetch():
+    import asyncio
+
+    from robin_stocks_mcp.server import _cached
+
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return "[]"
+
+    owner = asyncio.create_task(_cached(("k", b""), 60, fetch))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(_cached(("k", b""), 60, fetch))
+    await asyncio.sleep(0)
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.wait_for(waiter, timeout=1) == "[]"
+    assert owner.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cached_is_bounded_and_drops_finished_fetches():
+    import robin_stocks_mcp.server as srv
+
+    async def fetch():
+        return "[]"
+
+    with patch.object(srv, "_CACHE_MAXSIZE", 2):
+        for key in (b"a", b"b", b"c"):
+            await srv._cached(("k", key), 60, fetch)
+
+    assert list(srv._CACHE) == [("k", b"b"), ("k", b"c")]
+    assert srv._CACHE_INFLIGHT == {}
+
+
+def test_price_history_ttl_follows_span():
+    from robin_stocks_mcp.server import _cache_ttl
+
+    assert _cache_ttl("robinhood.market.price_history", {"span": "day"}) == 60
+    assert _cache_ttl("robinhood.market.price_history", {"span": "year"}) == 3600
+    assert _cache_ttl("robinhood.orders.history", {}) is None
+
+
+@pytest.mark.asyncio
+async def test_call_tool_portfolio_summary_merges_bursts():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch("robin_stocks_mcp.server.portfolio_service") as mock_service:
+        mock_service.get_portfolio_summary.return_value = PortfolioSummary(
+            equity=100.0, cash=50.0, buying_power=50.0
+        )
+
+        await call_tool("robinhood.portfolio.summary", {})
+        await call_tool("robinhood.portfolio.summary", {})
+
+        mock_service.get_portfolio_summary.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_call_tool_rejects_invalid_arguments():
+    from robin_stocks_mcp.server import call_tool
+
+    with patch(
+        "robin_stocks_mcp.server.market_service", spec=MarketDataService
+    ) as mock_service:
+        result = await call_tool("robinhood.market.current_price", {})
+
+        assert "INVALID_ARGUMENT" in result[0].text
+        assert "symbols" in result[0].text
+        mock_service.get_current_price_async.assert_not_called()
+
+
+def test_error_code_covers_subclasses():
+    from robinhood_core.errors import RobinhoodAPIError
+
+    from robin_stocks_mcp.server import _error_code
+
+    class RateLimited(RobinhoodAPIError):
+        pass
+
+    assert _error_code(RateLimited("slow down")) == "ROBINHOOD_ERROR"
+    assert _error_code(KeyError("x")) == "INTERNAL_ERROR"
+
+
+def test_install_event_loop_policy_uses_uvloop(monkeypatch):
+    import asyncio
+    import sys
+    import types
+
+    import robin_stocks_mcp.server as srv
+
+    policy = object()
+    fake_uvloop = types.SimpleNamespace(EventLoopPolicy=lambda: policy)
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+    set_policy = MagicMock()
+    monkeypatch.setattr(asyncio, "set_event_loop_policy", set_policy)
+
+    srv._install_event_loop_policy()
+
+    set_policy.assert_called_once_with(policy)
+
+
+@pytest.mark.asyncio
+async def test_batched_stdout_coalesces_writes():
+    import io
+
+    from robin_stocks_mcp.server import _BatchedStdout
+
+    raw = MagicMock(wraps=io.BytesIO())
+    stdout = _BatchedStdout(raw)
+    for i in range(3):
+        await stdout.write(f'{{"id":{i}}}\n')
+        await stdout.flush()
+    await stdout.drain()
+
+    raw.write.assert_called_once_with(b'{"id":0}\n{"id":1}\n{"id":2}\n')
+    raw.flush.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batched_stdout_writes_off_the_io_executor():
+    import threading
+
+    from robin_stocks_mcp.server import _BatchedStdout
+
+    threads = []
+    raw = MagicMock()
+    raw.write.side_effect = lambda chunk: threads.append(
+        threading.current_thread().name
+    )
+    stdout = _BatchedStdout(raw)
+    await stdout.write("{}\n")
+    await stdout.flush()
+    await stdout.drain()
+    stdout.close()
+
+    assert len(threads) == 1 and threads[0].startswith("rh-stdout")
+
+
+@pytest.mark.asyncio
+async def test_batched_stdout_logs_write_failures(caplog):
+    from robin_stocks_mcp.server import _BatchedStdout
+
+    raw = MagicMock()
+    raw.write.side_effect = BrokenPipeError("closed")
+    stdout = _BatchedStdout(raw)
+    await stdout.write("{}\n")
+    await stdout.flush()
+    with pytest.raises(BrokenPipeError):
+        await stdout.drain()
+    stdout.close()
+
+    assert "Failed to write to stdout" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_warm_session_tolerates_missing_auth():
+    from robinhood_core.errors import AuthRequiredError
+
+    from robin_stocks_mcp.server import _warm_session
+
+    with patch("robin_stocks_mcp.server.client") as mock_client:
+        mock_client.ensure_session.side_effect = AuthRequiredError("Not logged in")
+
+        await _warm_session()
+
+        mock_client.ensure_session.assert_called_once_with()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_watchlist_quotes_primes_quote_cache():
+    import asyncio
+
+    from robinhood_core.models import Watchlist
+
+    from robin_stocks_mcp.server import _prefetch_watchlist_quotes
+
+    primed = asyncio.Event()
+    with (
+        patch("robin_stocks_mcp.server.watchlists_service") as mock_watchlists,
+        patch(
+            "robin_stocks_mcp.server.market_service", spec=MarketDataService
+        ) as mock_market,
+    ):
+        mock_watchlists.get_watchlists.return_value = [
+            Watchlist(id="1", name="Tech", symbols=["AAPL", "MSFT"]),
+            Watchlist(id="2", name="Mine", symbols=["MSFT", "TSLA"]),
+        ]
+        mock_market.get_current_price.return_value = ["quotes"]
+        mock_market.prime_quotes.side_effect = lambda quotes, ttl: primed.set()
+
+        ready = asyncio.get_running_loop().create_future()
+        ready.set_result(None)
+        task = asyncio.create_task(_prefetch_watchlist_quotes(ready))
+        await asyncio.wait_for(primed.wait(), timeout=1)
+        task.cancel()
+
+        mock_market.get_current_price.assert_called_once_with(
+            ["AAPL", "MSFT", "TSLA"]
+        )
+        mock_market.prime_quotes.assert_called_once_with(["quotes"], ttl=15.0)
+
+
+@pytest.mark.parametrize(
+    "value, expected", [("debug", "DEBUG"), ("verbose", "WARNING")]
+)
+def test_configure_logging_falls_back_on_unknown_level(monkeypatch, value, expected):
+    import logging
+
+    from robin_stocks_mcp.server import _configure_logging
+
+    monkeypatch.setenv("RH_LOG_LEVEL", value)
+    with patch("robin_stocks_mcp.server.logging.basicConfig") as basic_config:
+        _configure_logging()
+    basic_config.assert_called_once_with(level=getattr(logging, expected))